@@ -0,0 +1,25 @@
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from rally.common import cfg
+
+OPTS = {"openstack": [
+    cfg.FloatOpt("designate_zone_create_timeout",
+                 default=float(300.0),
+                 help="Time to wait for Designate zone to become ACTIVE"),
+    cfg.FloatOpt("designate_zone_create_poll_interval",
+                 default=float(2.0),
+                 help="Interval between checks when waiting for Designate "
+                      "zones to become ACTIVE")
+]}
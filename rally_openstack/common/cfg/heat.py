@@ -108,5 +108,11 @@ OPTS = {"openstack": [
                  default=1.0,
                  deprecated_group="benchmark",
                  help="Time interval (in sec) between checks when waiting for "
-                      "a stack to scale up or down.")
+                      "a stack to scale up or down."),
+    cfg.BoolOpt("heat_stack_wait_for_events",
+                default=False,
+                help="Wait for creation and update of heat stacks by "
+                     "following stack events instead of polling the whole "
+                     "stack. Durations of creation and update of separate "
+                     "resources are reported as a table then.")
 ]}
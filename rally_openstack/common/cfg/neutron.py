@@ -36,4 +36,8 @@ OPTS = {"openstack": [
                     "Linux bridge agent",
                 ],
                 help="Neutron L2 agent types to find hosts to bind"),
+    cfg.IntOpt("allow_ssh_context_resource_management_workers",
+               default=20,
+               help="How many concurrent threads to use for creating "
+                    "security groups in allow_ssh context"),
 ]}
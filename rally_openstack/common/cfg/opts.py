@@ -14,6 +14,7 @@
 #    under the License.
 
 from rally_openstack.common.cfg import cinder
+from rally_openstack.common.cfg import designate
 from rally_openstack.common.cfg import glance
 from rally_openstack.common.cfg import heat
 from rally_openstack.common.cfg import ironic
@@ -41,8 +42,8 @@ from rally_openstack.task.ui.charts import osprofilerchart
 def list_opts():
 
     opts = {}
-    for l_opts in (cinder.OPTS, heat.OPTS, ironic.OPTS, magnum.OPTS,
-                   manila.OPTS, mistral.OPTS,
+    for l_opts in (cinder.OPTS, designate.OPTS, heat.OPTS, ironic.OPTS,
+                   magnum.OPTS, manila.OPTS, mistral.OPTS,
                    nova.OPTS, osclients.OPTS, profiler.OPTS,
                    vm.OPTS, glance.OPTS, watcher.OPTS, tempest.OPTS,
                    keystone_roles.OPTS, keystone_users.OPTS, cleanup.OPTS,
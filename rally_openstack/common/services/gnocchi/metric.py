@@ -105,6 +105,26 @@ class GnocchiService(service.Service):
         return self._clients.gnocchi().metric.get_measures(
             metric=metric, aggregation=aggregation, refresh=refresh)
 
+    @atomic.action_timer("gnocchi.add_measures")
+    def add_measures(self, metric, measures):
+        """Add measurements to a metric.
+
+        :param metric: Metric ID
+        :param measures: List of dicts with timestamp and value keys
+        """
+        return self._clients.gnocchi().metric.add_measures(
+            metric=metric, measures=measures)
+
+    @atomic.action_timer("gnocchi.batch_metrics_measures")
+    def batch_metrics_measures(self, measures):
+        """Add measurements to several metrics with a single request.
+
+        :param measures: Dict which maps metric IDs to lists of dicts with
+                         timestamp and value keys
+        """
+        return self._clients.gnocchi().metric.batch_metrics_measures(
+            measures)
+
     @atomic.action_timer("gnocchi.create_metric")
     def create_metric(self, name, archive_policy_name=None, resource_id=None,
                       unit=None):
@@ -12,6 +12,9 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import hashlib
+import time
+
 from rally import exceptions
 from rally.task import atomic
 
@@ -56,6 +59,49 @@ class GlanceMixin(atomic.ActionTimerMixin):
             return self._get_client().images.data(image_id,
                                                   do_checksum=do_checksum)
 
+    def stream_image(self, image_id, sink=None, chunk_size=65536,
+                     hash_algorithm=None, do_checksum=True):
+        """Download data of an image and measure the transfer.
+
+        Unlike `download_image`, the whole body is consumed, so the atomic
+        action covers the transfer of image data, not only response headers.
+        The atomic action keeps the name of `download_image` one, so results
+        of scenarios are comparable with ones which used it.
+
+        :param image_id: ID of the image to download.
+        :param sink: path of a file to write data to. Data is discarded if
+            it is not specified.
+        :param chunk_size: size of buffer (in bytes) used for writing data
+            to the sink.
+        :param hash_algorithm: name of hashlib algorithm to calculate hash of
+            data on the fly with (e.g. "sha256").
+        :param do_checksum: Enable/disable checksum validation.
+        :returns: dict with amount of downloaded bytes, duration of the
+            transfer in seconds and hexdigest of data (if hash_algorithm is
+            specified)
+        """
+        hasher = hashlib.new(hash_algorithm) if hash_algorithm else None
+        size = 0
+        aname = "glance_v%s.download_image" % self.version
+        with atomic.ActionTimer(self, aname):
+            start = time.time()
+            body = self._get_client().images.data(image_id,
+                                                  do_checksum=do_checksum)
+            out = open(sink, "wb", buffering=chunk_size) if sink else None
+            try:
+                for chunk in body or []:
+                    size += len(chunk)
+                    if hasher:
+                        hasher.update(chunk)
+                    if out:
+                        out.write(chunk)
+            finally:
+                if out:
+                    out.close()
+            duration = time.time() - start
+        return {"bytes": size, "duration": duration,
+                "hash": hasher.hexdigest() if hasher else None}
+
 
 class UnifiedGlanceMixin(object):
 
@@ -91,3 +137,19 @@ class UnifiedGlanceMixin(object):
         :rtype: iterable containing image data or None
         """
         return self._impl.download_image(image_id, do_checksum=do_checksum)
+
+    def stream_image(self, image_id, sink=None, chunk_size=65536,
+                     hash_algorithm=None, do_checksum=True):
+        """Download data of an image and measure the transfer.
+
+        :param image_id: image id to look up
+        :param sink: path of a file to write data to
+        :param chunk_size: size of buffer for writing data to the sink
+        :param hash_algorithm: name of hashlib algorithm to hash data with
+        :param do_checksum: Enable/disable checksum validation
+        :returns: dict with "bytes", "duration" and "hash" keys
+        """
+        return self._impl.stream_image(image_id, sink=sink,
+                                       chunk_size=chunk_size,
+                                       hash_algorithm=hash_algorithm,
+                                       do_checksum=do_checksum)
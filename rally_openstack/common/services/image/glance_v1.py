@@ -46,15 +46,18 @@ class GlanceV1Service(service.Service, glance_common.GlanceMixin):
         :param min_ram: The min ram of created images
         :param properties: Dict of image properties
         """
-        image_location = os.path.expanduser(image_location)
         image_name = image_name or self.generate_random_name()
         kwargs = {}
 
         try:
-            if os.path.isfile(image_location):
-                kwargs["data"] = open(image_location, "rb")
+            if isinstance(image_location, dict):
+                kwargs["data"] = image.GeneratedData(**image_location)
             else:
-                kwargs["copy_from"] = image_location
+                image_location = os.path.expanduser(image_location)
+                if os.path.isfile(image_location):
+                    kwargs["data"] = open(image_location, "rb")
+                else:
+                    kwargs["copy_from"] = image_location
 
             image_obj = self._clients.glance("1").images.create(
                 name=image_name,
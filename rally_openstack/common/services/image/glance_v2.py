@@ -37,18 +37,23 @@ class GlanceV2Service(service.Service, glance_common.GlanceMixin):
         """Upload the data for an image.
 
         :param image_id: Image ID to upload data to.
-        :param image_location: Location of the data to upload to.
+        :param image_location: Location of the data to upload to. A dict
+            is treated as the specification of data which is generated in
+            memory (see image.GeneratedData).
         """
-        image_location = os.path.expanduser(image_location)
         image_data = None
         response = None
         try:
-            if os.path.isfile(image_location):
-                image_data = open(image_location, "rb")
+            if isinstance(image_location, dict):
+                image_data = image.GeneratedData(**image_location)
             else:
-                response = requests.get(image_location, stream=True,
-                                        verify=False)
-                image_data = response.raw
+                image_location = os.path.expanduser(image_location)
+                if os.path.isfile(image_location):
+                    image_data = open(image_location, "rb")
+                else:
+                    response = requests.get(image_location, stream=True,
+                                            verify=False)
+                    image_data = response.raw
             self._clients.glance("2").images.upload(image_id, image_data)
         finally:
             if image_data is not None:
@@ -151,6 +156,27 @@ class GlanceV2Service(service.Service, glance_common.GlanceMixin):
         self._clients.glance("2").images.update(image_id,
                                                 visibility=visibility)
 
+    @atomic.action_timer("glance_v2.add_member")
+    def add_member(self, image_id, member_id):
+        """Share an image with a project.
+
+        :param image_id: ID of image to share
+        :param member_id: ID of project to share the image with
+        """
+        return self._clients.glance("2").image_members.create(
+            image_id, member_id)
+
+    @atomic.action_timer("glance_v2.update_member")
+    def update_member(self, image_id, member_id, member_status="accepted"):
+        """Update the status of an image membership.
+
+        :param image_id: ID of shared image
+        :param member_id: ID of project the image is shared with
+        :param member_status: New status of the membership
+        """
+        return self._clients.glance("2").image_members.update(
+            image_id, member_id, member_status)
+
     @atomic.action_timer("glance_v2.deactivate_image")
     def deactivate_image(self, image_id):
         """deactivate image."""
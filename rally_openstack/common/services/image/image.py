@@ -11,6 +11,8 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import random
+
 from rally.common import cfg
 from rally import exceptions
 from rally.task import service
@@ -36,6 +38,82 @@ class RemovePropsException(exceptions.RallyException):
     error_code = 560
 
 
+class GeneratedData(object):
+    """File-like object which produces image data in memory.
+
+    Data is generated chunk by chunk while it is read, so uploading a big
+    image requires neither a local file nor a remote one.
+
+    :param size: number of bytes to produce
+    :param pattern: string which is repeated to fill the data
+    :param randomize: produce pseudo-random data instead of the pattern
+    :param seed: seed of the pseudo-random generator
+    """
+
+    CHUNK_SIZE = 65536
+    SCHEMA = {
+        "type": "object",
+        "description": "Specification of data which is generated in memory "
+                       "instead of reading a local file or URL.",
+        "properties": {
+            "size": {"type": "integer", "minimum": 1,
+                     "description": "Number of bytes to generate."},
+            "pattern": {"type": "string",
+                        "description": "Non-empty string which is repeated "
+                                       "to fill the data."},
+            "randomize": {"type": "boolean",
+                          "description": "Generate pseudo-random data "
+                                         "instead of the pattern."},
+            "seed": {"type": "integer",
+                     "description": "Seed of the pseudo-random generator."}
+        },
+        "required": ["size"],
+        "additionalProperties": False
+    }
+
+    def __init__(self, size, pattern="rally", randomize=False, seed=None):
+        self.size = size
+        self._remaining = size
+        self._buffer = b""
+        self._random = None
+        if randomize:
+            self._random = random.Random(seed)
+        else:
+            pattern = (pattern or "rally").encode("utf-8")
+            # a whole number of patterns, so blocks can be simply repeated
+            self._block = pattern * (self.CHUNK_SIZE // len(pattern) + 1)
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        while True:
+            chunk = self.read(self.CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+
+    def _next_block(self):
+        if self._random is not None:
+            return self._random.randbytes(self.CHUNK_SIZE)
+        return self._block
+
+    def read(self, amt=None):
+        # NOTE: unlike files, data is not read up to the end at once to not
+        #   keep the whole image in memory
+        if amt is None or amt < 0:
+            amt = self.CHUNK_SIZE
+        amt = min(amt, self._remaining)
+        while len(self._buffer) < amt:
+            self._buffer += self._next_block()
+        chunk, self._buffer = self._buffer[:amt], self._buffer[amt:]
+        self._remaining -= amt
+        return chunk
+
+    def close(self):
+        self._remaining = 0
+
+
 class Image(service.UnifiedService):
     @classmethod
     def is_applicable(cls, clients):
@@ -131,3 +209,25 @@ class Image(service.UnifiedService):
         :rtype: iterable containing image data or None
         """
         return self._impl.download_image(image, do_checksum=do_checksum)
+
+    @service.should_be_overridden
+    def stream_image(self, image, sink=None, chunk_size=65536,
+                     hash_algorithm=None, do_checksum=True):
+        """Download data of an image and measure the transfer.
+
+        :param image: image object or id to look up
+        :param sink: path of a file to write data to. Data is discarded if
+            it is not specified.
+        :param chunk_size: size of buffer (in bytes) for writing data to
+            the sink
+        :param hash_algorithm: name of hashlib algorithm to hash data with
+            on the fly
+        :param do_checksum: Enable/disable checksum validation
+        :returns: dict with amount of downloaded bytes ("bytes"), duration
+            of the transfer in seconds ("duration") and hexdigest of data
+            ("hash")
+        """
+        return self._impl.stream_image(image, sink=sink,
+                                       chunk_size=chunk_size,
+                                       hash_algorithm=hash_algorithm,
+                                       do_checksum=do_checksum)
@@ -72,6 +72,8 @@ class Octavia(service.Service):
             "vip_subnet_id": subnet_id,
             "vip_qos_policy_id": vip_qos_policy_id,
         }
+        if flavor_id:
+            args["flavor_id"] = flavor_id
         lb = self._clients.octavia().load_balancer_create(
             json={"loadbalancer": args})
         return lb["loadbalancer"]
@@ -363,6 +365,26 @@ class Octavia(service.Service):
         """
         return self._clients.octavia().member_set(pool_id, member_id, **kwargs)
 
+    @atomic.action_timer("octavia.member_batch_update")
+    def member_batch_update(self, pool_id, members):
+        """Replace all members of a pool with a single request
+
+        Every change of a member puts the load balancer into PENDING_UPDATE
+        status, so adding members one by one requires waiting for the load
+        balancer between the calls. A batch update is processed at once.
+
+        :param pool_id:
+            ID of the pool
+        :param members:
+            A list of dicts with settings of members (members which are not
+            in the list are removed from the pool)
+        :return:
+            Response from the API
+        """
+        return self._clients.octavia().create(
+            "/lbaas/pools/%s/members" % pool_id, method="PUT",
+            json={"members": members})
+
     @atomic.action_timer("octavia.l7policy_list")
     def l7policy_list(self, **kwargs):
         """List all l7policies
@@ -258,6 +258,25 @@ class NeutronService(service.Service):
         resp = self.client.create_network({"network": body})
         return resp["network"]
 
+    @atomic.action_timer("neutron.create_networks")
+    def create_networks(self, count, **kwargs):
+        """Create several neutron networks with a single request.
+
+        :param count: Number of networks to create
+        :param kwargs: Arguments of networks, the same for all of them. See
+            `create_network` method for the supported keys (name is
+            restricted param).
+        :returns: list of neutron network dicts
+        """
+        if "project_id" in kwargs:
+            kwargs["tenant_id"] = kwargs.pop("project_id")
+        for api_name, name in _NETWORK_ARGS_MAP.items():
+            if name in kwargs:
+                kwargs[api_name] = kwargs.pop(name)
+        body = [_clean_dict(name=self.generate_random_name(), **kwargs)
+                for i in range(count)]
+        return self.client.create_network({"networks": body})["networks"]
+
     @atomic.action_timer("neutron.show_network")
     def get_network(self, network_id, fields=_NONE):
         """Get network by ID
@@ -503,6 +522,45 @@ class NeutronService(service.Service):
                                          subnet_id=subnet["id"])
         return subnet
 
+    @atomic.action_timer("neutron.create_subnets")
+    def create_subnets(self, network_ids, ip_version=_NONE, start_cidr=_NONE,
+                       dns_nameservers=_NONE, **kwargs):
+        """Create several neutron subnets with a single request.
+
+        A subnet is created for every item of network_ids, so several
+        subnets of the same network can be created too. CIDRs of subnets
+        are generated.
+
+        :param network_ids: IDs of networks to which the subnets belong
+        :param ip_version: The IP protocol version. Value is 4 or 6.
+        :param start_cidr: Start value for generated CIDRs.
+        :param dns_nameservers: List of dns name servers associated with the
+            subnets. Default is a list of Google DNS
+        :param kwargs: Other arguments of subnets, the same for all of them.
+            See `create_subnet` method for the supported keys (name, cidr
+            and router_id are restricted params).
+        :returns: list of neutron subnet dicts
+        """
+        if "project_id" in kwargs:
+            kwargs["tenant_id"] = kwargs.pop("project_id")
+        body = []
+        for network_id in network_ids:
+            version, cidr = net_utils.generate_cidr(
+                ip_version=ip_version, start_cidr=(start_cidr or None))
+            nameservers = dns_nameservers
+            if nameservers == _NONE:
+                nameservers = (self.IPv4_DEFAULT_DNS_NAMESERVERS
+                               if version == 4
+                               else self.IPv6_DEFAULT_DNS_NAMESERVERS)
+            body.append(_clean_dict(
+                name=self.generate_random_name(),
+                network_id=network_id,
+                ip_version=version,
+                cidr=cidr,
+                dns_nameservers=nameservers,
+                **kwargs))
+        return self.client.create_subnet({"subnets": body})["subnets"]
+
     @atomic.action_timer("neutron.show_subnet")
     def get_subnet(self, subnet_id):
         """Get subnet
@@ -817,6 +875,21 @@ class NeutronService(service.Service):
         )
         return self.client.create_port({"port": body})["port"]
 
+    @atomic.action_timer("neutron.create_ports")
+    def create_ports(self, network_id, count, **kwargs):
+        """Create several neutron ports with a single request.
+
+        :param network_id: neutron network ID
+        :param count: Number of ports to create
+        :param kwargs: other optional neutron port creation params, the same
+            for all ports (name is restricted param)
+        :returns: list of neutron port dicts
+        """
+        body = [_clean_dict(name=self.generate_random_name(),
+                            network_id=network_id, **kwargs)
+                for i in range(count)]
+        return self.client.create_port({"ports": body})["ports"]
+
     @atomic.action_timer("neutron.show_port")
     def get_port(self, port_id, fields=_NONE):
         """Get port details
@@ -1275,6 +1348,20 @@ class NeutronService(service.Service):
         return self.client.create_security_group_rule(
             {"security_group_rule": body})["security_group_rule"]
 
+    @atomic.action_timer("neutron.create_security_group_rules")
+    def create_security_group_rules(self, security_group_id, rules):
+        """Create several security group rules with a single request.
+
+        :param security_group_id: The security group ID to associate with
+            the security group rules.
+        :param rules: List of dicts with arguments of rules. See
+            `create_security_group_rule` method for the supported keys.
+        """
+        body = [dict(rule, security_group_id=security_group_id)
+                for rule in rules]
+        return self.client.create_security_group_rule(
+            {"security_group_rules": body})["security_group_rules"]
+
     @atomic.action_timer("neutron.show_security_group_rule")
     def get_security_group_rule(self, security_group_rule_id, verbose=_NONE,
                                 fields=_NONE):
@@ -44,7 +44,7 @@ class BlockStorage(service.UnifiedService):
                       volume_type=None, user_id=None,
                       project_id=None, availability_zone=None,
                       metadata=None, imageRef=None, scheduler_hints=None,
-                      source_replica=None, backup_id=None):
+                      source_replica=None, backup_id=None, wait=True):
         """Creates a volume.
 
         :param size: Size of volume in GB
@@ -64,6 +64,7 @@ class BlockStorage(service.UnifiedService):
         :param scheduler_hints: (optional extension) arbitrary key-value pairs
                             specified by the client to help boot an instance
         :param backup_id: ID of the backup
+        :param wait: wait for the volume to become available
 
         :returns: Return a new volume.
         """
@@ -77,7 +78,7 @@ class BlockStorage(service.UnifiedService):
             user_id=user_id, project_id=project_id,
             availability_zone=availability_zone, metadata=metadata,
             imageRef=imageRef, scheduler_hints=scheduler_hints,
-            backup_id=backup_id)
+            backup_id=backup_id, wait=wait)
 
     @service.should_be_overridden
     def list_volumes(self, detailed=True, search_opts=None, marker=None,
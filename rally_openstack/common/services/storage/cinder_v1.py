@@ -33,7 +33,7 @@ class CinderV1Service(service.Service, cinder_common.CinderMixin):
                       display_name=None, display_description=None,
                       volume_type=None, user_id=None,
                       project_id=None, availability_zone=None,
-                      metadata=None, imageRef=None):
+                      metadata=None, imageRef=None, wait=True):
         """Creates a volume.
 
         :param size: Size of volume in GB
@@ -46,6 +46,7 @@ class CinderV1Service(service.Service, cinder_common.CinderMixin):
         :param availability_zone: Availability Zone to use
         :param metadata: Optional metadata to set on volume creation
         :param imageRef: reference to an image stored in glance
+        :param wait: wait for the volume to become available
 
         :returns: Return a new volume.
         """
@@ -66,6 +67,9 @@ class CinderV1Service(service.Service, cinder_common.CinderMixin):
             imageRef=imageRef
         )
 
+        if not wait:
+            return volume
+
         # NOTE(msdubov): It is reasonable to wait 5 secs before starting to
         #                check whether the volume is ready => less API calls.
         rutils.interruptable_sleep(
@@ -184,7 +188,7 @@ class UnifiedCinderV1Service(cinder_common.UnifiedCinderMixin,
                       volume_type=None, user_id=None,
                       project_id=None, availability_zone=None,
                       metadata=None, imageRef=None, scheduler_hints=None,
-                      backup_id=None):
+                      backup_id=None, wait=True):
         """Creates a volume.
 
         :param size: Size of volume in GB
@@ -203,6 +207,7 @@ class UnifiedCinderV1Service(cinder_common.UnifiedCinderMixin,
         :param scheduler_hints: (optional extension) arbitrary key-value pairs
                             specified by the client to help boot an instance
         :param backup_id: ID of the backup(IGNORED)
+        :param wait: wait for the volume to become available
 
         :returns: Return a new volume.
         """
@@ -212,7 +217,7 @@ class UnifiedCinderV1Service(cinder_common.UnifiedCinderMixin,
             display_description=description,
             volume_type=volume_type, user_id=user_id,
             project_id=project_id, availability_zone=availability_zone,
-            metadata=metadata, imageRef=imageRef))
+            metadata=metadata, imageRef=imageRef, wait=wait))
 
     def list_volumes(self, detailed=True, search_opts=None, marker=None,
                      limit=None, sort=None):
@@ -33,7 +33,7 @@ class CinderV2Service(service.Service, cinder_common.CinderMixin):
                       snapshot_id=None, source_volid=None, name=None,
                       description=None, volume_type=None,
                       availability_zone=None, metadata=None, imageRef=None,
-                      scheduler_hints=None):
+                      scheduler_hints=None, wait=True):
         """Creates a volume.
 
         :param size: Size of volume in GB
@@ -48,6 +48,7 @@ class CinderV2Service(service.Service, cinder_common.CinderMixin):
         :param source_volid: ID of source volume to clone from
         :param scheduler_hints: (optional extension) arbitrary key-value pairs
                             specified by the client to help boot an instance
+        :param wait: wait for the volume to become available
 
         :returns: Return a new volume.
         """
@@ -67,6 +68,9 @@ class CinderV2Service(service.Service, cinder_common.CinderMixin):
         volume = (self._get_client()
                   .volumes.create(size, **kwargs))
 
+        if not wait:
+            return volume
+
         # NOTE(msdubov): It is reasonable to wait 5 secs before starting to
         #                check whether the volume is ready => less API calls.
         rutils.interruptable_sleep(
@@ -237,7 +241,7 @@ class UnifiedCinderV2Service(cinder_common.UnifiedCinderMixin,
                       volume_type=None, user_id=None,
                       project_id=None, availability_zone=None,
                       metadata=None, imageRef=None, scheduler_hints=None,
-                      backup_id=None):
+                      backup_id=None, wait=True):
         """Creates a volume.
 
         :param size: Size of volume in GB
@@ -256,6 +260,7 @@ class UnifiedCinderV2Service(cinder_common.UnifiedCinderMixin,
         :param scheduler_hints: (optional extension) arbitrary key-value pairs
                             specified by the client to help boot an instance
         :param backup_id: ID of the backup(IGNORED)
+        :param wait: wait for the volume to become available
 
         :returns: Return a new volume.
         """
@@ -265,7 +270,7 @@ class UnifiedCinderV2Service(cinder_common.UnifiedCinderMixin,
             source_volid=source_volid, name=name,
             description=description, volume_type=volume_type,
             availability_zone=availability_zone, metadata=metadata,
-            imageRef=imageRef, scheduler_hints=scheduler_hints))
+            imageRef=imageRef, scheduler_hints=scheduler_hints, wait=wait))
 
     def list_volumes(self, detailed=True, search_opts=None, marker=None,
                      limit=None, sort=None):
@@ -33,7 +33,7 @@ class CinderV3Service(service.Service, cinder_common.CinderMixin):
                       snapshot_id=None, source_volid=None, name=None,
                       description=None, volume_type=None,
                       availability_zone=None, metadata=None, imageRef=None,
-                      scheduler_hints=None, backup_id=None):
+                      scheduler_hints=None, backup_id=None, wait=True):
         """Creates a volume.
 
         :param size: Size of volume in GB
@@ -49,6 +49,7 @@ class CinderV3Service(service.Service, cinder_common.CinderMixin):
         :param scheduler_hints: (optional extension) arbitrary key-value pairs
                             specified by the client to help boot an instance
         :param backup_id: ID of the backup
+        :param wait: wait for the volume to become available
 
         :returns: Return a new volume.
         """
@@ -69,6 +70,9 @@ class CinderV3Service(service.Service, cinder_common.CinderMixin):
         volume = (self._get_client()
                   .volumes.create(size, **kwargs))
 
+        if not wait:
+            return volume
+
         # NOTE(msdubov): It is reasonable to wait 5 secs before starting to
         #                check whether the volume is ready => less API calls.
         rutils.interruptable_sleep(
@@ -241,7 +245,7 @@ class UnifiedCinderV3Service(cinder_common.UnifiedCinderMixin,
                       volume_type=None, user_id=None,
                       project_id=None, availability_zone=None,
                       metadata=None, imageRef=None, scheduler_hints=None,
-                      source_replica=None, backup_id=None):
+                      source_replica=None, backup_id=None, wait=True):
         """Creates a volume.
 
         :param size: Size of volume in GB
@@ -260,6 +264,7 @@ class UnifiedCinderV3Service(cinder_common.UnifiedCinderMixin,
         :param scheduler_hints: (optional extension) arbitrary key-value pairs
                             specified by the client to help boot an instance
         :param backup_id: ID of the backup
+        :param wait: wait for the volume to become available
 
         :returns: Return a new volume.
         """
@@ -270,7 +275,7 @@ class UnifiedCinderV3Service(cinder_common.UnifiedCinderMixin,
             description=description, volume_type=volume_type,
             availability_zone=availability_zone, metadata=metadata,
             imageRef=imageRef, scheduler_hints=scheduler_hints,
-            backup_id=backup_id))
+            backup_id=backup_id, wait=wait))
 
     def list_volumes(self, detailed=True, search_opts=None, marker=None,
                      limit=None, sort=None):
@@ -12,11 +12,18 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+from rally.common import cfg
+from rally.common import utils as rutils
+
 from rally_openstack.common import consts
 from rally_openstack.common import osclients
 from rally_openstack.common.services.storage import block
 from rally_openstack.task.cleanup import manager as resource_manager
 from rally_openstack.task import context
+from rally_openstack.task import utils as task_utils
+
+
+CONF = cfg.CONF
 
 
 @context.configure(name="volumes", platform="openstack", order=420)
@@ -42,6 +49,12 @@ class VolumeGenerator(context.OpenStackContext):
             "volumes_per_tenant": {
                 "type": "integer",
                 "minimum": 1
+            },
+            "resource_management_workers": {
+                "type": "integer",
+                "minimum": 1,
+                "description": "The number of tenants to create volumes "
+                               "for concurrently."
             }
         },
         "required": ["size"],
@@ -49,26 +62,46 @@ class VolumeGenerator(context.OpenStackContext):
     }
 
     DEFAULT_CONFIG = {
-        "volumes_per_tenant": 1
+        "volumes_per_tenant": 1,
+        "resource_management_workers": 20
     }
 
-    def setup(self):
-        size = self.config["size"]
-        volume_type = self.config.get("type", None)
-        volumes_per_tenant = self.config["volumes_per_tenant"]
+    def _create_volumes(self, args, atomic_actions):
+        """Create all the volumes of the tenant and wait for them at once."""
+        user, tenant_id = args
+        cinder_service = block.BlockStorage(
+            osclients.Clients(user["credential"]),
+            name_generator=self.generate_random_name,
+            atomic_inst=atomic_actions)
+        volumes = [
+            cinder_service.create_volume(
+                self.config["size"], volume_type=self.config.get("type"),
+                wait=False)
+            for i in range(self.config["volumes_per_tenant"])]
 
-        for user, tenant_id in self._iterate_per_tenants():
-            self.context["tenants"][tenant_id].setdefault("volumes", [])
-            clients = osclients.Clients(user["credential"])
-            cinder_service = block.BlockStorage(
-                clients,
-                name_generator=self.generate_random_name,
-                atomic_inst=self.atomic_actions())
-            for i in range(volumes_per_tenant):
-                vol = cinder_service.create_volume(size,
-                                                   volume_type=volume_type)
-                self.context["tenants"][tenant_id]["volumes"].append(
-                    vol._as_dict())
+        # NOTE: all volumes of the tenant are provisioned by the backend in
+        #   parallel, so they are waited for with one list request per check
+        #   instead of polling every volume separately.
+        rutils.interruptable_sleep(
+            CONF.openstack.cinder_volume_create_prepoll_delay)
+        volumes = task_utils.wait_for_statuses(
+            volumes,
+            lambda: cinder_service.list_volumes(
+                detailed=True, search_opts={"project_id": tenant_id}),
+            ready_statuses=["available"],
+            timeout=CONF.openstack.cinder_volume_create_timeout,
+            check_interval=CONF.openstack.cinder_volume_create_poll_interval)
+        self.context["tenants"][tenant_id]["volumes"] = [
+            volume._as_dict() for volume in volumes]
+
+    def setup(self):
+        failures = task_utils.run_concurrently(
+            self._create_volumes, self._iterate_per_tenants(),
+            workers=self.config["resource_management_workers"],
+            atomic_inst=self.atomic_actions())[1]
+        task_utils.raise_setup_failures(
+            self.get_name(), failures,
+            "Failed to create volumes for %d tenant(s)")
 
     def cleanup(self):
         resource_manager.cleanup(
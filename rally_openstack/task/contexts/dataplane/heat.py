@@ -15,7 +15,6 @@
 
 import pkgutil
 
-from rally.common import utils as rutils
 from rally.common import validation
 from rally import exceptions
 
@@ -24,6 +23,7 @@ from rally_openstack.common import osclients
 from rally_openstack.task.cleanup import manager as resource_manager
 from rally_openstack.task import context
 from rally_openstack.task.scenarios.heat import utils as heat_utils
+from rally_openstack.task import utils as task_utils
 
 
 def get_data(filename_or_resource):
@@ -87,18 +87,24 @@ class HeatDataplane(context.OpenStackContext):
                 "type": "object",
                 "additionalProperties": True
             },
+            "resource_management_workers": {
+                "type": "integer",
+                "minimum": 1,
+                "description": "The number of tenants to create stacks for "
+                               "concurrently."
+            },
         },
         "additionalProperties": False
     }
 
     DEFAULT_CONFIG = {
         "stacks_per_tenant": 1,
+        "resource_management_workers": 20,
     }
 
-    def _get_context_parameter(self, user, tenant_id, path):
-        value: list | dict = {
-            "user": user, "tenant": self.context["tenants"][tenant_id]
-        }
+    @staticmethod
+    def _compile_path(path):
+        keys = []
         for key in path.split("."):
             try:
                 # try to cast string to int in order to support integer keys
@@ -106,9 +112,24 @@ class HeatDataplane(context.OpenStackContext):
                 key = int(key)
             except ValueError:
                 pass
+            keys.append(key)
+        return tuple(keys)
+
+    def _get_context_parameter(self, user, tenant_id, path):
+        """Get a value from the context by the path.
+
+        :param path: a dot-separated path or a tuple of keys returned by
+            `_compile_path`
+        """
+        keys = path if isinstance(path, tuple) else self._compile_path(path)
+        value: list | dict = {
+            "user": user, "tenant": self.context["tenants"][tenant_id]
+        }
+        for key in keys:
             try:
                 value = value[key]
             except KeyError:
+                path = ".".join(str(k) for k in keys)
                 raise exceptions.RallyException(
                     f"There is no key {path} in context")
         return value
@@ -118,36 +139,64 @@ class HeatDataplane(context.OpenStackContext):
         networks = nc.list_networks(**{"router:external": True})["networks"]
         return networks[0]["id"]
 
+    def _load_data(self):
+        """Load the template and files only once for all tenants."""
+        cache = {}
+
+        def load(filename_or_resource):
+            key = str(filename_or_resource)
+            if key not in cache:
+                cache[key] = get_data(filename_or_resource)
+            return cache[key]
+
+        template = load(self.config["template"])
+        files = dict((key, load(filename))
+                     for key, filename in self.config.get("files", {}).items())
+        return template, files
+
+    def _setup_tenant(self, user, tenant_id, template, files, parameters,
+                      context_parameters):
+        parameters = dict(parameters)
+        for name, path in context_parameters.items():
+            parameters[name] = self._get_context_parameter(user, tenant_id,
+                                                           path)
+        if "router_id" not in parameters:
+            networks = self.context["tenants"][tenant_id]["networks"]
+            parameters["router_id"] = networks[0]["router_id"]
+        if "key_name" not in parameters:
+            parameters["key_name"] = user["keypair"]["name"]
+        heat_scenario = heat_utils.HeatScenario(
+            {"user": user, "task": self.context["task"],
+             "owner_id": self.context["owner_id"]})
+        tenant_data = self.context["tenants"][tenant_id]
+        tenant_data["stack_dataplane"] = []
+        for i in range(self.config["stacks_per_tenant"]):
+            stack = heat_scenario._create_stack(template, files=files,
+                                                parameters=parameters)
+            tenant_data["stack_dataplane"].append([stack.id, template,
+                                                   files, parameters])
+
     def setup(self):
-        template = get_data(self.config["template"])
-        files = {}
-        for key, filename in self.config.get("files", {}).items():
-            files[key] = get_data(filename)
-        parameters = self.config.get("parameters", rutils.LockedDict())
-        with parameters.unlocked():
-            if "network_id" not in parameters:
-                parameters["network_id"] = self._get_public_network_id()
-            for user, tenant_id in self._iterate_per_tenants():
-                for name, path in self.config.get("context_parameters",
-                                                  {}).items():
-                    parameters[name] = self._get_context_parameter(user,
-                                                                   tenant_id,
-                                                                   path)
-                if "router_id" not in parameters:
-                    networks = self.context["tenants"][tenant_id]["networks"]
-                    parameters["router_id"] = networks[0]["router_id"]
-                if "key_name" not in parameters:
-                    parameters["key_name"] = user["keypair"]["name"]
-                heat_scenario = heat_utils.HeatScenario(
-                    {"user": user, "task": self.context["task"],
-                     "owner_id": self.context["owner_id"]})
-                self.context["tenants"][tenant_id]["stack_dataplane"] = []
-                for i in range(self.config["stacks_per_tenant"]):
-                    stack = heat_scenario._create_stack(template, files=files,
-                                                        parameters=parameters)
-                    tenant_data = self.context["tenants"][tenant_id]
-                    tenant_data["stack_dataplane"].append([stack.id, template,
-                                                           files, parameters])
+        template, files = self._load_data()
+        parameters = dict(self.config.get("parameters", {}))
+        if "network_id" not in parameters:
+            parameters["network_id"] = self._get_public_network_id()
+        context_parameters = dict(
+            (name, self._compile_path(path))
+            for name, path in self.config.get("context_parameters",
+                                              {}).items())
+
+        def setup_tenant(args):
+            user, tenant_id = args
+            self._setup_tenant(user, tenant_id, template, files, parameters,
+                               context_parameters)
+
+        results, failures = task_utils.run_concurrently(
+            setup_tenant, self._iterate_per_tenants(),
+            workers=self.config["resource_management_workers"])
+        task_utils.raise_setup_failures(
+            self.get_name(), failures,
+            "Failed to create stacks for %d tenant(s)")
 
     def cleanup(self):
         resource_manager.cleanup(names=["heat.stacks"],
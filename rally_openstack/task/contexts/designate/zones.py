@@ -12,6 +12,7 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+from rally.common import cfg
 from rally.common import validation
 
 from rally_openstack.common import consts
@@ -19,6 +20,20 @@ from rally_openstack.task.cleanup import manager as resource_manager
 from rally_openstack.task import context
 from rally_openstack.task.scenarios.designate import utils
 from rally_openstack.task.scenarios.neutron import utils as neutron_utils
+from rally_openstack.task import utils as task_utils
+
+
+CONF = cfg.CONF
+
+
+def _list_zones(designate):
+    # NOTE: zones list is paginated by Designate API, so all pages are fetched
+    zones = []
+    page = designate.zones.list()
+    while page:
+        zones.extend(page)
+        page = designate.zones.list(marker=page[-1]["id"])
+    return zones
 
 
 @validation.add("required_platform", platform="openstack", users=True)
@@ -37,6 +52,12 @@ class ZoneGenerator(context.OpenStackContext):
             "set_zone_in_network": {
                 "type": "boolean",
                 "description": "Update network with created DNS zone."
+            },
+            "resource_management_workers": {
+                "type": "integer",
+                "minimum": 1,
+                "description": "The number of tenants to create zones for "
+                               "concurrently."
             }
         },
         "additionalProperties": False
@@ -44,35 +65,48 @@ class ZoneGenerator(context.OpenStackContext):
 
     DEFAULT_CONFIG = {
         "zones_per_tenant": 1,
-        "set_zone_in_network": False
+        "set_zone_in_network": False,
+        "resource_management_workers": 20
     }
 
-    def setup(self):
-        for user, tenant_id in self._iterate_per_tenants(
-                self.context["users"]):
-            self.context["tenants"][tenant_id].setdefault("zones", [])
-            designate_util = utils.DesignateScenario(
-                {"user": user,
-                 "task": self.context["task"],
-                 "owner_id": self.context["owner_id"]})
-            for i in range(self.config["zones_per_tenant"]):
-                zone = designate_util._create_zone()
-                self.context["tenants"][tenant_id]["zones"].append(zone)
+    def _setup_tenant(self, user, tenant_id):
+        designate_util = utils.DesignateScenario(
+            {"user": user,
+             "task": self.context["task"],
+             "owner_id": self.context["owner_id"]})
+        zones = [designate_util._create_zone()
+                 for i in range(self.config["zones_per_tenant"])]
+        # NOTE: zones are propagated to DNS backends asynchronously, so all
+        #   of them are created first and then waited for together.
+        designate = designate_util.clients("designate", version="2")
+        zones = task_utils.wait_for_statuses(
+            zones, lambda: _list_zones(designate),
+            ready_statuses=["ACTIVE"],
+            timeout=CONF.openstack.designate_zone_create_timeout,
+            check_interval=CONF.openstack.designate_zone_create_poll_interval)
+        tenant = self.context["tenants"][tenant_id]
+        tenant.setdefault("zones", []).extend(zones)
+
         if self.config["set_zone_in_network"]:
-            for user, tenant_id in self._iterate_per_tenants(
-                    self.context["users"]):
-                tenant = self.context["tenants"][tenant_id]
+            network_update_args = {
+                "dns_domain": tenant["zones"][0]["name"]
+            }
+            body = {"network": network_update_args}
+            scenario = neutron_utils.NeutronScenario(
+                context={"user": user, "task": self.context["task"],
+                         "owner_id": self.context["owner_id"]}
+            )
+            scenario.clients("neutron").update_network(
+                tenant["networks"][0]["id"], body)
 
-                network_update_args = {
-                    "dns_domain": tenant["zones"][0]["name"]
-                }
-                body = {"network": network_update_args}
-                scenario = neutron_utils.NeutronScenario(
-                    context={"user": user, "task": self.context["task"],
-                             "owner_id": self.context["owner_id"]}
-                )
-                scenario.clients("neutron").update_network(
-                    tenant["networks"][0]["id"], body)
+    def setup(self):
+        results, failures = task_utils.run_concurrently(
+            lambda args: self._setup_tenant(*args),
+            self._iterate_per_tenants(self.context["users"]),
+            workers=self.config["resource_management_workers"])
+        task_utils.raise_setup_failures(
+            self.get_name(), failures,
+            "Failed to create zones for %d tenant(s)")
 
     def cleanup(self):
         resource_manager.cleanup(names=["designate.zones"],
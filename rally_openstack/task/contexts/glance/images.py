@@ -18,12 +18,15 @@ from rally.common import cfg
 from rally.common import logging
 from rally.common import utils as rutils
 from rally.common import validation
+from rally import exceptions
 
 from rally_openstack.common import consts
 from rally_openstack.common import osclients
+from rally_openstack.common.services.image import glance_v2
 from rally_openstack.common.services.image import image
 from rally_openstack.task.cleanup import manager as resource_manager
 from rally_openstack.task import context
+from rally_openstack.task import utils as task_utils
 
 
 CONF = cfg.CONF
@@ -41,8 +44,11 @@ class ImageGenerator(context.OpenStackContext):
         "$schema": consts.JSON_SCHEMA,
         "properties": {
             "image_url": {
-                "type": "string",
-                "description": "Location of the source to create image from."
+                "description": "Location of the source to create image from "
+                               "or specification of data to generate.",
+                "anyOf": [{"type": "string",
+                           "description": "Path or URL of an image file."},
+                          image.GeneratedData.SCHEMA]
             },
             "disk_format": {
                 "description": "The format of the disk.",
@@ -81,6 +87,23 @@ class ImageGenerator(context.OpenStackContext):
                 "type": "integer",
                 "minimum": 1
             },
+            "share_images": {
+                "description": "Upload `images_per_tenant` images only once "
+                               "by admin user and share them with all the "
+                               "tenants instead of uploading images to "
+                               "every tenant. 'shared' images (the default "
+                               "visibility in this mode, Glance V2 only) are "
+                               "shared by adding every tenant as a member, "
+                               "'public' and 'community' ones are available "
+                               "for all tenants as is.",
+                "type": "boolean"
+            },
+            "resource_management_workers": {
+                "description": "The number of tenants to share images with "
+                               "concurrently.",
+                "type": "integer",
+                "minimum": 1
+            },
             "image_args": {
                 "description": "This param is deprecated since Rally-0.10.0, "
                                "specify exact arguments in a root section of "
@@ -115,7 +138,8 @@ class ImageGenerator(context.OpenStackContext):
         "additionalProperties": False
     }
 
-    DEFAULT_CONFIG = {"images_per_tenant": 1}
+    DEFAULT_CONFIG = {"images_per_tenant": 1,
+                      "resource_management_workers": 20}
 
     config: dict
 
@@ -165,6 +189,21 @@ class ImageGenerator(context.OpenStackContext):
         if "image_name" in self.config and images_per_tenant == 1:
             image_name = self.config["image_name"]
 
+        create_args = {"image_name": image_name,
+                       "container_format": container_format,
+                       "image_location": image_url,
+                       "disk_format": disk_format,
+                       "visibility": visibility,
+                       "min_disk": min_disk,
+                       "min_ram": min_ram}
+
+        if self.config.get("share_images"):
+            if visibility == "private":
+                # NOTE: private images are not visible for other tenants
+                create_args["visibility"] = "shared"
+            self._setup_shared_images(images_per_tenant, create_args)
+            return
+
         for user, tenant_id in self._iterate_per_tenants():
             current_images = []
             clients = osclients.Clients(user["credential"])
@@ -172,19 +211,73 @@ class ImageGenerator(context.OpenStackContext):
                 clients, name_generator=self.generate_random_name)
 
             for i in range(images_per_tenant):
-                image_obj = image_service.create_image(
-                    image_name=image_name,
-                    container_format=container_format,
-                    image_location=image_url,
-                    disk_format=disk_format,
-                    visibility=visibility,
-                    min_disk=min_disk,
-                    min_ram=min_ram)
+                image_obj = image_service.create_image(**create_args)
                 current_images.append(image_obj.id)
 
             self.context["tenants"][tenant_id]["images"] = current_images
 
+    def _setup_shared_images(self, images_number, create_args):
+        """Upload images once by admin and make them available to tenants."""
+        if not self.context.get("admin"):
+            raise exceptions.ContextSetupFailure(
+                ctx_name=self.get_name(),
+                msg="Admin user is required to share images with tenants.")
+
+        admin_clients = osclients.Clients(
+            self.context["admin"]["credential"])
+        if (create_args["visibility"] == "shared"
+                and admin_clients.glance.choose_version() != "2"):
+            raise exceptions.ContextSetupFailure(
+                ctx_name=self.get_name(),
+                msg="Images with 'shared' visibility can be shared with "
+                    "tenants only via Glance V2 API. Use 'public' or "
+                    "'community' visibility for other versions of API.")
+
+        image_service = image.Image(
+            admin_clients, name_generator=self.generate_random_name)
+        self.context["shared_images"] = []
+        for i in range(images_number):
+            image_obj = image_service.create_image(**create_args)
+            self.context["shared_images"].append(image_obj.id)
+
+        if create_args["visibility"] == "shared":
+            self._share_images(admin_clients)
+        for user, tenant_id in self._iterate_per_tenants():
+            self.context["tenants"][tenant_id]["images"] = list(
+                self.context["shared_images"])
+
+    def _share_images(self, admin_clients):
+        """Add every tenant as a member of shared images."""
+        def add_member(args, atomic_actions):
+            user, tenant_id = args
+            admin_glance = glance_v2.GlanceV2Service(
+                admin_clients, atomic_inst=atomic_actions)
+            user_glance = glance_v2.GlanceV2Service(
+                osclients.Clients(user["credential"]),
+                atomic_inst=atomic_actions)
+            for image_id in self.context["shared_images"]:
+                admin_glance.add_member(image_id=image_id,
+                                        member_id=tenant_id)
+                user_glance.update_member(image_id=image_id,
+                                          member_id=tenant_id)
+
+        _, failures = task_utils.run_concurrently(
+            add_member, self._iterate_per_tenants(),
+            workers=self.config["resource_management_workers"],
+            atomic_inst=self.atomic_actions())
+        task_utils.raise_setup_failures(
+            self.get_name(), failures,
+            "Failed to share images with %d tenant(s)")
+
     def cleanup(self):
+        if self.context.get("shared_images"):
+            image_service = image.Image(
+                osclients.Clients(self.context["admin"]["credential"]))
+            for image_id in self.context["shared_images"]:
+                with logging.ExceptionLogger(
+                        LOG, "Unable to delete image %s" % image_id):
+                    image_service.delete_image(image_id)
+
         if self.context.get("admin", {}):
             # NOTE(andreykurilin): Glance does not require the admin for
             #   listing tenant images, but the admin is required for
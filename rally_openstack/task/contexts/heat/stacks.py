@@ -13,12 +13,18 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+from rally.common import cfg
+from rally.common import utils as rutils
 from rally.common import validation
 
 from rally_openstack.common import consts
 from rally_openstack.task.cleanup import manager as resource_manager
 from rally_openstack.task import context
 from rally_openstack.task.scenarios.heat import utils as heat_utils
+from rally_openstack.task import utils as task_utils
+
+
+CONF = cfg.CONF
 
 
 @validation.add("required_platform", platform="openstack", users=True)
@@ -46,6 +52,12 @@ class StackGenerator(context.OpenStackContext):
             "resources_per_stack": {
                 "type": "integer",
                 "minimum": 1
+            },
+            "resource_management_workers": {
+                "type": "integer",
+                "minimum": 1,
+                "description": "The number of tenants to create stacks for "
+                               "concurrently."
             }
         },
         "additionalProperties": False
@@ -53,7 +65,8 @@ class StackGenerator(context.OpenStackContext):
 
     DEFAULT_CONFIG = {
         "stacks_per_tenant": 2,
-        "resources_per_stack": 10
+        "resources_per_stack": 10,
+        "resource_management_workers": 20
     }
 
     @staticmethod
@@ -68,17 +81,46 @@ class StackGenerator(context.OpenStackContext):
             template["resources"]["TestResource%d" % i] = rand_string
         return template
 
+    def _create_stacks(self, user, tenant_id, template):
+        """Request all the stacks of the tenant and wait for them at once."""
+        heat_scenario = heat_utils.HeatScenario(
+            {"user": user, "task": self.context["task"],
+             "owner_id": self.context["owner_id"]})
+        heat = heat_scenario.clients("heat")
+
+        stacks = []
+        for i in range(self.config["stacks_per_tenant"]):
+            stack_id = heat.stacks.create(
+                stack_name=heat_scenario.generate_random_name(),
+                disable_rollback=True, parameters={}, template=template,
+                files={}, environment={})["stack"]["id"]
+            stacks.append({"id": stack_id,
+                           "stack_status": "CREATE_IN_PROGRESS"})
+
+        rutils.interruptable_sleep(
+            CONF.openstack.heat_stack_create_prepoll_delay)
+        task_utils.wait_for_statuses(
+            stacks,
+            list_resources=lambda: heat.stacks.list(),
+            ready_statuses=["CREATE_COMPLETE"],
+            failure_statuses=["CREATE_FAILED", "ERROR"],
+            status_attr="stack_status",
+            timeout=CONF.openstack.heat_stack_create_timeout,
+            check_interval=CONF.openstack.heat_stack_create_poll_interval)
+
+        self.context["tenants"][tenant_id]["stacks"] = [
+            s["id"] for s in stacks]
+
     def setup(self):
         template = self._prepare_stack_template(
             self.config["resources_per_stack"])
-        for user, tenant_id in self._iterate_per_tenants():
-            heat_scenario = heat_utils.HeatScenario(
-                {"user": user, "task": self.context["task"],
-                 "owner_id": self.context["owner_id"]})
-            self.context["tenants"][tenant_id]["stacks"] = []
-            for i in range(self.config["stacks_per_tenant"]):
-                stack = heat_scenario._create_stack(template)
-                self.context["tenants"][tenant_id]["stacks"].append(stack.id)
+        _, failures = task_utils.run_concurrently(
+            lambda args: self._create_stacks(*args, template=template),
+            self._iterate_per_tenants(),
+            workers=self.config["resource_management_workers"])
+        task_utils.raise_setup_failures(
+            self.get_name(), failures,
+            "Failed to create stacks for %d tenant(s)")
 
     def cleanup(self):
         resource_manager.cleanup(names=["heat.stacks"],
@@ -50,64 +50,67 @@ class RoleGenerator(context.OpenStackContext):
         self.workers = (
             cfg.CONF.openstack.roles_context_resource_management_workers)
 
-    def _get_role_object(self, context_role):
-        """Check if role exists.
-
-        :param context_role: name of existing role.
-        """
-        keystone = identity.Identity(osclients.Clients(self.credential))
-        default_roles = keystone.list_roles()
-        for def_role in default_roles:
-            if str(def_role.name) == context_role:
-                return def_role
-        else:
-            raise exceptions.NotFoundException(
-                "There is no role with name `%s`" % context_role)
-
-    def _get_user_role_ids(self, user_id, project_id):
+    def _get_role_objects(self):
+        """Find roles of the config among existing ones at once."""
         keystone = identity.Identity(osclients.Clients(self.credential))
+        existing_roles = dict((str(role.name), role)
+                              for role in keystone.list_roles())
+        roles = []
+        for context_role in self.config:
+            if context_role not in existing_roles:
+                raise exceptions.NotFoundException(
+                    "There is no role with name `%s`" % context_role)
+            roles.append(existing_roles[context_role])
+        return roles
+
+    def _get_user_role_ids(self, keystone, user_id, project_id):
         user_roles = keystone.list_roles(user_id=user_id,
                                          project_id=project_id)
         return [role.id for role in user_roles]
 
+    def _get_client(self, cache):
+        if "client" not in cache:
+            clients = osclients.Clients(self.credential)
+            cache["client"] = identity.Identity(clients)
+        return cache["client"]
+
     def _get_consumer(self, func_name):
         def consume(cache, args):
             role_id, user_id, project_id = args
-            if "client" not in cache:
-                clients = osclients.Clients(self.credential)
-                cache["client"] = identity.Identity(clients)
-            getattr(cache["client"], func_name)(role_id=role_id,
-                                                user_id=user_id,
-                                                project_id=project_id)
+            getattr(self._get_client(cache), func_name)(
+                role_id=role_id, user_id=user_id, project_id=project_id)
         return consume
 
     def setup(self):
         """Add all roles to users."""
         threads = self.workers
-        roles_dict = {}
+        # NOTE: cleanup is called even if setup fails, so "roles" should be
+        #   in the context before the roles lookup.
+        self.context["roles"] = {}
+        roles = self._get_role_objects()
+        self.context["roles"] = dict((role.id, role.name) for role in roles)
+        LOG.debug("Adding roles %(roles)s to all users using %(threads)s "
+                  "threads" % {"roles": ", ".join(self.config),
+                               "threads": threads})
 
         def publish(queue):
-            for context_role in self.config:
-                role = self._get_role_object(context_role)
-                roles_dict[role.id] = role.name
-                LOG.debug("Adding role %(role_name)s having ID %(role_id)s "
-                          "to all users using %(threads)s threads"
-                          % {"role_name": role.name,
-                             "role_id": role.id,
-                             "threads": threads})
-                for user in self.context["users"]:
-                    if "roles" not in user:
-                        user["roles"] = self._get_user_role_ids(
-                            user["id"],
-                            user["tenant_id"])
-                        user["assigned_roles"] = []
-                    if role.id not in user["roles"]:
-                        args = (role.id, user["id"], user["tenant_id"])
-                        queue.append(args)
-                        user["assigned_roles"].append(role.id)
-
-        broker.run(publish, self._get_consumer("add_role"), threads)
-        self.context["roles"] = roles_dict
+            queue.extend(self.context["users"])
+
+        def consume(cache, user):
+            # NOTE: current roles of users are discovered by consumers to
+            #   spread these requests among all the threads.
+            keystone = self._get_client(cache)
+            if "roles" not in user:
+                user["roles"] = self._get_user_role_ids(
+                    keystone, user["id"], user["tenant_id"])
+                user["assigned_roles"] = []
+            for role in roles:
+                if role.id not in user["roles"]:
+                    keystone.add_role(role_id=role.id, user_id=user["id"],
+                                      project_id=user["tenant_id"])
+                    user["assigned_roles"].append(role.id)
+
+        broker.run(publish, consume, threads)
 
     def cleanup(self):
         """Remove assigned roles from users."""
@@ -117,7 +120,7 @@ class RoleGenerator(context.OpenStackContext):
             for role_id in self.context["roles"]:
                 LOG.debug("Removing assigned role %s from all users" % role_id)
                 for user in self.context["users"]:
-                    if role_id in user["assigned_roles"]:
+                    if role_id in user.get("assigned_roles", []):
                         args = (role_id, user["id"], user["tenant_id"])
                         queue.append(args)
 
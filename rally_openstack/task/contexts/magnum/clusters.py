@@ -12,13 +12,25 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import time
+
+from rally.common import cfg
+from rally.common import logging
+from rally.common import utils as rutils
 from rally.common import validation
+from rally import exceptions
+from rally.task import utils as task_utils
 
 from rally_openstack.common import consts
 from rally_openstack.task.cleanup import manager as resource_manager
 from rally_openstack.task import context
 from rally_openstack.task.scenarios.magnum import utils as magnum_utils
 from rally_openstack.task.scenarios.nova import utils as nova_utils
+from rally_openstack.task import utils as os_task_utils
+
+
+CONF = cfg.CONF
+LOG = logging.getLogger(__name__)
 
 
 @validation.add("required_platform", platform="openstack", users=True)
@@ -37,42 +49,143 @@ class ClusterGenerator(context.OpenStackContext):
                 "type": "integer",
                 "minimum": 1,
             },
+            "resource_management_workers": {
+                "type": "integer",
+                "minimum": 1,
+                "description": "The number of cluster create requests to "
+                               "submit concurrently."
+            },
+            "allowed_failures": {
+                "type": "integer",
+                "minimum": 0,
+                "description": "The number of tenants which clusters are "
+                               "allowed to fail. Clusters of other tenants "
+                               "are kept and the task goes on, iterations "
+                               "in tenants without a cluster fail. By "
+                               "default, the setup fails if any cluster "
+                               "was not created."
+            },
         },
         "additionalProperties": False
     }
 
-    DEFAULT_CONFIG = {"node_count": 1}
+    DEFAULT_CONFIG = {"node_count": 1, "resource_management_workers": 20,
+                      "allowed_failures": 0}
+
+    def _submit_cluster(self, user, tenant_id):
+        nova_scenario = nova_utils.NovaScenario({
+            "user": user,
+            "task": self.context["task"],
+            "owner_id": self.context["owner_id"],
+            "config": {"api_versions": self.context["config"].get(
+                "api_versions", [])}
+        })
+        keypair = nova_scenario._create_keypair()
+
+        magnum_scenario = magnum_utils.MagnumScenario({
+            "user": user,
+            "task": self.context["task"],
+            "owner_id": self.context["owner_id"],
+            "config": {"api_versions": self.context["config"].get(
+                "api_versions", [])}
+        })
+
+        # create a cluster
+        ct_uuid = self.config.get("cluster_template_uuid", None)
+        if ct_uuid is None:
+            ctx = self.context["tenants"][tenant_id]
+            ct_uuid = ctx.get("cluster_template")
+        magnum = magnum_scenario.clients("magnum")
+        cluster = magnum.clusters.create(
+            name=magnum_scenario.generate_random_name(),
+            cluster_template_id=ct_uuid,
+            node_count=self.config.get("node_count"), keypair=keypair)
+        return magnum, cluster
+
+    def _wait_for_clusters(self, clusters):
+        """Poll all submitted clusters from a single loop.
+
+        :param clusters: dict with tenant ID as a key and a tuple of magnum
+            client and cluster as a value
+        :returns: tuple of a dict with ready clusters per tenant and a list
+            of (tenant_id, exception) pairs for failed clusters
+        """
+        ready = {}
+        failures = []
+        pending = dict(clusters)
+        timeout = CONF.openstack.magnum_cluster_create_timeout
+        start = time.time()
+        while pending:
+            for tenant_id, (magnum, cluster) in list(pending.items()):
+                try:
+                    cluster = magnum.clusters.get(cluster.uuid)
+                except Exception as e:
+                    # NOTE: a failed check is not a failure of a cluster, it
+                    #   is checked again on the next iteration.
+                    LOG.debug("Failed to get cluster %s: %s"
+                              % (cluster.uuid, e))
+                    continue
+                status = task_utils.get_status(cluster)
+                if status == "CREATE_COMPLETE":
+                    ready[tenant_id] = cluster
+                    pending.pop(tenant_id)
+                elif status in ("CREATE_FAILED", "ERROR"):
+                    failures.append((tenant_id,
+                                     exceptions.GetResourceErrorStatus(
+                                         resource=cluster, status=status,
+                                         fault=getattr(cluster,
+                                                       "status_reason", ""))))
+                    pending.pop(tenant_id)
+                else:
+                    pending[tenant_id] = (magnum, cluster)
+
+            if not pending:
+                break
+            if time.time() - start > timeout:
+                for tenant_id, (magnum, cluster) in pending.items():
+                    failures.append((tenant_id, exceptions.TimeoutException(
+                        desired_status="CREATE_COMPLETE",
+                        resource_name=cluster.name,
+                        resource_type=cluster.__class__.__name__,
+                        resource_id=cluster.uuid,
+                        resource_status=task_utils.get_status(cluster),
+                        timeout=timeout)))
+                break
+            time.sleep(CONF.openstack.magnum_cluster_create_poll_interval)
+        return ready, failures
 
     def setup(self):
-        for user, tenant_id in self._iterate_per_tenants():
-
-            nova_scenario = nova_utils.NovaScenario({
-                "user": user,
-                "task": self.context["task"],
-                "owner_id": self.context["owner_id"],
-                "config": {"api_versions": self.context["config"].get(
-                    "api_versions", [])}
-            })
-            keypair = nova_scenario._create_keypair()
-
-            magnum_scenario = magnum_utils.MagnumScenario({
-                "user": user,
-                "task": self.context["task"],
-                "owner_id": self.context["owner_id"],
-                "config": {"api_versions": self.context["config"].get(
-                    "api_versions", [])}
-            })
-
-            # create a cluster
-            ct_uuid = self.config.get("cluster_template_uuid", None)
-            if ct_uuid is None:
-                ctx = self.context["tenants"][tenant_id]
-                ct_uuid = ctx.get("cluster_template")
-            cluster = magnum_scenario._create_cluster(
-                cluster_template=ct_uuid,
-                node_count=self.config.get("node_count"), keypair=keypair)
+        tenants = list(self._iterate_per_tenants())
+        results, failures = os_task_utils.run_concurrently(
+            lambda args: self._submit_cluster(*args), tenants,
+            workers=self.config["resource_management_workers"])
+        failures = [(tenant_id, e) for (u, tenant_id), e in failures]
+        submitted = dict((tenant_id, result)
+                         for (u, tenant_id), result in zip(tenants, results)
+                         if result is not None)
+
+        if submitted:
+            rutils.interruptable_sleep(
+                CONF.openstack.magnum_cluster_create_prepoll_delay)
+        ready, wait_failures = self._wait_for_clusters(submitted)
+        # NOTE: ready clusters are stored even if other ones failed, so they
+        #   are visible in the context (and cleaned up) in any case.
+        for tenant_id, cluster in ready.items():
             self.context["tenants"][tenant_id]["cluster"] = cluster.uuid
 
+        failures.extend(wait_failures)
+        if len(failures) > self.config["allowed_failures"]:
+            os_task_utils.raise_setup_failures(
+                self.get_name(), failures,
+                "Failed to create clusters for %%d of %d tenant(s)"
+                % len(tenants),
+                describe=lambda tenant_id: tenant_id)
+        if failures:
+            LOG.warning("Failed to create clusters for %d of %d tenant(s), "
+                        "continuing with the other ones: %s"
+                        % (len(failures), len(tenants),
+                           os_task_utils.format_failures(failures)))
+
     def cleanup(self):
         resource_manager.cleanup(
             names=["magnum.clusters", "nova.keypairs"],
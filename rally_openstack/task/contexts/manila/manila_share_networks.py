@@ -23,6 +23,7 @@ from rally_openstack.task.cleanup import manager as resource_manager
 from rally_openstack.task import context
 from rally_openstack.task.contexts.manila import consts
 from rally_openstack.task.scenarios.manila import utils as manila_utils
+from rally_openstack.task import utils as task_utils
 
 
 CONF = cfg.CONF
@@ -78,12 +79,19 @@ class ShareNetworks(context.OpenStackContext):
                 "description": SHARE_NETWORKS_ARG_DESCR,
                 "additionalProperties": True
             },
+            "resource_management_workers": {
+                "type": "integer",
+                "minimum": 1,
+                "description": "The number of tenants to create share "
+                               "networks for concurrently."
+            },
         },
         "additionalProperties": False
     }
     DEFAULT_CONFIG = {
         "use_share_networks": False,
         "share_networks": {},
+        "resource_management_workers": 20,
     }
 
     def _setup_for_existing_users(self):
@@ -138,45 +146,52 @@ class ShareNetworks(context.OpenStackContext):
                 self.context["tenants"][tenant_id][CONTEXT_NAME][
                     "share_networks"].append(sn.to_dict())
 
+    def _setup_share_networks(self, user, tenant_id):
+        networks = self.context["tenants"][tenant_id].get("networks")
+        manila_scenario = manila_utils.ManilaScenario({
+            "task": self.task,
+            "owner_id": self.get_owner_id(),
+            "user": user
+        })
+        manila_scenario.RESOURCE_NAME_FORMAT = self.RESOURCE_NAME_FORMAT
+        self.context["tenants"][tenant_id][CONTEXT_NAME] = {
+            "share_networks": []}
+
+        def _setup_share_network(data):
+            share_network = manila_scenario._create_share_network(
+                **data).to_dict()
+            self.context["tenants"][tenant_id][CONTEXT_NAME][
+                "share_networks"].append(share_network)
+            for ss in self.context["tenants"][tenant_id].get(
+                    consts.SECURITY_SERVICES_CONTEXT_NAME, {}).get(
+                        "security_services", []):
+                manila_scenario._add_security_service_to_share_network(
+                    share_network["id"], ss["id"])
+
+        if networks:
+            for network in networks:
+                data = {}
+                if network.get("cidr"):
+                    data["nova_net_id"] = network["id"]
+                elif network.get("subnets"):
+                    data["neutron_net_id"] = network["id"]
+                    data["neutron_subnet_id"] = network["subnets"][0]
+                else:
+                    LOG.warning("Can't determine network service provider."
+                                " Share network will have no data.")
+                _setup_share_network(data)
+        else:
+            _setup_share_network({})
+
     def _setup_for_autocreated_users(self):
         # Create share network for each network of tenant
-        for user, tenant_id in (self._iterate_per_tenants(
-                self.context.get("users", []))):
-            networks = self.context["tenants"][tenant_id].get("networks")
-            manila_scenario = manila_utils.ManilaScenario({
-                "task": self.task,
-                "owner_id": self.get_owner_id(),
-                "user": user
-            })
-            manila_scenario.RESOURCE_NAME_FORMAT = self.RESOURCE_NAME_FORMAT
-            self.context["tenants"][tenant_id][CONTEXT_NAME] = {
-                "share_networks": []}
-            data = {}
-
-            def _setup_share_network(tenant_id, data):
-                share_network = manila_scenario._create_share_network(
-                    **data).to_dict()
-                self.context["tenants"][tenant_id][CONTEXT_NAME][
-                    "share_networks"].append(share_network)
-                for ss in self.context["tenants"][tenant_id].get(
-                        consts.SECURITY_SERVICES_CONTEXT_NAME, {}).get(
-                            "security_services", []):
-                    manila_scenario._add_security_service_to_share_network(
-                        share_network["id"], ss["id"])
-
-            if networks:
-                for network in networks:
-                    if network.get("cidr"):
-                        data["nova_net_id"] = network["id"]
-                    elif network.get("subnets"):
-                        data["neutron_net_id"] = network["id"]
-                        data["neutron_subnet_id"] = network["subnets"][0]
-                    else:
-                        LOG.warning("Can't determine network service provider."
-                                    " Share network will have no data.")
-                    _setup_share_network(tenant_id, data)
-            else:
-                _setup_share_network(tenant_id, data)
+        results, failures = task_utils.run_concurrently(
+            lambda args: self._setup_share_networks(*args),
+            self._iterate_per_tenants(self.context.get("users", [])),
+            workers=self.config["resource_management_workers"])
+        task_utils.raise_setup_failures(
+            self.get_name(), failures,
+            "Failed to create share networks for %d tenant(s)")
 
     def setup(self):
         self.context[CONTEXT_NAME] = {}
@@ -14,6 +14,7 @@
 #    under the License.
 
 from rally.common import cfg
+from rally.common import utils as rutils
 from rally.common import validation
 
 from rally_openstack.common import consts as rally_consts
@@ -21,6 +22,7 @@ from rally_openstack.task.cleanup import manager as resource_manager
 from rally_openstack.task import context
 from rally_openstack.task.contexts.manila import consts
 from rally_openstack.task.scenarios.manila import utils as manila_utils
+from rally_openstack.task import utils as task_utils
 
 CONF = cfg.CONF
 CONTEXT_NAME = consts.SHARES_CONTEXT_NAME
@@ -49,6 +51,12 @@ class Shares(context.OpenStackContext):
             "share_type": {
                 "type": "string",
             },
+            "resource_management_workers": {
+                "type": "integer",
+                "minimum": 1,
+                "description": "The number of tenants to create shares for "
+                               "concurrently."
+            },
         },
         "additionalProperties": False
     }
@@ -58,14 +66,18 @@ class Shares(context.OpenStackContext):
         "size": 1,
         "share_proto": "NFS",
         "share_type": None,
+        "resource_management_workers": 20,
     }
 
     def _create_shares(self, manila_scenario, tenant_id, share_proto, size=1,
                        share_type=None):
         tenant_ctxt = self.context["tenants"][tenant_id]
         tenant_ctxt.setdefault("shares", [])
+        manila = manila_scenario.clients("manila")
+        shares = []
         for i in range(self.config["shares_per_tenant"]):
-            kwargs = {"share_proto": share_proto, "size": size}
+            kwargs = {"share_proto": share_proto, "size": size,
+                      "name": manila_scenario.generate_random_name()}
             if share_type:
                 kwargs["share_type"] = share_type
             share_networks = tenant_ctxt.get("manila_share_networks", {}).get(
@@ -73,23 +85,44 @@ class Shares(context.OpenStackContext):
             if share_networks:
                 kwargs["share_network"] = share_networks[
                     i % len(share_networks)]["id"]
-            share = manila_scenario._create_share(**kwargs)
-            tenant_ctxt["shares"].append(share.to_dict())
+            shares.append(manila.shares.create(**kwargs))
+
+        # NOTE: all shares of the tenant are provisioned by the backend in
+        #   parallel, so they are waited for with one list request per check
+        #   instead of polling every share separately.
+        rutils.interruptable_sleep(
+            CONF.openstack.manila_share_create_prepoll_delay)
+        shares = task_utils.wait_for_statuses(
+            shares,
+            lambda: manila.shares.list(
+                detailed=True, search_opts={"project_id": tenant_id}),
+            ready_statuses=["available"],
+            timeout=CONF.openstack.manila_share_create_timeout,
+            check_interval=CONF.openstack.manila_share_create_poll_interval)
+        tenant_ctxt["shares"].extend(share.to_dict() for share in shares)
+
+    def _setup_tenant(self, user, tenant_id):
+        manila_scenario = manila_utils.ManilaScenario({
+            "task": self.task,
+            "owner_id": self.context["owner_id"],
+            "user": user
+        })
+        self._create_shares(
+            manila_scenario,
+            tenant_id,
+            self.config["share_proto"],
+            self.config["size"],
+            self.config["share_type"],
+        )
 
     def setup(self):
-        for user, tenant_id in self._iterate_per_tenants():
-            manila_scenario = manila_utils.ManilaScenario({
-                "task": self.task,
-                "owner_id": self.context["owner_id"],
-                "user": user
-            })
-            self._create_shares(
-                manila_scenario,
-                tenant_id,
-                self.config["share_proto"],
-                self.config["size"],
-                self.config["share_type"],
-            )
+        results, failures = task_utils.run_concurrently(
+            lambda args: self._setup_tenant(*args),
+            self._iterate_per_tenants(),
+            workers=self.config["resource_management_workers"])
+        task_utils.raise_setup_failures(
+            self.get_name(), failures,
+            "Failed to create shares for %d tenant(s)")
 
     def cleanup(self):
         resource_manager.cleanup(
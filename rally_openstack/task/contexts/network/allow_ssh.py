@@ -15,14 +15,17 @@
 
 from __future__ import annotations
 
+from rally.common import cfg
 from rally.common import logging
 from rally.common import validation
 
 from rally_openstack.common.services.network import neutron
 from rally_openstack.task.cleanup import manager as resource_manager
 from rally_openstack.task import context
+from rally_openstack.task import utils as task_utils
 
 
+CONF = cfg.CONF
 LOG = logging.getLogger(__name__)
 
 
@@ -124,32 +127,56 @@ class AllowSSH(context.OpenStackContext):
             return
 
         secgroup_name = self.generate_random_name()
-        secgroups_per_tenant = {}
-        for user, tenant_id in self._iterate_per_tenants():
-            client = neutron.NeutronService(
-                clients=user["credential"].clients(),
-                name_generator=self.generate_random_name,
-                atomic_inst=self.atomic_actions()
-            )
-            secgroup = client.create_security_group(
-                name=secgroup_name,
-                description="Allow ssh access to VMs created by Rally")
-            secgroups_per_tenant[tenant_id] = secgroup
-
-            existing_rules = set(
-                _rule_to_key(rule)
-                for rule in secgroup.get("security_group_rules", []))
-            for new_rule in _RULES_TO_ADD:
-                if _rule_to_key(new_rule) not in existing_rules:
-                    secgroup.setdefault("security_group_rules", [])
-                    secgroup["security_group_rules"].append(
-                        client.create_security_group_rule(
-                            security_group_id=secgroup["id"], **new_rule)
-                    )
-
+        tenants = list(self._iterate_per_tenants())
+        workers = CONF.openstack.allow_ssh_context_resource_management_workers
+        secgroups, failures = task_utils.run_concurrently(
+            lambda args, atomic_actions: self._create_secgroup(
+                args[0], secgroup_name, atomic_actions),
+            tenants, workers=workers, atomic_inst=self.atomic_actions())
+        task_utils.raise_setup_failures(
+            self.get_name(), failures,
+            "Failed to create security groups for %d tenant(s)")
+
+        secgroups_per_tenant = dict(
+            (tenant_id, secgroup)
+            for (user, tenant_id), secgroup in zip(tenants, secgroups))
         for user in self.context["users"]:
             user["secgroup"] = secgroups_per_tenant[user["tenant_id"]]
 
+    def _create_secgroup(self, user, secgroup_name, atomic_actions):
+        from neutronclient.common import exceptions as neutron_exceptions
+
+        client = neutron.NeutronService(
+            clients=user["credential"].clients(),
+            name_generator=self.generate_random_name,
+            atomic_inst=atomic_actions
+        )
+        secgroup = client.create_security_group(
+            name=secgroup_name,
+            description="Allow ssh access to VMs created by Rally")
+        secgroup.setdefault("security_group_rules", [])
+
+        existing_rules = set(
+            _rule_to_key(rule) for rule in secgroup["security_group_rules"])
+        new_rules = [rule for rule in _RULES_TO_ADD
+                     if _rule_to_key(rule) not in existing_rules]
+        if not new_rules:
+            return secgroup
+        try:
+            secgroup["security_group_rules"].extend(
+                client.create_security_group_rules(
+                    security_group_id=secgroup["id"], rules=new_rules))
+        except neutron_exceptions.BadRequest as e:
+            # NOTE: Neutron rejects bulk requests if a plugin does not
+            #   support them
+            LOG.warning("Failed to create security group rules in bulk, "
+                        "creating them one by one: %s" % e)
+            for new_rule in new_rules:
+                secgroup["security_group_rules"].append(
+                    client.create_security_group_rule(
+                        security_group_id=secgroup["id"], **new_rule))
+        return secgroup
+
     def cleanup(self):
         resource_manager.cleanup(
             names=["neutron.security_group"],
@@ -17,6 +17,7 @@ from rally_openstack.common import consts
 from rally_openstack.common import osclients
 from rally_openstack.common.wrappers import network as network_wrapper
 from rally_openstack.task import context
+from rally_openstack.task import utils as task_utils
 
 
 LOG = logging.getLogger(__name__)
@@ -38,6 +39,12 @@ class Lbaas(context.OpenStackContext):
             "lbaas_version": {
                 "type": "integer",
                 "minimum": 1
+            },
+            "resource_management_workers": {
+                "type": "integer",
+                "minimum": 1,
+                "description": "The number of pools to create or delete "
+                               "concurrently."
             }
         },
         "additionalProperties": False
@@ -48,7 +55,8 @@ class Lbaas(context.OpenStackContext):
             "lb_method": "ROUND_ROBIN",
             "protocol": "HTTP"
         },
-        "lbaas_version": 1
+        "lbaas_version": 1,
+        "resource_management_workers": 20
     }
 
     config: dict
@@ -63,32 +71,46 @@ class Lbaas(context.OpenStackContext):
             LOG.info(msg)
             return
 
+        if self.config["lbaas_version"] != 1:
+            raise NotImplementedError(
+                "Context for LBaaS version %s not implemented."
+                % self.config["lbaas_version"])
+
         # Creates a lb-pool for every subnet created in network context.
-        for user, tenant_id in self._iterate_per_tenants():
-            for network in self.context["tenants"][tenant_id]["networks"]:
-                for subnet in network.get("subnets", []):
-                    if self.config["lbaas_version"] == 1:
-                        network.setdefault("lb_pools", []).append(
-                            net_wrapper.create_v1_pool(
-                                tenant_id,
-                                subnet,
-                                **self.config["pool"]))
-                    else:
-                        raise NotImplementedError(
-                            "Context for LBaaS version %s not implemented."
-                            % self.config["lbaas_version"])
+        subnets = [(tenant_id, network, subnet)
+                   for user, tenant_id in self._iterate_per_tenants()
+                   for network in self.context["tenants"][tenant_id][
+                       "networks"]
+                   for subnet in network.get("subnets", [])]
+        pools, failures = task_utils.run_concurrently(
+            lambda args: net_wrapper.create_v1_pool(args[0], args[2],
+                                                    **self.config["pool"]),
+            subnets, workers=self.config["resource_management_workers"])
+        # NOTE: created pools are stored even if some of pools failed, so
+        #   they are deleted at cleanup.
+        for (tenant_id, network, subnet), pool in zip(subnets, pools):
+            if pool is not None:
+                network.setdefault("lb_pools", []).append(pool)
+        task_utils.raise_setup_failures(
+            self.get_name(), failures, "Failed to create %d pool(s)",
+            describe=lambda item: "subnet %s of tenant %s" % (
+                item[2], item[0]))
 
     def cleanup(self):
+        if self.config["lbaas_version"] != 1:
+            return
         net_wrapper = network_wrapper.wrap(
             osclients.Clients(self.context["admin"]["credential"]),
             self, config=self.config)
-        for tenant_id, tenant_ctx in self.context["tenants"].items():
-            for network in tenant_ctx.get("networks", []):
-                for pool in network.get("lb_pools", []):
-                    with logging.ExceptionLogger(
-                            LOG,
-                            "Failed to delete pool %(pool)s for tenant "
-                            "%(tenant)s" % {"pool": pool["pool"]["id"],
-                                            "tenant": tenant_id}):
-                        if self.config["lbaas_version"] == 1:
-                            net_wrapper.delete_v1_pool(pool["pool"]["id"])
+        pools = [(tenant_id, pool["pool"]["id"])
+                 for tenant_id, tenant_ctx in self.context["tenants"].items()
+                 for network in tenant_ctx.get("networks", [])
+                 for pool in network.get("lb_pools", [])]
+        results, failures = task_utils.run_concurrently(
+            lambda args: net_wrapper.delete_v1_pool(args[1]),
+            pools, workers=self.config["resource_management_workers"])
+        if failures:
+            LOG.warning("Failed to delete %d pool(s): %s" % (
+                len(failures), task_utils.format_failures(
+                    [("pool %s of tenant %s" % (pool_id, tenant_id), e)
+                     for (tenant_id, pool_id), e in failures])))
@@ -15,9 +15,10 @@
 
 from rally.common import validation
 
-from rally_openstack.common import osclients
+from rally_openstack.common import consts
 from rally_openstack.task.cleanup import manager as resource_manager
 from rally_openstack.task import context
+from rally_openstack.task import utils as task_utils
 
 
 @validation.add("required_platform", platform="openstack", users=True)
@@ -25,32 +26,80 @@ from rally_openstack.task import context
 class Keypair(context.OpenStackContext):
     """Create Nova KeyPair for each user."""
 
-    # NOTE(andreykurilin): "type" != "null", since we need to support backward
-    #   compatibility(previously empty dict was valid) and I hope in near
-    #   future, we will extend this context to accept keys.
-    CONFIG_SCHEMA = {"type": "object",
-                     "additionalProperties": False}
+    CONFIG_SCHEMA = {
+        "type": "object",
+        "$schema": consts.JSON_SCHEMA,
+        "properties": {
+            "public_key": {
+                "type": "string",
+                "description": "Import the public key instead of generating "
+                               "a new key pair for every user. Unless "
+                               "`private_key` is specified too, the private "
+                               "key of the key pair in the context is null, "
+                               "so the key pair can not be used by scenarios "
+                               "which need SSH access."
+            },
+            "private_key": {
+                "type": "string",
+                "description": "The private key of imported `public_key`. It "
+                               "is stored in the context as is, so scenarios "
+                               "are able to use it for SSH access."
+            },
+            "resource_management_workers": {
+                "type": "integer",
+                "minimum": 1,
+                "description": "The number of users to create key pairs for "
+                               "concurrently."
+            }
+        },
+        "additionalProperties": False
+    }
+
+    DEFAULT_CONFIG = {
+        "resource_management_workers": 20
+    }
+
+    # NOTE: the number of attempts to pick a name which is not taken yet
+    MAX_NAME_ATTEMPTS = 5
 
     def _generate_keypair(self, credential):
-        nova_client = osclients.Clients(credential).nova()
-        # NOTE(hughsaunders): If keypair exists, it should re-generate name.
+        from novaclient import exceptions as nova_exc
+
+        nova_client = credential.clients().nova()
+        kwargs = {}
+        if "public_key" in self.config:
+            kwargs["public_key"] = self.config["public_key"]
 
-        keypairs = nova_client.keypairs.list()
-        keypair_names = [keypair.name for keypair in keypairs]
-        while True:
+        for attempt in range(self.MAX_NAME_ATTEMPTS):
             keypair_name = self.generate_random_name()
-            if keypair_name not in keypair_names:
+            try:
+                keypair = nova_client.keypairs.create(keypair_name, **kwargs)
+            except nova_exc.Conflict:
+                # NOTE(hughsaunders): If keypair exists, it should
+                #   re-generate name.
+                if attempt == self.MAX_NAME_ATTEMPTS - 1:
+                    raise
+            else:
                 break
 
-        keypair = nova_client.keypairs.create(keypair_name)
-        return {"private": keypair.private_key,
+        return {"private": (getattr(keypair, "private_key", None)
+                            or self.config.get("private_key")),
                 "public": keypair.public_key,
                 "name": keypair_name,
                 "id": keypair.id}
 
     def setup(self):
-        for user in self.context["users"]:
-            user["keypair"] = self._generate_keypair(user["credential"])
+        users = self.context["users"]
+        keypairs, failures = task_utils.run_concurrently(
+            lambda user: self._generate_keypair(user["credential"]),
+            users, workers=self.config["resource_management_workers"])
+        for user, keypair in zip(users, keypairs):
+            if keypair is not None:
+                user["keypair"] = keypair
+        task_utils.raise_setup_failures(
+            self.get_name(), failures,
+            "Failed to create key pairs for %d user(s)",
+            describe=lambda user: user.get("id"))
 
     def cleanup(self):
         resource_manager.cleanup(names=["nova.keypairs"],
@@ -24,6 +24,7 @@ from rally_openstack.task.contexts.quotas import designate_quotas
 from rally_openstack.task.contexts.quotas import manila_quotas
 from rally_openstack.task.contexts.quotas import neutron_quotas
 from rally_openstack.task.contexts.quotas import nova_quotas
+from rally_openstack.task import utils as task_utils
 
 
 LOG = logging.getLogger(__name__)
@@ -43,11 +44,17 @@ class Quotas(context.OpenStackContext):
             "cinder": cinder_quotas.CinderQuotas.QUOTAS_SCHEMA,
             "manila": manila_quotas.ManilaQuotas.QUOTAS_SCHEMA,
             "designate": designate_quotas.DesignateQuotas.QUOTAS_SCHEMA,
-            "neutron": neutron_quotas.NeutronQuotas.QUOTAS_SCHEMA
+            "neutron": neutron_quotas.NeutronQuotas.QUOTAS_SCHEMA,
+            "resource_management_workers": {
+                "type": "integer",
+                "minimum": 1
+            }
         }
     }
 
-    config: dict[str, dict[str, int]]
+    DEFAULT_CONFIG = {"resource_management_workers": 20}
+
+    config: dict
 
     def __init__(self, ctx):
         super(Quotas, self).__init__(ctx)
@@ -66,41 +73,70 @@ class Quotas(context.OpenStackContext):
     def _service_has_quotas(self, service):
         return len(self.config.get(service, {})) > 0
 
+    def _run(self, func, items):
+        """Call func for (service, tenant_id, ...) items in a worker pool."""
+        return task_utils.run_concurrently(
+            lambda item: func(*item), items,
+            workers=self.config["resource_management_workers"])
+
+    @staticmethod
+    def _describe(item):
+        return "%s (%s)" % (item[1], item[0])
+
+    def _format_failures(self, failures):
+        return task_utils.format_failures(
+            [(self._describe(item), e) for item, e in failures])
+
     def setup(self):
-        for tenant_id in self.context["tenants"]:
-            for service in self.manager:
-                if self._service_has_quotas(service):
-                    # NOTE(andreykurilin): in case of existing users it is
-                    #   required to restore original quotas instead of reset
-                    #   to default ones.
-                    if "existing_users" in self.context["config"]:
-                        self.original_quotas.append(
-                            (service, tenant_id,
-                             self.manager[service].get(tenant_id)))
-                    self.manager[service].update(tenant_id,
-                                                 **self.config[service])
+        items = [(service, tenant_id)
+                 for tenant_id in self.context["tenants"]
+                 for service in self.manager
+                 if self._service_has_quotas(service)]
+
+        # NOTE(andreykurilin): in case of existing users it is
+        #   required to restore original quotas instead of reset
+        #   to default ones.
+        if "existing_users" in self.context["config"]:
+            results, failures = self._run(
+                lambda service, tenant_id: self.manager[service].get(
+                    tenant_id),
+                items)
+            task_utils.raise_setup_failures(
+                self.get_name(), failures,
+                "Failed to get %d original quota(s) of tenants",
+                describe=self._describe)
+            self.original_quotas = [
+                (service, tenant_id, quotas)
+                for (service, tenant_id), quotas in zip(items, results)]
+
+        results, failures = self._run(
+            lambda service, tenant_id: self.manager[service].update(
+                tenant_id, **self.config[service]),
+            items)
+        task_utils.raise_setup_failures(
+            self.get_name(), failures, "Failed to set %d quota(s) of tenants",
+            describe=self._describe)
 
     def _restore_quotas(self):
-        for service, tenant_id, quotas in self.original_quotas:
-            try:
-                self.manager[service].update(tenant_id, **quotas)
-            except Exception as e:
-                LOG.warning("Failed to restore quotas for tenant %(tenant_id)s"
-                            " in service %(service)s \n reason: %(exc)s" %
-                            {"tenant_id": tenant_id, "service": service,
-                             "exc": e})
+        results, failures = self._run(
+            lambda service, tenant_id, quotas: self.manager[service].update(
+                tenant_id, **quotas),
+            self.original_quotas)
+        if failures:
+            LOG.warning("Failed to restore quotas for tenant(s): %s"
+                        % self._format_failures(failures))
 
     def _delete_quotas(self):
-        for service in self.manager:
-            if self._service_has_quotas(service):
-                for tenant_id in self.context["tenants"]:
-                    try:
-                        self.manager[service].delete(tenant_id)
-                    except Exception as e:
-                        LOG.warning(
-                            "Failed to remove quotas for tenant %(tenant)s "
-                            "in service %(service)s reason: %(e)s" %
-                            {"tenant": tenant_id, "service": service, "e": e})
+        results, failures = self._run(
+            lambda service, tenant_id: self.manager[service].delete(
+                tenant_id),
+            [(service, tenant_id)
+             for service in self.manager
+             if self._service_has_quotas(service)
+             for tenant_id in self.context["tenants"]])
+        if failures:
+            LOG.warning("Failed to remove quotas for tenant(s): %s"
+                        % self._format_failures(failures))
 
     def cleanup(self):
         if self.original_quotas:
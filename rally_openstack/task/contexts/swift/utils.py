@@ -13,13 +13,15 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-import tempfile
-
 from rally.common import broker
+from rally.common import logging
 
 from rally_openstack.task.scenarios.swift import utils as swift_utils
 
 
+LOG = logging.getLogger(__name__)
+
+
 class SwiftObjectMixin(object):
     """Mix-in method for Swift Object Context."""
 
@@ -50,7 +52,7 @@ class SwiftObjectMixin(object):
             container_name = cache[user["id"]]._create_container()
             tenant_containers.append({"user": user,
                                       "container": container_name,
-                                      "objects": []})
+                                      "objects": set()})
             containers.append((user["tenant_id"], container_name))
 
         broker.run(publish, consume, threads)
@@ -68,32 +70,29 @@ class SwiftObjectMixin(object):
         :returns: list of tuples containing (account, container, object)
         """
         objects = []
+        # NOTE: bytes are immutable, so the same payload is safely shared by
+        #   all the threads without copying it for every upload.
+        payload = bytes(object_size)
 
-        with tempfile.TemporaryFile() as dummy_file:
-            # set dummy file to specified object size
-            dummy_file.truncate(object_size)
-
-            def publish(queue):
-                for tenant_id in self.context["tenants"]:
-                    items = self.context["tenants"][tenant_id]["containers"]
-                    for container in items:
-                        for i in range(objects_per_container):
-                            queue.append(container)
-
-            def consume(cache, container):
-                user = container["user"]
-                if user["id"] not in cache:
-                    cache[user["id"]] = swift_utils.SwiftScenario(
-                        {"user": user, "task": self.context.get("task", {})})
-                dummy_file.seek(0)
-                object_name = cache[user["id"]]._upload_object(
-                    container["container"],
-                    dummy_file)[1]
-                container["objects"].append(object_name)
-                objects.append((user["tenant_id"], container["container"],
-                                object_name))
-
-            broker.run(publish, consume, threads)
+        def publish(queue):
+            for tenant_id in self.context["tenants"]:
+                items = self.context["tenants"][tenant_id]["containers"]
+                for container in items:
+                    for i in range(objects_per_container):
+                        queue.append(container)
+
+        def consume(cache, container):
+            user = container["user"]
+            if user["id"] not in cache:
+                cache[user["id"]] = swift_utils.SwiftScenario(
+                    {"user": user, "task": self.context.get("task", {})})
+            object_name = cache[user["id"]]._upload_object(
+                container["container"], payload)[1]
+            container["objects"].add(object_name)
+            objects.append((user["tenant_id"], container["container"],
+                            object_name))
+
+        broker.run(publish, consume, threads)
 
         return objects
 
@@ -120,27 +119,72 @@ class SwiftObjectMixin(object):
 
         broker.run(publish, consume, threads)
 
+    def _get_bulk_delete_size(self):
+        """Get max number of objects to delete by one bulk-delete request.
+
+        :returns: int or None if bulk-delete is not supported by Swift
+        """
+        for tenant in self.context["tenants"].values():
+            for container in tenant.get("containers", []):
+                scenario = swift_utils.SwiftScenario(
+                    {"user": container["user"],
+                     "task": self.context.get("task", {})})
+                try:
+                    capabilities = scenario.clients(
+                        "swift").get_capabilities()
+                except Exception as e:
+                    LOG.warning("Failed to discover Swift capabilities, "
+                                "objects are deleted one by one: %s" % e)
+                    return None
+                bulk_delete = capabilities.get("bulk_delete") or {}
+                return bulk_delete.get("max_deletes_per_request")
+        return None
+
     def _delete_objects(self, threads):
         """Delete objects created by Swift context and update Rally context.
 
+        Objects are deleted by bulk-delete requests if the bulk middleware
+        is enabled in Swift, and one by one otherwise. Objects which failed
+        to be deleted by a bulk-delete request are deleted one by one.
+
         :param threads: int, number of threads to use for broker pattern
         """
+        bulk_size = self._get_bulk_delete_size()
+
         def publish(queue):
             for tenant_id in self.context["tenants"]:
                 containers = self.context["tenants"][tenant_id]["containers"]
                 for container in containers:
-                    for object_name in container["objects"][:]:
-                        args = object_name, container
+                    objects = sorted(container["objects"])
+                    step = bulk_size or 1
+                    for i in range(0, len(objects), step):
+                        args = objects[i:i + step], container
                         queue.append(args)
 
         def consume(cache, args):
-            object_name, container = args
+            object_names, container = args
             user = container["user"]
             if user["id"] not in cache:
                 cache[user["id"]] = swift_utils.SwiftScenario(
                     {"user": user, "task": self.context.get("task", {})})
-            cache[user["id"]]._delete_object(container["container"],
-                                             object_name)
-            container["objects"].remove(object_name)
+            scenario = cache[user["id"]]
+            deleted = set()
+            if bulk_size:
+                try:
+                    deleted.update(scenario._bulk_delete_objects(
+                        container["container"], object_names))
+                except Exception as e:
+                    LOG.warning("Failed to bulk-delete %d objects of "
+                                "container %s, deleting them one by one: "
+                                "%s" % (len(object_names),
+                                        container["container"], e))
+                container["objects"].difference_update(deleted)
+            # NOTE: objects which were not deleted by a bulk-delete request
+            #   are retried one by one, so they do not leak
+            for object_name in object_names:
+                if object_name not in deleted:
+                    scenario._delete_object(container["container"],
+                                            object_name)
+                    container["objects"].discard(object_name)
 
         broker.run(publish, consume, threads)
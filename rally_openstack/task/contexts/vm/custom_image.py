@@ -14,6 +14,9 @@
 #  under the License.
 
 import abc
+import datetime as dt
+import hashlib
+import json
 
 from rally.common import broker
 from rally.common import logging
@@ -43,8 +46,20 @@ class BaseCustomImageGenerator(context.OpenStackContext,
     the `_customize_image` and then snapshots the VM disk, removing the VM
     afterwards. The image UUID is stored in the user["custom_image"]["id"]
     and can be used afterwards by scenario.
+
+    If "cache" option is enabled, the customized image is not deleted at
+    cleanup. It is tagged with a hash of the base image, the flavor and the
+    customization, so the next task with the same configuration reuses it
+    instead of building it again. When admin is present, the cached image
+    is owned by the admin project, so it outlives the temporary tenants.
+    Cached images older than "cache_max_age" seconds are deleted by the next
+    task; all of them are tagged with "rally-custom-image" and can be
+    removed by hand as well.
     """
 
+    CACHE_TAG = "rally-custom-image"
+    CACHE_TAG_PREFIX = "rally-custom-image-"
+
     CONFIG_SCHEMA = {
         "type": "object",
         "$schema": consts.JSON_SCHEMA,
@@ -90,6 +105,20 @@ class BaseCustomImageGenerator(context.OpenStackContext,
             "workers": {
                 "type": "integer",
                 "minimum": 1,
+            },
+            "cache": {
+                "type": "boolean",
+                "description": "Keep the customized image between tasks and "
+                               "reuse it while the base image, the flavor "
+                               "and the customization do not change."
+            },
+            "cache_max_age": {
+                "type": "integer",
+                "minimum": 0,
+                "description": "Delete cached images which are older than "
+                               "this number of seconds instead of reusing "
+                               "them. By default, cached images are kept "
+                               "until removed by hand."
             }
         },
         "required": ["image", "flavor"],
@@ -99,7 +128,8 @@ class BaseCustomImageGenerator(context.OpenStackContext,
     DEFAULT_CONFIG = {
         "username": "root",
         "port": 22,
-        "workers": 1
+        "workers": 1,
+        "cache": False
     }
 
     def setup(self):
@@ -152,6 +182,16 @@ class BaseCustomImageGenerator(context.OpenStackContext,
         flavor_id = types.Flavor(self.context).pre_process(
             resource_spec=self.config["flavor"], config={})
 
+        if self.config["cache"]:
+            cache_clients = self._get_cache_clients(user)
+            if self.config.get("cache_max_age") is not None:
+                self._evict_cached_images(cache_clients)
+            cache_tag = self._get_cache_tag(image_id, flavor_id)
+            custom_image = self._get_cached_image(cache_clients, cache_tag)
+            if custom_image:
+                LOG.info("Reusing cached custom image %s" % custom_image.id)
+                return custom_image
+
         vm_scenario = vmtasks.BootRuncommandDelete(self.context,
                                                    clients=clients)
 
@@ -175,11 +215,82 @@ class BaseCustomImageGenerator(context.OpenStackContext,
         finally:
             vm_scenario._delete_server_with_fip(server, fip)
 
+        if self.config["cache"]:
+            self._cache_image(cache_clients, custom_image, cache_tag)
         return custom_image
 
+    def _get_customization(self):
+        """Return data which identifies the customization of an image.
+
+        Override this method if the customization depends on something
+        besides the context config (for example, on local files).
+        """
+        return None
+
+    def _get_cache_tag(self, image_id, flavor_id):
+        config = dict((k, v) for k, v in self.config.items()
+                      if k not in ("workers", "cache", "cache_max_age"))
+        key = json.dumps({"context": self.get_name(),
+                          "image": image_id,
+                          "flavor": flavor_id,
+                          "config": config,
+                          "customization": self._get_customization()},
+                         sort_keys=True)
+        return self.CACHE_TAG_PREFIX + hashlib.sha256(
+            key.encode("utf-8")).hexdigest()
+
+    def _get_cache_clients(self, user):
+        # NOTE: users and tenants created by the task are removed at its end,
+        #   so the admin project keeps cached images if admin is present.
+        if "admin" in self.context:
+            return self.context["admin"]["credential"].clients()
+        return osclients.Clients(user["credential"])
+
+    def _evict_cached_images(self, clients):
+        max_age = dt.timedelta(seconds=self.config["cache_max_age"])
+        now = dt.datetime.now(dt.timezone.utc)
+        glance = clients.glance("2")
+        for cached in glance.images.list(filters={"tag": [self.CACHE_TAG]}):
+            created_at = dt.datetime.strptime(
+                cached["created_at"], "%Y-%m-%dT%H:%M:%SZ").replace(
+                tzinfo=dt.timezone.utc)
+            if now - created_at > max_age:
+                with logging.ExceptionLogger(
+                        LOG, "Unable to evict cached image %s"
+                             % cached["id"]):
+                    glance.images.delete(cached["id"])
+                    LOG.info("Cached custom image %s is evicted"
+                             % cached["id"])
+
+    def _get_cached_image(self, clients, cache_tag):
+        images = clients.glance("2").images.list(
+            filters={"tag": [cache_tag], "status": "active"})
+        for cached in images:
+            if cache_tag in cached.get("tags", []):
+                return image.Image(clients).get_image(cached["id"])
+        return None
+
+    def _cache_image(self, clients, custom_image, cache_tag):
+        glance = clients.glance("2")
+        # NOTE: the image is renamed, so it does not match names of
+        #   resources created by the task and is not removed by the cleanup.
+        properties = {"name": cache_tag[:32]}
+        if "admin" in self.context:
+            properties["owner"] = clients.keystone.auth_ref.project_id
+        glance.images.update(custom_image.id, **properties)
+        glance.image_tags.update(custom_image.id, self.CACHE_TAG)
+        glance.image_tags.update(custom_image.id, cache_tag)
+        LOG.info("Custom image %s is cached with tag %s"
+                 % (custom_image.id, cache_tag))
+
     def cleanup(self):
         """Delete created custom image(s)."""
 
+        if self.config["cache"]:
+            for tenant in self.context["tenants"].values():
+                tenant.pop("custom_image", None)
+            return
+
         if "admin" in self.context:
             user = self.context["users"][0]
             tenant = self.context["tenants"][user["tenant_id"]]
@@ -14,6 +14,8 @@
 #  under the License.
 
 import copy
+import hashlib
+import os
 
 from rally.common import validation
 from rally import exceptions
@@ -88,6 +90,17 @@ class ImageCommandCustomizerContext(custom_image.BaseCustomImageGenerator):
         "$ref": "#/definitions/commandDict"
     }
 
+    def _get_customization(self):
+        # NOTE: the script is read from a local file, so its content should
+        #   be a part of the image cache key as well.
+        script_file = self.config.get("command", {}).get("script_file")
+        if isinstance(script_file, str):
+            script_file = os.path.expanduser(script_file)
+            if os.path.isfile(script_file):
+                with open(script_file, "rb") as f:
+                    return hashlib.sha256(f.read()).hexdigest()
+        return None
+
     def _customize_image(self, server, fip, user):
         code, out, err = vm_utils.VMScenario(self.context)._run_command(
             fip["ip"], self.config["port"],
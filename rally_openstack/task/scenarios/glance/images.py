@@ -13,6 +13,9 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import hashlib
+import os
+
 from rally.common import logging
 from rally.task import types
 from rally.task import validation
@@ -40,13 +43,44 @@ class GlanceBasic(scenario.OpenStackScenario):
                 self._clients, name_generator=self.generate_random_name,
                 atomic_inst=self.atomic_actions())
 
+    def _add_upload_throughput_output(self, image_location):
+        """Report throughput of uploading image data.
+
+        It is reported only if the size of data is known in advance and the
+        upload is measured separately from the image creation (Glance V2).
+        """
+        if isinstance(image_location, dict):
+            size = image_location["size"]
+        elif os.path.isfile(image_location):
+            size = os.path.getsize(image_location)
+        else:
+            return
+        actions = list(self.atomic_actions())
+        uploads = []
+        while actions:
+            action = actions.pop(0)
+            if action["name"].endswith(".upload_data"):
+                uploads.append(action)
+            actions.extend(action.get("children", []))
+        if not uploads:
+            return
+        duration = uploads[-1]["finished_at"] - uploads[-1]["started_at"]
+        throughput = size / duration / 10 ** 6 if duration else 0
+        self.add_output(additive={
+            "title": "Image upload throughput",
+            "description": "Throughput of uploading image data",
+            "chart_plugin": "Lines",
+            "data": [["MB/s", round(throughput, 3)]],
+            "label": "MB/s",
+            "axis_label": "Iteration"})
+
 
 @validation.add("enum", param_name="container_format",
                 values=["ami", "ari", "aki", "bare", "ovf"])
 @validation.add("enum", param_name="disk_format",
                 values=["ami", "ari", "aki", "vhd", "vmdk", "raw",
                         "qcow2", "vdi", "iso"])
-@types.convert(image_location={"type": "path_or_url"},
+@types.convert(image_location={"type": "glance_image_location"},
                kwargs={"type": "glance_image_args"})
 @validation.add("required_services", services=[consts.Service.GLANCE])
 @validation.add("required_platform", platform="openstack", users=True)
@@ -69,7 +103,9 @@ class CreateAndListImage(GlanceBasic):
 
         :param container_format: container format of image. Acceptable
                                  formats: ami, ari, aki, bare, and ovf
-        :param image_location: image file location
+        :param image_location: image file location or a dict which
+                               specifies data to generate in memory:
+                               size, pattern, randomize and seed
         :param disk_format: disk format of image. Acceptable formats:
                             ami, ari, aki, vhd, vmdk, raw, qcow2, vdi, and iso
         :param visibility: The access permission for the created image
@@ -86,6 +122,7 @@ class CreateAndListImage(GlanceBasic):
             min_disk=min_disk,
             min_ram=min_ram,
             properties=properties)
+        self._add_upload_throughput_output(image_location)
         self.assertTrue(image)
         image_list = self.glance.list_images()
         self.assertIn(image.id, [i.id for i in image_list])
@@ -96,7 +133,7 @@ class CreateAndListImage(GlanceBasic):
 @validation.add("enum", param_name="disk_format",
                 values=["ami", "ari", "aki", "vhd", "vmdk", "raw",
                         "qcow2", "vdi", "iso"])
-@types.convert(image_location={"type": "path_or_url"},
+@types.convert(image_location={"type": "glance_image_location"},
                kwargs={"type": "glance_image_args"})
 @validation.add("required_services", services=[consts.Service.GLANCE])
 @validation.add("required_platform", platform="openstack", users=True)
@@ -111,7 +148,9 @@ class CreateAndGetImage(GlanceBasic):
 
         :param container_format: container format of image. Acceptable
                                  formats: ami, ari, aki, bare, and ovf
-        :param image_location: image file location
+        :param image_location: image file location or a dict which
+                               specifies data to generate in memory:
+                               size, pattern, randomize and seed
         :param disk_format: disk format of image. Acceptable formats:
                             ami, ari, aki, vhd, vmdk, raw, qcow2, vdi, and iso
         :param visibility: The access permission for the created image
@@ -128,6 +167,7 @@ class CreateAndGetImage(GlanceBasic):
             min_disk=min_disk,
             min_ram=min_ram,
             properties=properties)
+        self._add_upload_throughput_output(image_location)
         self.assertTrue(image)
         image_info = self.glance.get_image(image)
         self.assertEqual(image.id, image_info.id)
@@ -157,7 +197,7 @@ class ListImages(GlanceBasic):
 @validation.add("enum", param_name="disk_format",
                 values=["ami", "ari", "aki", "vhd", "vmdk", "raw",
                         "qcow2", "vdi", "iso"])
-@types.convert(image_location={"type": "path_or_url"},
+@types.convert(image_location={"type": "glance_image_location"},
                kwargs={"type": "glance_image_args"})
 @validation.add("required_services", services=[consts.Service.GLANCE])
 @validation.add("required_platform", platform="openstack", users=True)
@@ -172,7 +212,9 @@ class CreateAndDeleteImage(GlanceBasic):
 
         :param container_format: container format of image. Acceptable
                                  formats: ami, ari, aki, bare, and ovf
-        :param image_location: image file location
+        :param image_location: image file location or a dict which
+                               specifies data to generate in memory:
+                               size, pattern, randomize and seed
         :param disk_format: disk format of image. Acceptable formats:
                             ami, ari, aki, vhd, vmdk, raw, qcow2, vdi, and iso
         :param visibility: The access permission for the created image
@@ -189,11 +231,12 @@ class CreateAndDeleteImage(GlanceBasic):
             min_disk=min_disk,
             min_ram=min_ram,
             properties=properties)
+        self._add_upload_throughput_output(image_location)
         self.glance.delete_image(image.id)
 
 
 @types.convert(flavor={"type": "nova_flavor"},
-               image_location={"type": "path_or_url"},
+               image_location={"type": "glance_image_location"},
                kwargs={"type": "glance_image_args"})
 @validation.add("enum", param_name="container_format",
                 values=["ami", "ari", "aki", "bare", "ovf"])
@@ -217,7 +260,9 @@ class CreateImageAndBootInstances(GlanceBasic, nova_utils.NovaScenario):
 
         :param container_format: container format of image. Acceptable
                                  formats: ami, ari, aki, bare, and ovf
-        :param image_location: image file location
+        :param image_location: image file location or a dict which
+                               specifies data to generate in memory:
+                               size, pattern, randomize and seed
         :param disk_format: disk format of image. Acceptable formats:
                             ami, ari, aki, vhd, vmdk, raw, qcow2, vdi, and iso
         :param visibility: The access permission for the created image
@@ -238,6 +283,7 @@ class CreateImageAndBootInstances(GlanceBasic, nova_utils.NovaScenario):
             min_disk=min_disk,
             min_ram=min_ram,
             properties=properties)
+        self._add_upload_throughput_output(image_location)
 
         self._boot_servers(image.id, flavor, number_instances,
                            **(boot_server_kwargs or {}))
@@ -248,7 +294,7 @@ class CreateImageAndBootInstances(GlanceBasic, nova_utils.NovaScenario):
 @validation.add("enum", param_name="disk_format",
                 values=["ami", "ari", "aki", "vhd", "vmdk", "raw",
                         "qcow2", "vdi", "iso"])
-@types.convert(image_location={"type": "path_or_url"},
+@types.convert(image_location={"type": "glance_image_location"},
                kwargs={"type": "glance_image_args"})
 @validation.add("required_services", services=[consts.Service.GLANCE])
 @validation.add("required_platform", platform="openstack", users=True)
@@ -268,7 +314,9 @@ class CreateAndUpdateImage(GlanceBasic):
 
         :param container_format: container format of image. Acceptable
                                  formats: ami, ari, aki, bare, and ovf
-        :param image_location: image file location
+        :param image_location: image file location or a dict which
+                               specifies data to generate in memory:
+                               size, pattern, randomize and seed
         :param disk_format: disk format of image. Acceptable formats:
                             ami, ari, aki, vhd, vmdk, raw, qcow2, vdi, and iso
         :param remove_props: List of property names to remove.
@@ -289,6 +337,7 @@ class CreateAndUpdateImage(GlanceBasic):
             min_disk=create_min_disk,
             min_ram=create_min_ram,
             properties=create_properties)
+        self._add_upload_throughput_output(image_location)
 
         self.glance.update_image(image.id,
                                  min_disk=update_min_disk,
@@ -309,7 +358,9 @@ class CreateAndDeactivateImage(GlanceBasic):
 
         :param container_format: container format of image. Acceptable
                                  formats: ami, ari, aki, bare, and ovf
-        :param image_location: image file location
+        :param image_location: image file location or a dict which
+                               specifies data to generate in memory:
+                               size, pattern, randomize and seed
         :param disk_format: disk format of image. Acceptable formats:
                             ami, ari, aki, vhd, vmdk, raw, qcow2, vdi, and iso
         :param visibility: The access permission for the created image
@@ -327,6 +378,7 @@ class CreateAndDeactivateImage(GlanceBasic):
             visibility=visibility,
             min_disk=min_disk,
             min_ram=min_ram)
+        self._add_upload_throughput_output(image_location)
         service.deactivate_image(image.id)
 
 
@@ -335,7 +387,11 @@ class CreateAndDeactivateImage(GlanceBasic):
 @validation.add("enum", param_name="disk_format",
                 values=["ami", "ari", "aki", "vhd", "vmdk", "raw",
                         "qcow2", "vdi", "iso"])
-@types.convert(image_location={"type": "path_or_url"},
+@validation.add("enum", param_name="hash_algorithm",
+                values=sorted(a for a in hashlib.algorithms_available
+                              if not a.startswith("shake_")),
+                missed=True)
+@types.convert(image_location={"type": "glance_image_location"},
                kwargs={"type": "glance_image_args"})
 @validation.add("required_services", services=[consts.Service.GLANCE])
 @validation.add("required_platform", platform="openstack", users=True)
@@ -345,12 +401,18 @@ class CreateAndDeactivateImage(GlanceBasic):
 class CreateAndDownloadImage(GlanceBasic):
 
     def run(self, container_format, image_location, disk_format,
-            visibility="private", min_disk=0, min_ram=0, properties=None):
+            visibility="private", min_disk=0, min_ram=0, properties=None,
+            sink=None, chunk_size=65536, hash_algorithm=None):
         """Create an image, then download data of the image.
 
+        The whole image data is downloaded and the throughput of the
+        transfer is reported.
+
         :param container_format: container format of image. Acceptable
                                  formats: ami, ari, aki, bare, and ovf
-        :param image_location: image file location
+        :param image_location: image file location or a dict which
+                               specifies data to generate in memory:
+                               size, pattern, randomize and seed
         :param disk_format: disk format of image. Acceptable formats:
                             ami, ari, aki, vhd, vmdk, raw, qcow2, vdi, and iso
         :param visibility: The access permission for the created image
@@ -358,6 +420,14 @@ class CreateAndDownloadImage(GlanceBasic):
         :param min_ram: The min ram of created images
         :param properties: A dict of image metadata properties to set
                            on the image
+        :param sink: path of a directory to write downloaded data to. Data
+                     of every image is written to a file named after the
+                     image ID, so concurrent iterations do not write to
+                     the same file. Data is discarded by default.
+        :param chunk_size: size of buffer (in bytes) for writing data to the
+                           sink
+        :param hash_algorithm: name of hashlib algorithm (e.g. "sha256") to
+                               hash downloaded data with on the fly
         """
         image = self.glance.create_image(
             container_format=container_format,
@@ -367,5 +437,29 @@ class CreateAndDownloadImage(GlanceBasic):
             min_disk=min_disk,
             min_ram=min_ram,
             properties=properties)
-
-        self.glance.download_image(image.id)
+        self._add_upload_throughput_output(image_location)
+
+        if sink:
+            sink = os.path.join(sink, image.id)
+        result = self.glance.stream_image(image.id, sink=sink,
+                                          chunk_size=chunk_size,
+                                          hash_algorithm=hash_algorithm)
+        duration = result["duration"]
+        throughput = result["bytes"] / duration / 10 ** 6 if duration else 0
+        self.add_output(additive={
+            "title": "Image download throughput",
+            "description": "Throughput of downloading image data",
+            "chart_plugin": "Lines",
+            "data": [["MB/s", round(throughput, 3)]],
+            "label": "MB/s",
+            "axis_label": "Iteration"})
+        rows = [["bytes", result["bytes"]],
+                ["seconds", round(duration, 3)],
+                ["MB/s", round(throughput, 3)]]
+        if result["hash"]:
+            rows.append([hash_algorithm, result["hash"]])
+        self.add_output(complete={
+            "title": "Image download",
+            "description": "Details of downloaded image data",
+            "chart_plugin": "Table",
+            "data": {"cols": ["key", "value"], "rows": rows}})
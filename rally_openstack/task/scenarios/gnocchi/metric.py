@@ -12,6 +12,10 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import datetime as dt
+import random
+import time
+
 from rally.task import validation
 
 from rally_openstack.common import consts
@@ -71,3 +75,67 @@ class CreateDeleteMetric(gnocchiutils.GnocchiBase):
             name, archive_policy_name=archive_policy_name,
             resource_id=resource_id, unit=unit)
         self.gnocchi.delete_metric(metric["id"])
+
+
+@validation.add("number", param_name="metrics_count", minval=1,
+                integer_only=True, nullable=True)
+@validation.add("number", param_name="points_per_metric", minval=1,
+                integer_only=True, nullable=True)
+@validation.add("number", param_name="batch_size", minval=1,
+                integer_only=True, nullable=True)
+@validation.add("required_services", services=[consts.Service.GNOCCHI])
+@validation.add("required_platform", platform="openstack", users=True)
+@scenario.configure(context={"cleanup@openstack": ["gnocchi.metric"]},
+                    name="GnocchiMetric.batch_push_measures")
+class BatchPushMeasures(gnocchiutils.GnocchiBase):
+
+    def run(self, metrics_count=10, points_per_metric=1000, batch_size=100,
+            interval=1, archive_policy_name="low", aggregation="mean"):
+        """Create metrics, push measures in batches and aggregate them.
+
+        Every batch request carries batch_size points of each of the
+        metrics. The ingestion rate (points per second) is reported
+        separately from the latency of the aggregation query.
+
+        :param metrics_count: Number of metrics to create
+        :param points_per_metric: Number of points to push to every metric
+        :param batch_size: Number of points of every metric in a request
+        :param interval: Interval between timestamps of points in seconds
+        :param archive_policy_name: Archive policy name
+        :param aggregation: Aggregation to query after pushing measures
+        """
+        metrics = [
+            self.gnocchi.create_metric(
+                self.generate_random_name(),
+                archive_policy_name=archive_policy_name)["id"]
+            for i in range(metrics_count)]
+
+        start = time.time() - points_per_metric * interval
+        timestamps = [
+            dt.datetime.fromtimestamp(
+                start + i * interval, dt.timezone.utc).isoformat()
+            for i in range(points_per_metric)]
+
+        duration = 0
+        for offset in range(0, points_per_metric, batch_size):
+            batch = timestamps[offset:offset + batch_size]
+            measures = dict(
+                (metric_id, [{"timestamp": ts, "value": random.random()}
+                             for ts in batch])
+                for metric_id in metrics)
+            started_at = time.time()
+            self.gnocchi.batch_metrics_measures(measures)
+            duration += time.time() - started_at
+
+        if duration:
+            self.add_output(additive={
+                "title": "Ingestion rate",
+                "description": "Number of points pushed per second",
+                "chart_plugin": "Lines",
+                "data": [["points/s", round(
+                    metrics_count * points_per_metric / duration, 3)]],
+                "label": "points/s",
+                "axis_label": "Iteration"})
+
+        self.gnocchi.get_measures_aggregation(
+            metrics, aggregation=aggregation, refresh=True)
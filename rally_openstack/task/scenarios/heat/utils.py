@@ -13,6 +13,9 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import datetime as dt
+import time
+
 from rally.common import cfg
 from rally.common import logging
 from rally import exceptions
@@ -67,6 +70,12 @@ class HeatScenario(scenario.OpenStackScenario):
 
         self.sleep_between(CONF.openstack.heat_stack_create_prepoll_delay)
 
+        if CONF.openstack.heat_stack_wait_for_events:
+            return self._wait_for_stack_events(
+                stack, "CREATE",
+                timeout=CONF.openstack.heat_stack_create_timeout,
+                check_interval=CONF.openstack.heat_stack_create_poll_interval)
+
         stack = utils.wait_for_status(
             stack,
             ready_statuses=["CREATE_COMPLETE"],
@@ -99,10 +108,23 @@ class HeatScenario(scenario.OpenStackScenario):
             "files": files or {},
             "environment": environment or {}
         }
+        marker = None
+        if CONF.openstack.heat_stack_wait_for_events:
+            # NOTE: events which happened before the update are skipped
+            last_events = self.clients("heat").events.list(
+                stack.id, sort_dir="desc", limit=1)
+            marker = last_events[0].id if last_events else None
+
         self.clients("heat").stacks.update(stack.id, **kw)
 
         self.sleep_between(CONF.openstack.heat_stack_update_prepoll_delay)
 
+        if CONF.openstack.heat_stack_wait_for_events:
+            return self._wait_for_stack_events(
+                stack, "UPDATE", marker=marker,
+                timeout=CONF.openstack.heat_stack_update_timeout,
+                check_interval=CONF.openstack.heat_stack_update_poll_interval)
+
         stack = utils.wait_for_status(
             stack,
             ready_statuses=["UPDATE_COMPLETE"],
@@ -112,6 +134,87 @@ class HeatScenario(scenario.OpenStackScenario):
             check_interval=CONF.openstack.heat_stack_update_poll_interval)
         return stack
 
+    @staticmethod
+    def _parse_event_time(event_time):
+        return dt.datetime.fromisoformat(
+            event_time.replace("Z", "+00:00")).timestamp()
+
+    def _wait_for_stack_events(self, stack, action, timeout, check_interval,
+                               marker=None):
+        """Wait for a stack action to complete by following stack events.
+
+        Unlike polling the stack, which returns the whole stack document
+        every time, only new events are fetched on each check. Durations of
+        the action for separate resources are reported as a table. They are
+        calculated from times of events, which come from the clock of Heat,
+        so they are not mixed with atomic actions measured locally.
+
+        :param stack: stack to wait for
+        :param action: stack action, like "CREATE" or "UPDATE"
+        :param timeout: timeout in seconds
+        :param check_interval: interval in seconds between checks
+        :param marker: ID of the last event to ignore
+        :returns: updated stack
+        """
+        heat = self.clients("heat")
+        started_at = {}
+        resources = []
+        status = None
+        deadline = time.time() + timeout
+        while True:
+            events = heat.events.list(stack.id, marker=marker, sort_dir="asc")
+            while events:
+                for event in events:
+                    marker = event.id
+                    name = event.resource_name
+                    if event.physical_resource_id == stack.id:
+                        if event.resource_status in ("%s_COMPLETE" % action,
+                                                     "%s_FAILED" % action):
+                            status = event.resource_status
+                            reason = event.resource_status_reason
+                    elif event.resource_status == "%s_IN_PROGRESS" % action:
+                        started_at[name] = self._parse_event_time(
+                            event.event_time)
+                    elif (event.resource_status == "%s_COMPLETE" % action
+                          and name in started_at):
+                        resources.append(
+                            (name, started_at.pop(name),
+                             self._parse_event_time(event.event_time)))
+                events = heat.events.list(stack.id, marker=marker,
+                                          sort_dir="asc")
+
+            if status is not None:
+                break
+            if time.time() > deadline:
+                raise exceptions.TimeoutException(
+                    desired_status="%s_COMPLETE" % action,
+                    resource_name=stack.stack_name,
+                    resource_type=stack.__class__.__name__,
+                    resource_id=stack.id,
+                    resource_status="%s_IN_PROGRESS" % action,
+                    timeout=timeout)
+            time.sleep(check_interval)
+
+        if resources:
+            first_started = min(started for name, started, finished
+                                in resources)
+            self.add_output(complete={
+                "title": "Stack %s resource timings" % action.lower(),
+                "description": "Times of resources relative to the first "
+                               "one, according to stack events",
+                "chart_plugin": "Table",
+                "data": {"cols": ["resource", "started at (s)",
+                                  "duration (s)"],
+                         "rows": [[name, round(started - first_started, 3),
+                                   round(finished - started, 3)]
+                                  for name, started, finished
+                                  in resources]}})
+
+        if status == "%s_FAILED" % action:
+            raise exceptions.GetResourceErrorStatus(
+                resource=stack, status=status, fault=reason)
+        return heat.stacks.get(stack.id)
+
     @atomic.action_timer("heat.check_stack")
     def _check_stack(self, stack):
         """Check given stack.
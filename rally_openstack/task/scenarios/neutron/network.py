@@ -728,6 +728,91 @@ class CreateAndBindPorts(utils.NeutronBaseScenario):
                 )
 
 
+@validation.add("restricted_parameters",
+                param_names="name",
+                subdict="network_create_args")
+@validation.add("number", param_name="batch_size", minval=1,
+                integer_only=True)
+@validation.add("required_services",
+                services=[consts.Service.NEUTRON])
+@validation.add("required_platform", platform="openstack", users=True)
+@scenario.configure(context={"cleanup@openstack": ["neutron"]},
+                    name="NeutronNetworks.bulk_create_networks",
+                    platform="openstack")
+class BulkCreateNetworks(utils.NeutronBaseScenario):
+
+    def run(self, batch_size=10, network_create_args=None):
+        """Create a given number of networks with a single request.
+
+        :param batch_size: int, number of networks to create at once
+        :param network_create_args: dict, POST /v2.0/networks request options
+        """
+        self.neutron.create_networks(count=batch_size,
+                                     **(network_create_args or {}))
+
+
+@validation.add("restricted_parameters",
+                param_names="name",
+                subdict="network_create_args")
+@validation.add("restricted_parameters",
+                param_names=["name", "cidr"],
+                subdict="subnet_create_args")
+@validation.add("number", param_name="batch_size", minval=1,
+                integer_only=True)
+@validation.add("required_services",
+                services=[consts.Service.NEUTRON])
+@validation.add("required_platform", platform="openstack", users=True)
+@scenario.configure(context={"cleanup@openstack": ["neutron"]},
+                    name="NeutronNetworks.bulk_create_subnets",
+                    platform="openstack")
+class BulkCreateSubnets(utils.NeutronBaseScenario):
+
+    def run(self, batch_size=10, network_create_args=None,
+            subnet_create_args=None, subnet_cidr_start=None):
+        """Create a network and a given number of its subnets at once.
+
+        :param batch_size: int, number of subnets to create at once
+        :param network_create_args: dict, POST /v2.0/networks request
+                                    options. Deprecated
+        :param subnet_create_args: dict, POST /v2.0/subnets request options
+        :param subnet_cidr_start: str, start value for subnets CIDR
+        """
+        network = self._get_or_create_network(**(network_create_args or {}))
+        self.neutron.create_subnets([network["id"]] * batch_size,
+                                    start_cidr=subnet_cidr_start,
+                                    **(subnet_create_args or {}))
+
+
+@validation.add("restricted_parameters",
+                param_names="name",
+                subdict="network_create_args")
+@validation.add("restricted_parameters",
+                param_names="name",
+                subdict="port_create_args")
+@validation.add("number", param_name="batch_size", minval=1,
+                integer_only=True)
+@validation.add("required_services",
+                services=[consts.Service.NEUTRON])
+@validation.add("required_platform", platform="openstack", users=True)
+@scenario.configure(context={"cleanup@openstack": ["neutron"]},
+                    name="NeutronNetworks.bulk_create_ports",
+                    platform="openstack")
+class BulkCreatePorts(utils.NeutronBaseScenario):
+
+    def run(self, batch_size=10, network_create_args=None,
+            port_create_args=None):
+        """Create a given number of ports with a single request.
+
+        :param batch_size: int, number of ports to create at once
+        :param network_create_args: dict, POST /v2.0/networks request
+                                    options. Deprecated.
+        :param port_create_args: dict, POST /v2.0/ports request options
+        """
+        network = self._get_or_create_network(**(network_create_args or {}))
+        self.neutron.create_ports(network["id"], count=batch_size,
+                                  **(port_create_args or {}))
+
+
 @validation.add("required_services",
                 services=[consts.Service.NEUTRON])
 @validation.add("required_platform", platform="openstack", users=True)
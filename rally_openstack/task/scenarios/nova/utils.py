@@ -13,6 +13,8 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import re
+import time
 
 from rally.common import cfg
 from rally.common import logging
@@ -88,6 +90,92 @@ def list_servers(client, detailed=True):
     return all_servers
 
 
+class ServersPoller(object):
+    """Incremental poller of nova servers which share a name prefix.
+
+    The names are filtered on the server side and every poll after the first
+    one asks only for servers changed since the latest seen ``updated``
+    timestamp (``changes-since`` filter), so the cost of a poll does not
+    depend on the number of servers that already exist in the project.
+    """
+
+    def __init__(self, client, name_prefix, search_opts=None):
+        """Init poller.
+
+        :param client: novaclient instance
+        :param name_prefix: prefix of names of servers to track
+        :param search_opts: additional filters to pass to the servers list
+        """
+        self.client = client
+        self.name_prefix = name_prefix
+        self.search_opts = dict(search_opts or {})
+        self.changes_since = None
+        self.servers = {}
+
+    def poll(self):
+        """Fetch servers changed since the previous poll.
+
+        :returns: list of servers returned by this poll
+        """
+        search_opts = dict(self.search_opts,
+                           name="^%s" % re.escape(self.name_prefix))
+        if self.changes_since:
+            search_opts["changes-since"] = self.changes_since
+        servers = self.client.servers.list(search_opts=search_opts)
+        for server in servers:
+            self.servers[server.id] = server
+            updated = getattr(server, "updated", None)
+            if isinstance(updated, str) and (
+                    self.changes_since is None
+                    or updated > self.changes_since):
+                self.changes_since = updated
+        return servers
+
+    def wait_for_status(self, count, ready_statuses,
+                        failure_statuses=("ERROR",), timeout=60,
+                        check_interval=1):
+        """Wait until all the tracked servers reach one of ready statuses.
+
+        :param count: number of servers expected to be found
+        :param ready_statuses: statuses considered as ready
+        :param failure_statuses: statuses considered as failed
+        :param timeout: timeout in seconds
+        :param check_interval: interval in seconds between polls
+        :returns: list of tracked servers
+        """
+        ready_statuses = {s.upper() for s in ready_statuses}
+        failure_statuses = {s.upper() for s in failure_statuses or []}
+        start = time.time()
+        while True:
+            self.poll()
+            servers = list(self.servers.values())
+            pending = []
+            for server in servers:
+                status = utils.get_status(server)
+                if status in failure_statuses:
+                    raise exceptions.GetResourceErrorStatus(
+                        resource=server, status=status,
+                        fault="Status in failure list %s"
+                              % str(failure_statuses))
+                if status not in ready_statuses:
+                    pending.append(server)
+            if len(servers) >= count and not pending:
+                return servers
+
+            time.sleep(check_interval)
+            if time.time() - start > timeout:
+                server = pending[0] if pending else None
+                raise exceptions.TimeoutException(
+                    desired_status="('%s')" % "', '".join(ready_statuses),
+                    resource_name=self.name_prefix,
+                    resource_type="Server",
+                    resource_id=getattr(server, "id", "<no id>"),
+                    resource_status=(utils.get_status(server) if server
+                                     else "%s of %s servers found"
+                                     % (len(servers), count)),
+                    timeout=timeout)
+
+
 class NovaScenario(neutron_utils.NeutronBaseScenario,
                    scenario.OpenStackScenario):
     """Base class for Nova scenarios with basic atomic actions."""
@@ -653,10 +741,17 @@ class NovaScenario(neutron_utils.NeutronBaseScenario,
         :param requests: Number of booting requests to perform
         :param instances_amount: Number of instances to boot per each request
         :param auto_assign_nic: bool, whether or not to auto assign NICs
-        :param kwargs: other optional parameters to initialize the servers
+        :param kwargs: other optional parameters to initialize the servers.
+            "reservation_id" is ignored, since servers are always discovered
+            by reservation IDs which Nova returns.
 
         :returns: List of created server objects
         """
+        if "reservation_id" in kwargs:
+            LOG.warning("reservation_id argument of servers is ignored, "
+                        "it is always requested to discover the servers.")
+            kwargs.pop("reservation_id")
+
         if auto_assign_nic and not kwargs.get("nics", False):
             nic = self._pick_random_nic()
             if nic:
@@ -668,27 +763,35 @@ class NovaScenario(neutron_utils.NeutronBaseScenario,
 
         name_prefix = self.generate_random_name()
         with atomic.ActionTimer(self, "nova.boot_servers"):
+            reservation_ids = []
             for i in range(requests):
-                self.clients("nova").servers.create(
+                reservation_ids.append(self.clients("nova").servers.create(
                     "%s_%d" % (name_prefix, i),
                     image_id, flavor_id,
                     min_count=instances_amount,
                     max_count=instances_amount,
-                    **kwargs)
+                    reservation_id=True,
+                    **kwargs))
             # NOTE(msdubov): Nova python client returns only one server even
             #                when min_count > 1, so we have to rediscover
             #                all the created servers manually.
-            servers = [s for s in self.clients("nova").servers.list()
-                       if s.name.startswith(name_prefix)]
+            # NOTE: servers are rediscovered by reservation ID of a request,
+            #   which is the only thing Nova returns with reservation_id=True.
+            #   The API accepts a single reservation ID per query, so there is
+            #   a poller per request.
             self.sleep_between(CONF.openstack.nova_server_boot_prepoll_delay)
-            servers = [utils.wait_for_status(
-                server,
-                ready_statuses=["ACTIVE"],
-                update_resource=utils.
-                get_from_manager(),
-                timeout=CONF.openstack.nova_server_boot_timeout,
-                check_interval=CONF.openstack.nova_server_boot_poll_interval
-            ) for server in servers]
+            deadline = time.time() + CONF.openstack.nova_server_boot_timeout
+            servers = []
+            for reservation_id in reservation_ids:
+                poller = ServersPoller(
+                    self.clients("nova"), name_prefix,
+                    search_opts={"reservation_id": reservation_id})
+                servers.extend(poller.wait_for_status(
+                    instances_amount,
+                    ready_statuses=["ACTIVE"],
+                    timeout=max(deadline - time.time(), 0),
+                    check_interval=(
+                        CONF.openstack.nova_server_boot_poll_interval)))
         return servers
 
     @atomic.action_timer("nova.associate_floating_ip")
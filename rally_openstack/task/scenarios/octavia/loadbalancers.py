@@ -13,6 +13,11 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import ipaddress
+import itertools
+
+from rally import exceptions
+from rally.task import atomic
 from rally.task import validation
 
 from rally_openstack.common import consts
@@ -249,3 +254,100 @@ class CreateAndShowLoadBalancers(octavia_utils.OctaviaBase):
             self.octavia.wait_for_loadbalancer_prov_status(loadbalancer)
             self.octavia.load_balancer_show(
                 loadbalancer["id"])
+
+
+@validation.add("number", param_name="members_count", minval=1,
+                integer_only=True)
+@validation.add("required_services", services=[consts.Service.OCTAVIA])
+@validation.add("required_platform", platform="openstack", users=True)
+@validation.add("required_contexts", contexts=["network"])
+@scenario.configure(context={"cleanup@openstack": ["octavia"]},
+                    name="Octavia.create_loadbalancer_with_members",
+                    platform="openstack")
+class CreateLoadBalancerWithMembers(octavia_utils.OctaviaBase):
+
+    def run(self, members_count=10, protocol="HTTP", protocol_port=80,
+            lb_algorithm="ROUND_ROBIN", member_port=80,
+            healthmonitor_type="HTTP", healthmonitor_delay=5,
+            healthmonitor_timeout=3, healthmonitor_max_retries=3,
+            flavor_id=None, provider=None):
+        """Create a loadbalancer with a listener, pool, monitor and members.
+
+        Members are added to the pool with a single batch update, since every
+        change of a member puts the loadbalancer into PENDING_UPDATE status.
+        Each phase (loadbalancer, listener, pool, health monitor and members)
+        is reported as a separate atomic action which includes waiting for
+        the loadbalancer to become ACTIVE again, so it is possible to see how
+        provisioning scales with the number of members.
+
+        Addresses of members are taken from the first subnet of the tenant,
+        they do not need to belong to real servers.
+
+        :param members_count: number of members of the pool
+        :param protocol: protocol of the listener and the pool
+        :param protocol_port: port of the listener
+        :param lb_algorithm: loadbalancer algorithm of the pool
+        :param member_port: port of members
+        :param healthmonitor_type: type of the health monitor
+        :param healthmonitor_delay: interval in seconds between probes
+        :param healthmonitor_timeout: timeout in seconds of a probe
+        :param healthmonitor_max_retries: number of successful probes before
+            changing the status of a member to ONLINE
+        :param flavor_id: The ID of the flavor
+        :param provider: Provider name for the loadbalancer
+        """
+        subnets = self.context["tenant"].get("subnets", [])
+        subnet = next((s for s in subnets if s.get("ip_version", 4) == 4),
+                      None)
+        if subnet is None:
+            raise exceptions.RallyException(
+                "There is no IPv4 subnet in the tenant to take addresses of "
+                "members from.")
+        # NOTE: skip a few first addresses which are usually taken by the
+        #   gateway, DHCP ports and the VIP
+        addresses = list(itertools.islice(
+            ipaddress.ip_network(subnet["cidr"]).hosts(),
+            10, 10 + members_count))
+        if len(addresses) < members_count:
+            raise exceptions.RallyException(
+                "Subnet %s is too small for %s members."
+                % (subnet["cidr"], members_count))
+
+        with atomic.ActionTimer(self, "octavia.provision_loadbalancer"):
+            lb = self.octavia.load_balancer_create(
+                subnet_id=subnet["id"],
+                project_id=self.context["tenant"]["id"],
+                flavor_id=flavor_id,
+                provider=provider)
+            self.octavia.wait_for_loadbalancer_prov_status(lb)
+
+        with atomic.ActionTimer(self, "octavia.provision_listener"):
+            listener = self.octavia.listener_create(json={"listener": {
+                "name": self.generate_random_name(),
+                "loadbalancer_id": lb["id"],
+                "protocol": protocol,
+                "protocol_port": protocol_port}})["listener"]
+            self.octavia.wait_for_loadbalancer_prov_status(lb)
+
+        with atomic.ActionTimer(self, "octavia.provision_pool"):
+            pool = self.octavia.pool_create(
+                lb_id=lb["id"], protocol=protocol, lb_algorithm=lb_algorithm,
+                listener_id=listener["id"])
+            self.octavia.wait_for_loadbalancer_prov_status(lb)
+
+        with atomic.ActionTimer(self, "octavia.provision_health_monitor"):
+            self.octavia.health_monitor_create(json={"healthmonitor": {
+                "name": self.generate_random_name(),
+                "pool_id": pool["id"],
+                "type": healthmonitor_type,
+                "delay": healthmonitor_delay,
+                "timeout": healthmonitor_timeout,
+                "max_retries": healthmonitor_max_retries}})
+            self.octavia.wait_for_loadbalancer_prov_status(lb)
+
+        members = [{"address": str(address),
+                    "protocol_port": member_port,
+                    "subnet_id": subnet["id"]} for address in addresses]
+        with atomic.ActionTimer(self, "octavia.provision_members"):
+            self.octavia.member_batch_update(pool["id"], members=members)
+            self.octavia.wait_for_loadbalancer_prov_status(lb)
@@ -13,7 +13,9 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import os
 import tempfile
+import time
 
 from rally.task import validation
 
@@ -110,8 +112,12 @@ class CreateContainerAndObjectThenDownloadObject(utils.SwiftScenario):
                                                   dummy_file)[1]
                 objects_list.append(object_name)
 
+        started_at = time.time()
+        size = 0
         for object_name in objects_list:
-            self._download_object(container_name, object_name)
+            size += self._download_object(container_name, object_name)[1]
+        self._add_throughput_output("Download", size,
+                                    time.time() - started_at)
 
 
 @validation.add("required_services", services=[consts.Service.SWIFT])
@@ -150,6 +156,100 @@ class ListAndDownloadObjectsInContainers(utils.SwiftScenario):
             objects_dict[container_name] = self._list_objects(
                 container_name)[1]
 
+        started_at = time.time()
+        size = 0
         for container_name, objects in objects_dict.items():
             for obj in objects:
-                self._download_object(container_name, obj["name"])
+                size += self._download_object(container_name,
+                                              obj["name"])[1]
+        self._add_throughput_output("Download", size,
+                                    time.time() - started_at)
+
+
+@validation.add("number", param_name="object_size", minval=1,
+                integer_only=True, nullable=True)
+@validation.add("number", param_name="segment_size", minval=1,
+                integer_only=True, nullable=True)
+@validation.add("number", param_name="workers", minval=1, integer_only=True,
+                nullable=True)
+@validation.add("required_services", services=[consts.Service.SWIFT])
+@validation.add("required_platform", platform="openstack", users=True)
+@scenario.configure(
+    context={"cleanup@openstack": ["swift"]},
+    name="SwiftObjects.create_container_and_large_object",
+    platform="openstack")
+class CreateContainerAndLargeObject(utils.SwiftScenario):
+
+    def run(self, object_size=104857600, segment_size=10485760, workers=4,
+            **kwargs):
+        """Create container and upload Static Large Object into it.
+
+        Segments are uploaded in parallel from a single in-memory buffer
+        and then joined by SLO manifest.
+
+        :param object_size: int, size of the object in bytes
+        :param segment_size: int, size of a segment in bytes
+        :param workers: int, number of segments to upload simultaneously
+        :param kwargs: dict, optional parameters to create container
+        """
+        container_name = self._create_container(**kwargs)
+        started_at = time.time()
+        durations = self._upload_large_object(
+            container_name, object_size, segment_size, workers=workers)[1]
+        self._add_large_object_output("Upload", object_size, durations,
+                                      time.time() - started_at)
+
+
+@validation.add("number", param_name="object_size", minval=1,
+                integer_only=True, nullable=True)
+@validation.add("number", param_name="segment_size", minval=1,
+                integer_only=True, nullable=True)
+@validation.add("number", param_name="range_size", minval=1,
+                integer_only=True, nullable=True)
+@validation.add("number", param_name="workers", minval=1, integer_only=True,
+                nullable=True)
+@validation.add("required_services", services=[consts.Service.SWIFT])
+@validation.add("required_platform", platform="openstack", users=True)
+@scenario.configure(
+    context={"cleanup@openstack": ["swift"]},
+    name="SwiftObjects.create_container_and_large_object_then_download_object",
+    platform="openstack")
+class CreateContainerAndLargeObjectThenDownloadObject(utils.SwiftScenario):
+
+    def run(self, object_size=104857600, segment_size=10485760,
+            range_size=None, workers=4, sink=None, chunk_size=65536,
+            **kwargs):
+        """Upload Static Large Object, then download it with range requests.
+
+        Segments are uploaded in parallel from a single in-memory buffer,
+        then the object is downloaded by parallel range requests, which
+        responses are streamed to the sink.
+
+        :param object_size: int, size of the object in bytes
+        :param segment_size: int, size of a segment in bytes
+        :param range_size: int, size of a range to download with a single
+                           request. Defaults to segment_size.
+        :param workers: int, number of segments to upload and ranges to
+                        download simultaneously
+        :param sink: path to a directory to write the object to. The object
+                     is saved to a file named after it, so that concurrent
+                     iterations do not write to the same file. The data is
+                     discarded if it is not set.
+        :param chunk_size: int, size of chunks to read responses by
+        :param kwargs: dict, optional parameters to create container
+        """
+        container_name = self._create_container(**kwargs)
+        started_at = time.time()
+        object_name, durations = self._upload_large_object(
+            container_name, object_size, segment_size, workers=workers)
+        self._add_large_object_output("Upload", object_size, durations,
+                                      time.time() - started_at)
+
+        started_at = time.time()
+        durations = self._download_object_ranges(
+            container_name, object_name, object_size,
+            range_size or segment_size, workers=workers,
+            sink=os.path.join(sink, object_name) if sink else None,
+            chunk_size=chunk_size)
+        self._add_large_object_output("Download", object_size, durations,
+                                      time.time() - started_at)
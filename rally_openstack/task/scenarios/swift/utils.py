@@ -13,9 +13,17 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import json
+import os
+import threading
+import time
+from urllib import parse
+
+from rally import exceptions
 from rally.task import atomic
 
 from rally_openstack.task import scenario
+from rally_openstack.task import utils as task_utils
 
 
 class SwiftScenario(scenario.OpenStackScenario):
@@ -92,18 +100,31 @@ class SwiftScenario(scenario.OpenStackScenario):
                 object_name)
 
     @atomic.action_timer("swift.download_object")
-    def _download_object(self, container_name, object_name, **kwargs):
+    def _download_object(self, container_name, object_name, chunk_size=65536,
+                         **kwargs):
         """Download object from container.
 
+        The object is read by chunks and discarded, so memory usage does not
+        depend on the object size. Time to the first byte is recorded as a
+        separate atomic action.
+
         :param container_name: str, name of the container to download object
                                from
         :param object_name: str, name of the object to download
+        :param chunk_size: int, size of chunks to read the object by
         :param kwargs: dict, other optional parameters to get_object
 
-        :returns: tuple, (dict of response headers, the object's contents)
+        :returns: tuple, (dict of response headers, size of the object's
+                  contents in bytes)
         """
-        return self.clients("swift").get_object(container_name, object_name,
-                                                **kwargs)
+        with atomic.ActionTimer(self, "swift.download_object_first_byte"):
+            headers, body = self.clients("swift").get_object(
+                container_name, object_name, resp_chunk_size=chunk_size,
+                **kwargs)
+            size = len(next(body, b""))
+        for chunk in body:
+            size += len(chunk)
+        return headers, size
 
     @atomic.action_timer("swift.delete_object")
     def _delete_object(self, container_name, object_name, **kwargs):
@@ -115,3 +136,187 @@ class SwiftScenario(scenario.OpenStackScenario):
         """
         self.clients("swift").delete_object(container_name, object_name,
                                             **kwargs)
+
+    @atomic.action_timer("swift.bulk_delete_objects")
+    def _bulk_delete_objects(self, container_name, object_names):
+        """Delete several objects of a container with a single request.
+
+        Requires the bulk middleware to be enabled in the Swift proxy, see
+        `bulk_delete` capability.
+
+        :param container_name: str, name of the container to delete objects
+                               from
+        :param object_names: list of names of objects to delete
+        :returns: list of names of deleted (or already missing) objects
+        """
+        data = "\n".join(
+            parse.quote("/%s/%s" % (container_name, object_name))
+            for object_name in object_names)
+        headers, body = self.clients("swift").post_account(
+            headers={"Content-Type": "text/plain",
+                     "Accept": "application/json"},
+            query_string="bulk-delete", data=data.encode("utf-8"))
+        result = json.loads(body)
+        prefix = "/%s/" % container_name
+        failed = set(parse.unquote(path)[len(prefix):]
+                     for path, status in result.get("Errors", []))
+        return [name for name in object_names if name not in failed]
+
+    def _thread_swift_client(self, local, created):
+        """Return a swift connection dedicated to the current thread.
+
+        swiftclient.Connection keeps a single HTTP connection, so it can not
+        be shared between threads.
+
+        :param local: threading.local object which keeps the connection
+        :param created: list to which a newly created connection is added
+        """
+        client = getattr(local, "swift", None)
+        if client is None:
+            client = local.swift = self._clients.swift.create_client()
+            created.append(client)
+        return client
+
+    def _run_in_threads(self, func, items, workers):
+        """Call func(client, item) for all items using per-thread clients.
+
+        :returns: list of results of func in the order of items
+        """
+        local = threading.local()
+        created = []
+        try:
+            results, failures = task_utils.run_concurrently(
+                lambda item: func(self._thread_swift_client(local, created),
+                                  item),
+                items, workers=workers)
+        finally:
+            for client in created:
+                client.close()
+        if failures:
+            raise exceptions.RallyException(
+                "%d of %d request(s) failed: %s"
+                % (len(failures), len(results),
+                   task_utils.format_failures(failures)))
+        return results
+
+    def _upload_large_object(self, container_name, object_size, segment_size,
+                             workers=4):
+        """Upload Static Large Object with segments uploaded in parallel.
+
+        Segments are stored in the same container as the manifest, as
+        "<object name>/<segment number>", and all of them are uploaded from
+        the same in-memory buffer.
+
+        :param container_name: str, name of the container to upload to
+        :param object_size: int, size of the object in bytes
+        :param segment_size: int, size of a segment in bytes
+        :param workers: int, number of segments to upload simultaneously
+        :returns: tuple, (object name, list of upload durations of segments)
+        """
+        object_name = self.generate_random_name()
+        buf = b"\0" * min(segment_size, object_size)
+        segments = [
+            ("%s/%08d" % (object_name, i), offset,
+             min(segment_size, object_size - offset))
+            for i, offset in enumerate(range(0, object_size, segment_size))]
+
+        def upload(client, segment):
+            name, offset, size = segment
+            started_at = time.time()
+            etag = client.put_object(
+                container_name, name,
+                buf if size == len(buf) else buf[:size],
+                content_length=size)
+            return {"path": "/%s/%s" % (container_name, name),
+                    "etag": etag, "size_bytes": size,
+                    "duration": time.time() - started_at}
+
+        with atomic.ActionTimer(self, "swift.upload_segments"):
+            uploaded = self._run_in_threads(upload, segments, workers)
+
+        manifest = [dict((k, v) for k, v in s.items() if k != "duration")
+                    for s in uploaded]
+        with atomic.ActionTimer(self, "swift.put_slo_manifest"):
+            self.clients("swift").put_object(
+                container_name, object_name, json.dumps(manifest),
+                query_string="multipart-manifest=put",
+                headers={"Content-Type": "application/json"})
+        return object_name, [s["duration"] for s in uploaded]
+
+    def _add_throughput_output(self, title, size, duration):
+        """Report throughput of a data transfer.
+
+        :param title: str, name of the operation
+        :param size: int, number of transferred bytes
+        :param duration: float, duration of the transfer
+        """
+        if duration:
+            self.add_output(additive={
+                "title": "%s throughput" % title,
+                "description": "Amount of transferred data per second",
+                "chart_plugin": "Lines",
+                "data": [["MB/s", round(size / duration / 10 ** 6, 3)]],
+                "label": "MB/s",
+                "axis_label": "Iteration"})
+
+    def _add_large_object_output(self, title, object_size, durations,
+                                 duration):
+        """Report throughput and latencies of segments of a large object.
+
+        :param title: str, name of the operation
+        :param object_size: int, size of the object in bytes
+        :param durations: list of durations of requests for segments
+        :param duration: float, duration of the whole operation
+        """
+        self._add_throughput_output(title, object_size, duration)
+        self.add_output(additive={
+            "title": "%s latency of segments" % title,
+            "description": "Duration of requests for separate segments",
+            "chart_plugin": "StatsTable",
+            "data": [["segment", d] for d in durations]})
+
+    @atomic.action_timer("swift.download_object_ranges")
+    def _download_object_ranges(self, container_name, object_name,
+                                object_size, range_size, workers=4,
+                                sink=None, chunk_size=65536):
+        """Download object with parallel range requests.
+
+        :param container_name: str, name of the container to download from
+        :param object_name: str, name of the object to download
+        :param object_size: int, size of the object in bytes
+        :param range_size: int, size of a range requested at once
+        :param workers: int, number of ranges to download simultaneously
+        :param sink: path to a file to write the object to. The data is
+                     discarded if it is not set.
+        :param chunk_size: int, size of chunks to read responses by
+        :returns: list of download durations of ranges
+        """
+        ranges = [(start, min(start + range_size, object_size) - 1)
+                  for start in range(0, object_size, range_size)]
+        fd = None
+        if sink:
+            fd = os.open(sink, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+
+        def download(client, byte_range):
+            start, end = byte_range
+            started_at = time.time()
+            body = client.get_object(
+                container_name, object_name,
+                headers={"Range": "bytes=%d-%d" % (start, end)},
+                resp_chunk_size=chunk_size)[1]
+            offset = start
+            for chunk in body:
+                if fd is not None:
+                    os.pwrite(fd, chunk, offset)
+                offset += len(chunk)
+            if offset != end + 1:
+                raise exceptions.RallyException(
+                    "Got %d bytes instead of %d for range %d-%d"
+                    % (offset - start, end - start + 1, start, end))
+            return time.time() - started_at
+
+        try:
+            return self._run_in_threads(download, ranges, workers)
+        finally:
+            if fd is not None:
+                os.close(fd)
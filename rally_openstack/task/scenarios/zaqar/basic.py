@@ -13,11 +13,17 @@
 # under the License.
 
 import random
+import threading
+import time
 
 from rally.common import logging
+from rally import exceptions
+from rally.task import atomic
+from rally.task import validation
 
 from rally_openstack.task import scenario
 from rally_openstack.task.scenarios.zaqar import utils as zutils
+from rally_openstack.task import utils as task_utils
 
 
 """Scenarios for Zaqar."""
@@ -66,3 +72,156 @@ class ProducerConsumer(zutils.ZaqarScenario):
         self._messages_post(queue, messages, min_msg_count, max_msg_count)
         self._messages_list(queue)
         self._queue_delete(queue)
+
+
+@validation.add("number", param_name="messages_count", minval=1,
+                integer_only=True, nullable=True)
+@validation.add("number", param_name="batch_size", minval=1,
+                integer_only=True, nullable=True)
+@validation.add("number", param_name="message_size", minval=0,
+                integer_only=True, nullable=True)
+@validation.add("number", param_name="producers", minval=1,
+                integer_only=True, nullable=True)
+@validation.add("number", param_name="consumers", minval=1,
+                integer_only=True, nullable=True)
+@validation.add("number", param_name="poll_interval", minval=0,
+                nullable=True)
+@scenario.configure(context={"cleanup@openstack": ["zaqar"]},
+                    name="ZaqarBasic.producer_consumer_throughput",
+                    platform="openstack")
+class ProducerConsumerThroughput(zutils.ZaqarScenario):
+
+    def _produce(self, queue, batches, message_size, ttl):
+        """Post batches of messages with the current time embedded."""
+        payload = "x" * message_size
+        for count in batches:
+            self._messages_post_batch(
+                queue, [{"body": {"sent_at": time.time(),
+                                  "payload": payload},
+                         "ttl": ttl} for i in range(count)])
+
+    def _consume(self, queue, state, batch_size, claim_ttl, claim_grace,
+                 poll_interval, deadline):
+        """Claim and delete messages until all of them are consumed."""
+        while state["consumed"] < state["total"] and time.time() < deadline:
+            messages = self._messages_claim(queue, ttl=claim_ttl,
+                                            grace=claim_grace,
+                                            limit=batch_size)
+            received_at = time.time()
+            with state["lock"]:
+                state["claims"] += 1
+            if not messages:
+                time.sleep(poll_interval)
+                continue
+            self._messages_delete(messages)
+            with state["lock"]:
+                state["consumed"] += len(messages)
+                state["deletes"] += len(messages)
+                state["latencies"].extend(received_at - m.body["sent_at"]
+                                          for m in messages)
+
+    def run(self, messages_count=1000, batch_size=10, message_size=1024,
+            producers=2, consumers=2, ttl=360, claim_ttl=60, claim_grace=60,
+            timeout=120, poll_interval=0.1, **kwargs):
+        """Concurrent message producers and consumers of a queue.
+
+        Creates a Zaqar queue with random name. Producers post messages in
+        batches, while consumers claim them in batches and delete them.
+        Every message carries the time it was posted at, so the end-to-end
+        latency is measured for each message. Rates of posted, consumed and
+        deleted messages and of claims are reported per iteration.
+
+        :param messages_count: number of messages to post and consume
+        :param batch_size: number of messages to post or claim at once
+        :param message_size: size of payload of a message
+        :param producers: number of concurrent producers
+        :param consumers: number of concurrent consumers
+        :param ttl: TTL of messages in seconds
+        :param claim_ttl: TTL of claims in seconds
+        :param claim_grace: grace period of claims in seconds
+        :param timeout: seconds to wait for all messages to be consumed
+        :param poll_interval: seconds for a consumer to wait after a claim
+                              which returned no messages
+        :param kwargs: other optional parameters to create queues like
+                       "metadata"
+        """
+        queue = self._queue_create(**kwargs)
+        try:
+            self._produce_and_consume(queue, messages_count, batch_size,
+                                      message_size, producers, consumers,
+                                      ttl, claim_ttl, claim_grace, timeout,
+                                      poll_interval)
+        finally:
+            self._queue_delete(queue)
+
+    def _produce_and_consume(self, queue, messages_count, batch_size,
+                             message_size, producers, consumers, ttl,
+                             claim_ttl, claim_grace, timeout, poll_interval):
+        batches = [min(batch_size, messages_count - offset)
+                   for offset in range(0, messages_count, batch_size)]
+        state = {"lock": threading.Lock(), "total": messages_count,
+                 "consumed": 0, "claims": 0, "deletes": 0, "latencies": []}
+        durations = {}
+        started_at = time.time()
+        deadline = started_at + timeout
+
+        def worker(item, atomic_actions):
+            role, idx = item
+            # NOTE: every worker records atomic actions into its own
+            #   scenario instance, they are merged once all workers finish
+            worker_scenario = ProducerConsumerThroughput(self.context)
+            try:
+                if role == "producer":
+                    worker_scenario._produce(queue, batches[idx::producers],
+                                             message_size, ttl)
+                else:
+                    worker_scenario._consume(queue, state, batch_size,
+                                             claim_ttl, claim_grace,
+                                             poll_interval, deadline)
+            finally:
+                atomic_actions.extend(worker_scenario.atomic_actions())
+            durations[item] = time.time() - started_at
+
+        items = ([("producer", i) for i in range(producers)]
+                 + [("consumer", i) for i in range(consumers)])
+        aname = "zaqar.produce_and_consume_messages"
+        with atomic.ActionTimer(self, aname) as timer:
+            failures = task_utils.run_concurrently(
+                worker, items, workers=len(items),
+                atomic_inst=timer.atomic_action["children"])[1]
+        if failures:
+            raise exceptions.RallyException(
+                "Failed producers or consumers: %s"
+                % task_utils.format_failures(failures))
+        if state["consumed"] < messages_count:
+            raise exceptions.RallyException(
+                "Only %d of %d messages are consumed in %s seconds"
+                % (state["consumed"], messages_count, timeout))
+
+        produce_time = max(d for (role, i), d in durations.items()
+                           if role == "producer")
+        consume_time = max(d for (role, i), d in durations.items()
+                           if role == "consumer")
+
+        def rate(count, duration):
+            return round(count / duration, 3) if duration else 0
+
+        self.add_output(additive={
+            "title": "Message rates",
+            "description": "Operations per second",
+            "chart_plugin": "Lines",
+            "data": [["posted messages/s",
+                      rate(messages_count, produce_time)],
+                     ["consumed messages/s",
+                      rate(state["consumed"], consume_time)],
+                     ["claims/s", rate(state["claims"], consume_time)],
+                     ["deleted messages/s",
+                      rate(state["deletes"], consume_time)]],
+            "label": "Operations per second",
+            "axis_label": "Iteration"})
+        self.add_output(additive={
+            "title": "End-to-end latency",
+            "description": "Time between posting and claiming a message",
+            "chart_plugin": "StatsTable",
+            "data": [["message", latency]
+                     for latency in state["latencies"]]})
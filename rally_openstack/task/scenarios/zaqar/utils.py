@@ -61,3 +61,33 @@ class ZaqarScenario(scenario.OpenStackScenario):
         """
 
         return queue.messages()
+
+    @atomic.action_timer("zaqar.post_messages")
+    def _messages_post_batch(self, queue, messages):
+        """Post a batch of messages to a given Zaqar queue.
+
+        :param queue: post the messages to queue
+        :param messages: messages to post
+        """
+        queue.post(messages)
+
+    @atomic.action_timer("zaqar.claim_messages")
+    def _messages_claim(self, queue, ttl, grace, limit):
+        """Claim messages of a given Zaqar queue.
+
+        :param queue: claim messages of queue
+        :param ttl: TTL of the claim in seconds
+        :param grace: grace period of the claim in seconds
+        :param limit: maximum number of messages to claim
+        :returns: list of claimed messages
+        """
+        return list(queue.claim(ttl=ttl, grace=grace, limit=limit))
+
+    @atomic.action_timer("zaqar.delete_messages")
+    def _messages_delete(self, messages):
+        """Delete the given messages.
+
+        :param messages: messages to delete
+        """
+        for message in messages:
+            message.delete()
@@ -13,12 +13,15 @@
 #    under the License.
 
 import copy
+import inspect
 import operator
 import re
 
+import jsonschema
 from rally.common import logging
 from rally.common.plugin import plugin
 from rally import exceptions
+from rally.plugins.task import types as rally_types
 from rally.task import types
 
 from rally_openstack.common import osclients
@@ -171,6 +174,32 @@ class GlanceImageArguments(OpenStackResourceType):
         return resource_spec
 
 
+@plugin.configure(name="glance_image_location")
+class GlanceImageLocation(rally_types.PathOrUrl):
+    """Check image file or url, or the specification of generated data.
+
+    A string is processed by `path_or_url` type, while a dict describes data
+    which is generated in memory while uploading.
+    """
+
+    def pre_process(self, resource_spec, config, output_type=None):
+        if isinstance(resource_spec, dict):
+            try:
+                jsonschema.validate(resource_spec, image.GeneratedData.SCHEMA)
+            except jsonschema.ValidationError as e:
+                raise exceptions.InvalidScenarioArgument(
+                    "Invalid specification of generated image data: %s"
+                    % e.message)
+            return resource_spec
+
+        parent = super(GlanceImageLocation, self).pre_process
+        kwargs = {}
+        # NOTE: newer rally passes the keyword-only output_type argument
+        if "output_type" in inspect.signature(parent).parameters:
+            kwargs["output_type"] = output_type
+        return parent(resource_spec=resource_spec, config=config, **kwargs)
+
+
 @plugin.configure(name="ec2_image")
 class EC2Image(OpenStackResourceType):
     """Find EC2 image ID."""
@@ -0,0 +1,165 @@
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import time
+
+from rally.common import broker
+from rally.common import logging
+from rally import exceptions
+from rally.task import utils
+
+
+LOG = logging.getLogger(__name__)
+
+
+def _get_attr(resource, attr):
+    if isinstance(resource, dict):
+        return resource.get(attr)
+    return getattr(resource, attr, None)
+
+
+def wait_for_statuses(resources, list_resources, ready_statuses,
+                      failure_statuses=("error",), status_attr="status",
+                      timeout=60, check_interval=1, id_attr="id"):
+    """Wait for a batch of resources to reach one of the ready statuses.
+
+    Unlike rally.task.utils.wait_for_status, which fetches every resource
+    separately, each check here is a single call of `list_resources`.
+
+    :param resources: list of resources (objects or dicts) to wait for
+    :param list_resources: callable which returns a list with current
+        representation of resources. It can return resources which are not
+        waited for, they are ignored.
+    :param ready_statuses: statuses which mean that a resource is ready
+    :param failure_statuses: statuses which mean that a resource is failed
+    :param status_attr: name of the status attribute or key
+    :param timeout: timeout in seconds
+    :param check_interval: interval in seconds between checks
+    :param id_attr: name of the attribute or key which identifies a resource
+    :returns: list of updated resources in the same order as `resources`
+    """
+    ready_statuses = {s.upper() for s in ready_statuses}
+    failure_statuses = {s.upper() for s in failure_statuses or []}
+
+    current = dict((_get_attr(r, id_attr), r) for r in resources)
+    start = time.time()
+    while True:
+        for resource in list_resources():
+            res_id = _get_attr(resource, id_attr)
+            if res_id in current:
+                current[res_id] = resource
+
+        pending = []
+        for resource in current.values():
+            status = utils.get_status(resource, status_attr)
+            if status in failure_statuses:
+                raise exceptions.GetResourceErrorStatus(
+                    resource=resource, status=status,
+                    fault="Status in failure list %s"
+                          % str(failure_statuses))
+            if status not in ready_statuses:
+                pending.append(resource)
+
+        if not pending:
+            return [current[_get_attr(r, id_attr)] for r in resources]
+
+        time.sleep(check_interval)
+        if time.time() - start > timeout:
+            resource = pending[0]
+            raise exceptions.TimeoutException(
+                desired_status="('%s')" % "', '".join(ready_statuses),
+                resource_name=_get_attr(resource, "name") or "<no name>",
+                resource_type=resource.__class__.__name__,
+                resource_id=_get_attr(resource, id_attr),
+                resource_status=utils.get_status(resource, status_attr),
+                timeout=timeout)
+
+
+def run_concurrently(func, items, workers=1, atomic_inst=None):
+    """Call `func` for each item using the broker pattern.
+
+    rally.common.broker only logs exceptions of consumers, while this
+    function collects them, so a caller is able to report a summary of all
+    failures at once.
+
+    Atomic actions must not be recorded into a shared container from several
+    threads: a new action is nested into the latest unfinished one, so
+    actions of different threads would be nested into each other. If
+    `atomic_inst` is given, `func` is called with a second argument, a
+    separate list for atomic actions of the call. These lists are appended
+    to `atomic_inst` in the order of items once all calls are done.
+
+    :param func: callable which accepts one item (and a list for atomic
+        actions if `atomic_inst` is given)
+    :param items: iterable of items to process
+    :param workers: maximum number of threads to use
+    :param atomic_inst: a list of atomic actions to merge actions of calls
+        into
+    :returns: tuple of a list with results of `func` (in the same order as
+        items, None for failed ones) and a list of (item, exception) pairs
+        for failed calls
+    """
+    items = list(items)
+    results = [None] * len(items)
+    actions = [[] for item in items]
+    failures = []
+
+    def publish(queue):
+        queue.extend(enumerate(items))
+
+    def consume(cache, args):
+        idx, item = args
+        try:
+            if atomic_inst is None:
+                results[idx] = func(item)
+            else:
+                results[idx] = func(item, actions[idx])
+        except Exception as e:
+            if logging.is_debug():
+                LOG.exception("Failed to process %s" % (item,))
+            failures.append((item, e))
+
+    broker.run(publish, consume, max(min(workers, len(items)), 1))
+    if atomic_inst is not None:
+        for item_actions in actions:
+            atomic_inst.extend(item_actions)
+    return results, failures
+
+
+def format_failures(failures):
+    """Make a human-readable summary of failures of run_concurrently."""
+    return "; ".join("%s: %s" % (item, e) for item, e in failures)
+
+
+def raise_setup_failures(ctx_name, failures, msg, describe=None):
+    """Raise ContextSetupFailure with a summary of failures, if any.
+
+    :param ctx_name: name of the context
+    :param failures: list of (item, exception) pairs of run_concurrently
+    :param msg: beginning of the message with a placeholder for the number
+        of failures, like "Failed to create volumes for %d tenant(s)"
+    :param describe: callable which makes a human-readable name of an item.
+        By default, items are (user, tenant_id) pairs of
+        `_iterate_per_tenants` and tenant IDs are used.
+    """
+    if not failures:
+        return
+    if describe is None:
+        def describe(item):
+            return item[1]
+    raise exceptions.ContextSetupFailure(
+        ctx_name=ctx_name,
+        msg="%s: %s" % (msg % len(failures),
+                        format_failures([(describe(item), e)
+                                         for item, e in failures])))
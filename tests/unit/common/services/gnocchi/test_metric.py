@@ -128,6 +128,29 @@ class GnocchiServiceTestCase(test.TestCase):
         self._test_atomic_action_timer(self.atomic_actions(),
                                        "gnocchi.get_measures")
 
+    def test__add_measures(self):
+        measures = [{"timestamp": "2017-01-01T00:00:00", "value": 1.0}]
+        gnocchi = self.service._clients.gnocchi()
+        self.assertEqual(
+            gnocchi.metric.add_measures.return_value,
+            self.service.add_measures("fake_id", measures=measures))
+        gnocchi.metric.add_measures.assert_called_once_with(
+            metric="fake_id", measures=measures)
+        self._test_atomic_action_timer(self.atomic_actions(),
+                                       "gnocchi.add_measures")
+
+    def test__batch_metrics_measures(self):
+        measures = {"fake_id": [{"timestamp": "2017-01-01T00:00:00",
+                                 "value": 1.0}]}
+        gnocchi = self.service._clients.gnocchi()
+        self.assertEqual(
+            gnocchi.metric.batch_metrics_measures.return_value,
+            self.service.batch_metrics_measures(measures))
+        gnocchi.metric.batch_metrics_measures.assert_called_once_with(
+            measures)
+        self._test_atomic_action_timer(self.atomic_actions(),
+                                       "gnocchi.batch_metrics_measures")
+
     def test__create_metric(self):
         param = {"name": "fake_name",
                  "archive_policy_name": "fake_archive_policy",
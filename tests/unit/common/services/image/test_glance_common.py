@@ -69,6 +69,43 @@ class GlanceMixinTestCase(test.TestCase):
         self.glance.images.data.assert_called_once_with(image_id,
                                                         do_checksum=True)
 
+    def test_stream_image(self):
+        self.glance.images.data.return_value = iter([b"foo", b"barbaz"])
+
+        result = self.service.stream_image("image_id",
+                                           hash_algorithm="md5")
+
+        self.assertEqual(9, result["bytes"])
+        self.assertEqual("6df23dc03f9b54cc38a0fc1483df6e21", result["hash"])
+        self.assertGreaterEqual(result["duration"], 0)
+        self.glance.images.data.assert_called_once_with("image_id",
+                                                        do_checksum=True)
+        self._test_atomic_action_timer(self.service.atomic_actions(),
+                                       "glance_v%s.download_image"
+                                       % self.version)
+
+    @mock.patch("rally_openstack.common.services.image.glance_common.open",
+                create=True)
+    def test_stream_image_to_sink(self, mock_open):
+        self.glance.images.data.return_value = iter([b"foo", b"bar"])
+
+        result = self.service.stream_image("image_id", sink="/dev/null",
+                                           chunk_size=1024,
+                                           do_checksum=False)
+
+        self.assertEqual({"bytes": 6, "duration": mock.ANY, "hash": None},
+                         result)
+        mock_open.assert_called_once_with("/dev/null", "wb", buffering=1024)
+        out = mock_open.return_value
+        self.assertEqual([mock.call(b"foo"), mock.call(b"bar")],
+                         out.write.call_args_list)
+        out.close.assert_called_once_with()
+
+    def test_stream_image_without_data(self):
+        self.glance.images.data.return_value = None
+
+        self.assertEqual(0, self.service.stream_image("image_id")["bytes"])
+
 
 class FullUnifiedGlance(glance_common.UnifiedGlanceMixin,
                         service.Service):
@@ -126,3 +163,10 @@ class UnifiedGlanceMixinTestCase(test.TestCase):
         self.service.download_image(image_id)
         self.service._impl.download_image.assert_called_once_with(
             image_id, do_checksum=True)
+
+    def test_stream_image(self):
+        self.assertEqual(self.service._impl.stream_image.return_value,
+                         self.service.stream_image("image_id", sink="foo"))
+        self.service._impl.stream_image.assert_called_once_with(
+            "image_id", sink="foo", chunk_size=65536, hash_algorithm=None,
+            do_checksum=True)
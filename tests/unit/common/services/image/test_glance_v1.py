@@ -77,6 +77,18 @@ class GlanceV1ServiceTestCase(test.TestCase):
         self.gc.images.create.assert_called_once_with(**call_args)
         self.assertEqual(image, self.mock_wait_for_status.mock.return_value)
 
+    def test_create_image_with_generated_data(self):
+        self.service.create_image(
+            image_name="image_name",
+            container_format="container_format",
+            image_location={"size": 1024, "randomize": True},
+            disk_format="disk_format")
+
+        data = self.gc.images.create.call_args[1]["data"]
+        self.assertIsInstance(data, image.GeneratedData)
+        self.assertEqual(1024, len(data))
+        self.assertNotIn("copy_from", self.gc.images.create.call_args[1])
+
     @ddt.data({"image_name": None},
               {"image_name": "test_image_name"})
     @ddt.unpack
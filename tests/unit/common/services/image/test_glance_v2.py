@@ -60,6 +60,16 @@ class GlanceV2ServiceTestCase(test.TestCase):
         self.gc.images.upload.assert_called_once_with(
             image_id, mock_requests_get.return_value.raw)
 
+    @mock.patch("requests.get")
+    def test_upload_generated_data(self, mock_requests_get):
+        self.service.upload_data("foo", image_location={"size": 10,
+                                                        "pattern": "ab"})
+
+        self.assertFalse(mock_requests_get.called)
+        image_id, image_data = self.gc.images.upload.call_args[0]
+        self.assertEqual("foo", image_id)
+        self.assertEqual(10, len(image_data))
+
     @mock.patch("%s.glance_v2.GlanceV2Service.upload_data" % PATH)
     def test_create_image(self, mock_upload_data):
         image_name = "image_name"
@@ -143,6 +153,22 @@ class GlanceV2ServiceTestCase(test.TestCase):
             image_id,
             visibility=visibility)
 
+    def test_add_member(self):
+        self.assertEqual(
+            self.gc.image_members.create.return_value,
+            self.service.add_member(image_id="image_id",
+                                    member_id="project_id"))
+        self.gc.image_members.create.assert_called_once_with("image_id",
+                                                             "project_id")
+
+    def test_update_member(self):
+        self.assertEqual(
+            self.gc.image_members.update.return_value,
+            self.service.update_member(image_id="image_id",
+                                       member_id="project_id"))
+        self.gc.image_members.update.assert_called_once_with(
+            "image_id", "project_id", "accepted")
+
     def test_deactivate_image(self):
         image_id = "image_id"
         self.service.deactivate_image(image_id)
@@ -109,6 +109,13 @@ class ImageTestCase(test.TestCase):
         service._impl.download_image.assert_called_once_with(image_id,
                                                              do_checksum=True)
 
+    def test_stream_image(self):
+        service = self.get_service_with_fake_impl()
+        service.stream_image("image_id", hash_algorithm="sha256")
+        service._impl.stream_image.assert_called_once_with(
+            "image_id", sink=None, chunk_size=65536, hash_algorithm="sha256",
+            do_checksum=True)
+
     def test_is_applicable(self):
         clients = mock.Mock()
 
@@ -119,3 +126,43 @@ class ImageTestCase(test.TestCase):
         clients.glance().version = "2.0"
         self.assertTrue(
             glance_v2.UnifiedGlanceV2Service.is_applicable(clients))
+
+
+class GeneratedDataTestCase(test.TestCase):
+
+    def test_pattern(self):
+        data = image.GeneratedData(image.GeneratedData.CHUNK_SIZE * 2 + 5,
+                                   pattern="rally")
+
+        self.assertEqual(image.GeneratedData.CHUNK_SIZE * 2 + 5, len(data))
+        self.assertEqual(b"ral", data.read(3))
+        self.assertEqual(b"lyrally", data.read(7))
+        content = b"ral" + b"lyrally" + b"".join(data)
+        self.assertEqual((b"rally" * len(content))[:len(content)], content)
+        self.assertEqual(len(data), len(content))
+        self.assertEqual(b"", data.read(10))
+
+    def test_random(self):
+        data = image.GeneratedData(100, randomize=True, seed=42)
+        content = data.read(30) + data.read()
+
+        self.assertEqual(100, len(content))
+        self.assertEqual(
+            content,
+            image.GeneratedData(100, randomize=True, seed=42).read())
+        self.assertNotEqual(
+            content,
+            image.GeneratedData(100, randomize=True, seed=43).read())
+
+    def test_read_without_size(self):
+        data = image.GeneratedData(image.GeneratedData.CHUNK_SIZE + 5)
+
+        self.assertEqual(image.GeneratedData.CHUNK_SIZE, len(data.read()))
+        self.assertEqual(5, len(data.read(-1)))
+        self.assertEqual(b"", data.read())
+
+    def test_close(self):
+        data = image.GeneratedData(100)
+        data.close()
+
+        self.assertEqual(b"", data.read())
@@ -103,6 +103,22 @@ class LoadBalancerServiceTestCase(test.TestCase):
         self._test_atomic_action_timer(self.atomic_actions(),
                                        "octavia.load_balancer_create")
 
+    def test_load_balancer_create_with_flavor(self):
+        self.service.generate_random_name = mock.MagicMock(
+            return_value="lb")
+        self.service.load_balancer_create("subnet_id", flavor_id="flavor")
+        self.service._clients.octavia().load_balancer_create \
+            .assert_called_once_with(json={
+                "loadbalancer": {"name": "lb",
+                                 "admin_state_up": True,
+                                 "vip_qos_policy_id": None,
+                                 "listeners": None,
+                                 "project_id": None,
+                                 "provider": None,
+                                 "vip_subnet_id": "subnet_id",
+                                 "description": None,
+                                 "flavor_id": "flavor"}})
+
     def test_load_balancer_delete(self):
         self.service.load_balancer_delete("lb-id")
         self.service._clients.octavia().load_balancer_delete \
@@ -296,6 +312,15 @@ class LoadBalancerServiceTestCase(test.TestCase):
         self._test_atomic_action_timer(self.atomic_actions(),
                                        "octavia.member_set")
 
+    def test_member_batch_update(self):
+        members = [{"address": "10.0.0.3", "protocol_port": 80}]
+        self.service.member_batch_update(pool_id="fake_pool", members=members)
+        self.service._clients.octavia().create.assert_called_once_with(
+            "/lbaas/pools/fake_pool/members", method="PUT",
+            json={"members": members})
+        self._test_atomic_action_timer(self.atomic_actions(),
+                                       "octavia.member_batch_update")
+
     def test_l7policy_list(self):
         self.service.l7policy_list()
         self.service._clients.octavia().l7policy_list \
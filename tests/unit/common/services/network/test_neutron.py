@@ -246,6 +246,48 @@ class NeutronServiceTestCase(test.TestCase):
         self.assertEqual([net1, net2], self.neutron.list_networks())
         self.nc.list_networks.assert_called_once_with()
 
+    def test_create_networks(self):
+        self.nc.create_network.return_value = {"networks": ["foo", "bar"]}
+
+        self.assertEqual(
+            ["foo", "bar"],
+            self.neutron.create_networks(count=2, project_id="p1",
+                                         provider_network_type="vlan",
+                                         shared=True))
+        self.nc.create_network.assert_called_once_with({"networks": [
+            {"name": "s-1", "tenant_id": "p1",
+             "provider:network_type": "vlan", "shared": True},
+            {"name": "s-2", "tenant_id": "p1",
+             "provider:network_type": "vlan", "shared": True}
+        ]})
+        self.assertEqual("neutron.create_networks",
+                         self.atomic_inst[0]["name"])
+
+    @mock.patch("%s.net_utils.generate_cidr" % PATH)
+    def test_create_subnets(self, mock_generate_cidr):
+        mock_generate_cidr.side_effect = [(4, "10.0.0.0/24"),
+                                          (4, "10.0.1.0/24")]
+        self.nc.create_subnet.return_value = {"subnets": ["foo", "bar"]}
+
+        self.assertEqual(
+            ["foo", "bar"],
+            self.neutron.create_subnets(["net-1", "net-1"],
+                                        start_cidr="10.0.0.0/24",
+                                        enable_dhcp=False))
+        self.nc.create_subnet.assert_called_once_with({"subnets": [
+            {"name": "s-1", "network_id": "net-1", "ip_version": 4,
+             "cidr": "10.0.0.0/24", "enable_dhcp": False,
+             "dns_nameservers": self.neutron.IPv4_DEFAULT_DNS_NAMESERVERS},
+            {"name": "s-2", "network_id": "net-1", "ip_version": 4,
+             "cidr": "10.0.1.0/24", "enable_dhcp": False,
+             "dns_nameservers": self.neutron.IPv4_DEFAULT_DNS_NAMESERVERS}
+        ]})
+        mock_generate_cidr.assert_has_calls(
+            [mock.call(ip_version=neutron._NONE,
+                       start_cidr="10.0.0.0/24")] * 2)
+        self.assertEqual("neutron.create_subnets",
+                         self.atomic_inst[0]["name"])
+
     @mock.patch("%s.net_utils.generate_cidr" % PATH)
     def test_create_subnet(self, mock_generate_cidr):
         net_id = "net-id"
@@ -633,6 +675,19 @@ class NeutronServiceTestCase(test.TestCase):
             {"port": {"name": "s-1", "network_id": net_id}}
         )
 
+    def test_create_ports(self):
+        self.nc.create_port.return_value = {"ports": ["foo", "bar"]}
+
+        self.assertEqual(
+            ["foo", "bar"],
+            self.neutron.create_ports("net-id", count=2, device_owner="x"))
+        self.nc.create_port.assert_called_once_with({"ports": [
+            {"name": "s-1", "network_id": "net-id", "device_owner": "x"},
+            {"name": "s-2", "network_id": "net-id", "device_owner": "x"}
+        ]})
+        self.assertEqual("neutron.create_ports",
+                         self.atomic_inst[0]["name"])
+
     def test_get_port(self):
         port = "foo"
         self.nc.show_port.return_value = {"port": port}
@@ -1177,6 +1232,24 @@ class NeutronServiceTestCase(test.TestCase):
             }}
         )
 
+    def test_create_security_group_rules(self):
+        self.nc.create_security_group_rule.return_value = {
+            "security_group_rules": ["foo", "bar"]}
+        rules = [{"protocol": "tcp"}, {"protocol": "udp"}]
+
+        self.assertEqual(
+            ["foo", "bar"],
+            self.neutron.create_security_group_rules(
+                security_group_id="sg1", rules=rules)
+        )
+        self.nc.create_security_group_rule.assert_called_once_with(
+            {"security_group_rules": [
+                {"security_group_id": "sg1", "protocol": "tcp"},
+                {"security_group_id": "sg1", "protocol": "udp"}
+            ]}
+        )
+        self.assertEqual([{"protocol": "tcp"}, {"protocol": "udp"}], rules)
+
     def test_get_security_group_rule(self):
         security_group_rule = "foo"
         self.nc.show_security_group_rule.return_value = {
@@ -88,6 +88,15 @@ class CinderV1ServiceTestCase(test.ScenarioTestCase):
         self.assertEqual(self.service._wait_available_volume.return_value,
                          return_volume)
 
+    def test_create_volume_without_wait(self):
+        self.service._wait_available_volume = mock.MagicMock()
+
+        return_volume = self.service.create_volume(1, wait=False)
+
+        self.assertEqual(self.cinder.volumes.create.return_value,
+                         return_volume)
+        self.assertFalse(self.service._wait_available_volume.called)
+
     def test_update_volume(self):
         return_value = {"volume": fakes.FakeVolume()}
         self.cinder.volumes.update.return_value = return_value
@@ -268,7 +277,7 @@ class UnifiedCinderV1ServiceTestCase(test.TestCase):
             1, availability_zone=None, display_description=None,
             display_name=None, imageRef=None, metadata=None,
             project_id=None, snapshot_id=None, source_volid=None,
-            user_id=None, volume_type=None)
+            user_id=None, volume_type=None, wait=True)
         self.service._unify_volume.assert_called_once_with(
             self.service._impl.create_volume.return_value)
 
@@ -17,13 +17,13 @@ from unittest import mock
 
 import ddt
 
+from rally import exceptions as rally_exceptions
 from rally.task import context
 
 from rally_openstack.task.contexts.cinder import volumes
 from tests.unit import test
 
 CTX = "rally_openstack.task.contexts"
-SERVICE = "rally_openstack.common.services.storage"
 
 
 @ddt.ddt
@@ -53,8 +53,10 @@ class VolumeGeneratorTestCase(test.ScenarioTestCase):
               {"config": {"size": 1, "type": -1, "volumes_per_tenant": 5},
                "valid": False})
     @ddt.unpack
-    @mock.patch("%s.block.BlockStorage" % SERVICE)
-    def test_setup(self, mock_block_storage, config, valid=True):
+    @mock.patch("%s.cinder.volumes.rutils.interruptable_sleep" % CTX)
+    @mock.patch("%s.cinder.volumes.block.BlockStorage" % CTX)
+    def test_setup(self, mock_block_storage, mock_interruptable_sleep,
+                   config, valid=True):
         results = context.Context.validate("volumes", None, None, config)
         if valid:
             self.assertEqual([], results)
@@ -62,19 +64,29 @@ class VolumeGeneratorTestCase(test.ScenarioTestCase):
             self.assertEqual(1, len(results))
 
         from rally_openstack.common.services.storage import block
-        created_volume = block.Volume(id="uuid", size=config["size"],
-                                      name="vol", status="avaiable")
-
-        mock_service = mock_block_storage.return_value
-        mock_service.create_volume.return_value = created_volume
         users_per_tenant = 5
         volumes_per_tenant = config.get("volumes_per_tenant", 5)
         tenants = self._gen_tenants(2)
+        created, available = {}, {}
+        for id_ in tenants:
+            ids = ["%s-%d" % (id_, i) for i in range(volumes_per_tenant)]
+            created[id_] = [block.Volume(id=vid, size=config["size"],
+                                         name="vol", status="creating")
+                            for vid in ids]
+            available[id_] = [block.Volume(id=vid, size=config["size"],
+                                           name="vol", status="available")
+                              for vid in ids]
+        services = dict(
+            (id_, mock.Mock(**{"create_volume.side_effect": created[id_],
+                               "list_volumes.return_value": available[id_]}))
+            for id_ in tenants)
         users = []
         for id_ in tenants:
             for i in range(users_per_tenant):
                 users.append({"id": i, "tenant_id": id_,
                               "credential": mock.MagicMock()})
+        mock_block_storage.side_effect = lambda clients, **kw: services[
+            clients.credential.tenant_id]
 
         self.context.update({
             "config": {
@@ -91,17 +103,55 @@ class VolumeGeneratorTestCase(test.ScenarioTestCase):
             "users": users,
             "tenants": tenants
         })
+        for user in users:
+            user["credential"].tenant_id = user["tenant_id"]
+
+        volumes_ctx = volumes.VolumeGenerator(self.context)
 
         new_context = copy.deepcopy(self.context)
         for id_ in tenants.keys():
-            new_context["tenants"][id_].setdefault("volumes", [])
-            for i in range(volumes_per_tenant):
-                new_context["tenants"][id_]["volumes"].append(
-                    mock_service.create_volume.return_value._as_dict())
+            new_context["tenants"][id_]["volumes"] = [
+                v._as_dict() for v in available[id_]]
 
-        volumes_ctx = volumes.VolumeGenerator(self.context)
-        volumes_ctx.setup()
+        with mock.patch("%s.cinder.volumes.osclients.Clients" % CTX,
+                        side_effect=lambda credential: mock.Mock(
+                            credential=credential)):
+            volumes_ctx.setup()
         self.assertEqual(new_context, self.context)
+        for id_, service in services.items():
+            self.assertEqual([mock.call(config["size"],
+                                        volume_type=config.get("type"),
+                                        wait=False)] * volumes_per_tenant,
+                             service.create_volume.call_args_list)
+            service.list_volumes.assert_called_once_with(
+                detailed=True, search_opts={"project_id": id_})
+
+    @mock.patch("%s.cinder.volumes.rutils.interruptable_sleep" % CTX)
+    @mock.patch("%s.cinder.volumes.block.BlockStorage" % CTX)
+    def test_setup_failed(self, mock_block_storage, mock_interruptable_sleep):
+        from rally_openstack.common.services.storage import block
+        mock_service = mock_block_storage.return_value
+        mock_service.create_volume.side_effect = [
+            block.Volume(id="uuid-0", size=1, name="vol", status="creating"),
+            block.Volume(id="uuid-1", size=1, name="vol", status="creating")]
+        mock_service.list_volumes.return_value = [
+            block.Volume(id="uuid-0", size=1, name="vol", status="available"),
+            block.Volume(id="uuid-1", size=1, name="vol", status="error")]
+        tenants = self._gen_tenants(2)
+        self.context.update({
+            "config": {"volumes": {"size": 1, "volumes_per_tenant": 1,
+                                   "resource_management_workers": 1}},
+            "users": [{"id": "u", "tenant_id": t,
+                       "credential": mock.MagicMock()} for t in tenants],
+            "tenants": tenants
+        })
+
+        volumes_ctx = volumes.VolumeGenerator(self.context)
+        e = self.assertRaises(rally_exceptions.ContextSetupFailure,
+                              volumes_ctx.setup)
+        self.assertIn("Failed to create volumes for 1 tenant(s): 1", str(e))
+        self.assertEqual(1, len(self.context["tenants"]["0"]["volumes"]))
+        self.assertNotIn("volumes", self.context["tenants"]["1"])
 
     @mock.patch("%s.cinder.volumes.resource_manager.cleanup" % CTX)
     def test_cleanup(self, mock_cleanup):
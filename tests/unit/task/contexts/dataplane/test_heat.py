@@ -16,6 +16,8 @@
 import functools
 from unittest import mock
 
+from rally import exceptions
+
 from rally_openstack.task.contexts.dataplane import heat as heat_dataplane
 from tests.unit import test
 
@@ -47,6 +49,13 @@ class TestHeatWorkload(test.ScenarioTestCase):
         self.assertEqual(2, gcp("user.1"))
         self.assertEqual(3, gcp("tenant.0"))
         self.assertEqual(1, gcp("tenant.2.one"))
+        self.assertEqual(1, gcp(("tenant", 2, "one")))
+        self.assertRaises(exceptions.RallyException, gcp, "tenant.2.two")
+
+    def test__compile_path(self):
+        self.assertEqual(("spam", 1, "eggs"),
+                         heat_dataplane.HeatDataplane._compile_path(
+                             "spam.1.eggs"))
 
     @mock.patch(MOD + "osclients.Clients")
     def test__get_public_network_id(self, mock_clients):
@@ -102,3 +111,62 @@ class TestHeatWorkload(test.ScenarioTestCase):
             "network_id": "fake_net",
             "router_id": "rid"}
         self.assertEqual(expected, wl[3])
+
+    @mock.patch(MOD + "get_data")
+    @mock.patch(MOD + "heat_utils")
+    def test_setup_many_tenants(self, mock_heat_utils, mock_get_data):
+        self.context.update({
+            "config": {
+                "heat_dataplane": {
+                    "stacks_per_tenant": 2,
+                    "template": "tpl.yaml",
+                    "files": {"file1": "f1.yaml", "file2": "f1.yaml"},
+                    "parameters": {"network_id": "net"},
+                    "context_parameters": {"foo": "tenant.foo"},
+                }
+            },
+            "users": [{"tenant_id": "t%d" % i,
+                       "keypair": {"name": "kp%d" % i}} for i in range(3)],
+            "tenants": dict(("t%d" % i,
+                             {"foo": "bar%d" % i,
+                              "networks": [{"router_id": "rid%d" % i}]})
+                            for i in range(3)),
+        })
+        mock_get_data.side_effect = ["tpl", "sf1"]
+        ctx = heat_dataplane.HeatDataplane(self.context)
+
+        ctx.setup()
+
+        self.assertEqual([mock.call("tpl.yaml"), mock.call("f1.yaml")],
+                         mock_get_data.call_args_list)
+        fake_scenario = mock_heat_utils.HeatScenario.return_value
+        self.assertEqual(6, fake_scenario._create_stack.call_count)
+        for i in range(3):
+            workloads = self.context["tenants"]["t%d" % i]["stack_dataplane"]
+            self.assertEqual(2, len(workloads))
+            for wl in workloads:
+                self.assertEqual({"file1": "sf1", "file2": "sf1"}, wl[2])
+                self.assertEqual({"network_id": "net",
+                                  "foo": "bar%d" % i,
+                                  "key_name": "kp%d" % i,
+                                  "router_id": "rid%d" % i}, wl[3])
+
+    @mock.patch(MOD + "get_data")
+    @mock.patch(MOD + "heat_utils")
+    def test_setup_failed(self, mock_heat_utils, mock_get_data):
+        self.context.update({
+            "config": {
+                "heat_dataplane": {
+                    "template": "tpl.yaml",
+                    "parameters": {"network_id": "net"},
+                }
+            },
+            "users": [{"tenant_id": "t1", "keypair": {"name": "kp1"}}],
+            "tenants": {"t1": {"networks": [{"router_id": "rid"}]}},
+        })
+        fake_scenario = mock_heat_utils.HeatScenario.return_value
+        fake_scenario._create_stack.side_effect = Exception("Oops")
+        ctx = heat_dataplane.HeatDataplane(self.context)
+
+        e = self.assertRaises(exceptions.ContextSetupFailure, ctx.setup)
+        self.assertIn("t1: Oops", str(e))
@@ -13,9 +13,10 @@
 # under the License.
 
 
-import copy
 from unittest import mock
 
+from rally import exceptions
+
 from rally_openstack.task.contexts.designate import zones
 from rally_openstack.task.scenarios.designate import utils
 from tests.unit import test
@@ -44,9 +45,31 @@ class ZoneGeneratorTestCase(test.ScenarioTestCase):
         inst = zones.ZoneGenerator(self.context)
         self.assertEqual(inst.config, self.context["config"]["zones"])
 
-    @mock.patch("%s.designate.utils.DesignateScenario._create_zone" % SCN,
-                return_value={"id": "uuid"})
-    def test_setup(self, mock_designate_scenario__create_zone):
+    def _mock_designate(self, mock_designate_scenario_clients,
+                        mock_designate_scenario__create_zone,
+                        status="ACTIVE"):
+        created = []
+
+        def create_zone():
+            zone = {"id": "uuid-%d" % len(created), "name": "fake_name",
+                    "status": "PENDING"}
+            created.append(zone)
+            return zone
+
+        def list_zones(marker=None):
+            if marker:
+                return []
+            return [dict(zone, status=status) for zone in created]
+
+        mock_designate_scenario__create_zone.side_effect = create_zone
+        designate = mock_designate_scenario_clients.return_value
+        designate.zones.list.side_effect = list_zones
+        return designate
+
+    @mock.patch("%s.designate.utils.DesignateScenario.clients" % SCN)
+    @mock.patch("%s.designate.utils.DesignateScenario._create_zone" % SCN)
+    def test_setup(self, mock_designate_scenario__create_zone,
+                   mock_designate_scenario_clients):
         tenants_count = 2
         users_per_tenant = 5
         zones_per_tenant = 5
@@ -76,22 +99,54 @@ class ZoneGeneratorTestCase(test.ScenarioTestCase):
             "users": users,
             "tenants": tenants
         })
+        designate = self._mock_designate(
+            mock_designate_scenario_clients,
+            mock_designate_scenario__create_zone)
+
+        zones_ctx = zones.ZoneGenerator(self.context)
+        zones_ctx.setup()
 
-        new_context = copy.deepcopy(self.context)
+        self.assertEqual(tenants_count * zones_per_tenant,
+                         mock_designate_scenario__create_zone.call_count)
+        mock_designate_scenario_clients.assert_called_with(
+            "designate", version="2")
+        zone_ids = set()
         for id_ in tenants.keys():
-            new_context["tenants"][id_].setdefault("zones", [])
-            for i in range(zones_per_tenant):
-                new_context["tenants"][id_]["zones"].append({"id": "uuid"})
+            tenant_zones = self.context["tenants"][id_]["zones"]
+            self.assertEqual(zones_per_tenant, len(tenant_zones))
+            for zone in tenant_zones:
+                self.assertEqual("ACTIVE", zone["status"])
+                zone_ids.add(zone["id"])
+        self.assertEqual(tenants_count * zones_per_tenant, len(zone_ids))
+        self.assertEqual(tenants_count * 2, designate.zones.list.call_count)
+
+    @mock.patch("%s.designate.utils.DesignateScenario.clients" % SCN)
+    @mock.patch("%s.designate.utils.DesignateScenario._create_zone" % SCN)
+    def test_setup_failed(self, mock_designate_scenario__create_zone,
+                          mock_designate_scenario_clients):
+        self.context.update({
+            "config": {"zones": {"zones_per_tenant": 2}},
+            "users": [{"id": "u1", "tenant_id": "0",
+                       "credential": mock.MagicMock()}],
+            "tenants": self._gen_tenants(1)
+        })
+        self._mock_designate(mock_designate_scenario_clients,
+                             mock_designate_scenario__create_zone,
+                             status="ERROR")
 
         zones_ctx = zones.ZoneGenerator(self.context)
-        zones_ctx.setup()
-        self.assertEqual(new_context, self.context)
+        e = self.assertRaises(exceptions.ContextSetupFailure,
+                              zones_ctx.setup)
+        self.assertIn("Failed to create zones for 1 tenant(s)", str(e))
 
     @mock.patch("%s.neutron.utils.NeutronScenario" % SCN)
-    @mock.patch("%s.designate.utils.DesignateScenario._create_zone" % SCN,
-                return_value={"id": "uuid", "name": "fake_name"})
+    @mock.patch("%s.designate.utils.DesignateScenario.clients" % SCN)
+    @mock.patch("%s.designate.utils.DesignateScenario._create_zone" % SCN)
     def test_setup_for_existinge(self, mock_designate_scenario__create_zone,
+                                 mock_designate_scenario_clients,
                                  mock_neutron_scenario):
+        self._mock_designate(mock_designate_scenario_clients,
+                             mock_designate_scenario__create_zone)
         tenants_count = 1
         users_per_tenant = 1
 
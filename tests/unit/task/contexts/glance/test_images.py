@@ -18,6 +18,9 @@ from unittest import mock
 
 import ddt
 
+from rally import exceptions
+from rally.task import context
+
 from rally_openstack.task.contexts.glance import images
 from tests.unit import test
 
@@ -112,13 +115,14 @@ class ImageGeneratorTestCase(test.ScenarioTestCase):
             self.context["config"]["images"]["min_disk"] = min_disk
             expected_image_args["min_disk"] = min_disk
 
+        images_ctx = images.ImageGenerator(self.context)
+
         new_context = copy.deepcopy(self.context)
         for tenant_id in new_context["tenants"].keys():
             new_context["tenants"][tenant_id]["images"] = [
                 image_service.create_image.return_value.id
             ] * images_per_tenant
 
-        images_ctx = images.ImageGenerator(self.context)
         images_ctx.setup()
         self.assertEqual(new_context, self.context)
 
@@ -210,6 +214,131 @@ class ImageGeneratorTestCase(test.ScenarioTestCase):
         # specified, warning message should be printed.
         self.assertEqual(expected_warns, mock_log.warning.call_args_list)
 
+    @ddt.data("private", "shared", "public")
+    @mock.patch("%s.glance_v2.GlanceV2Service" % CTX)
+    @mock.patch("%s.image.Image" % CTX)
+    @mock.patch("%s.osclients.Clients" % CTX)
+    def test_setup_share_images(self, visibility, mock_clients, mock_image,
+                                mock_glance_v2_service):
+        mock_image.return_value.create_image.side_effect = [
+            mock.Mock(id="img-1"), mock.Mock(id="img-2")]
+        mock_clients.return_value.glance.choose_version.return_value = "2"
+        tenants = self._gen_tenants(3)
+        self.context.update({
+            "config": {
+                "images": {
+                    "image_url": "http://example.com/fake/url",
+                    "disk_format": "qcow2",
+                    "container_format": "bare",
+                    "images_per_tenant": 2,
+                    "visibility": visibility,
+                    "share_images": True
+                }
+            },
+            "users": [{"id": "u-%s" % t, "tenant_id": t,
+                       "credential": "credential-%s" % t} for t in tenants],
+            "tenants": tenants
+        })
+
+        images_ctx = images.ImageGenerator(self.context)
+        images_ctx.setup()
+
+        expected_visibility = ("shared" if visibility == "private"
+                               else visibility)
+        self.assertEqual(
+            [mock.call(image_name=None, container_format="bare",
+                       image_location="http://example.com/fake/url",
+                       disk_format="qcow2", visibility=expected_visibility,
+                       min_disk=0, min_ram=0)] * 2,
+            mock_image.return_value.create_image.call_args_list)
+        mock_image.assert_called_once_with(
+            mock_clients.return_value,
+            name_generator=images_ctx.generate_random_name)
+        mock_clients.assert_any_call(self.context["admin"]["credential"])
+        self.assertEqual(["img-1", "img-2"], self.context["shared_images"])
+        for tenant in tenants.values():
+            self.assertEqual(["img-1", "img-2"], tenant["images"])
+
+        glance = mock_glance_v2_service.return_value
+        if expected_visibility == "shared":
+            expected_calls = [mock.call(image_id=i, member_id=t)
+                              for t in tenants for i in ("img-1", "img-2")]
+            self.assertCountEqual(expected_calls,
+                                  glance.add_member.call_args_list)
+            self.assertCountEqual(expected_calls,
+                                  glance.update_member.call_args_list)
+        else:
+            self.assertFalse(glance.add_member.called)
+            self.assertFalse(glance.update_member.called)
+
+    @ddt.data({"image_url": "http://example.com/image.img"},
+              {"image_url": {"size": 1024, "randomize": True}},
+              {"image_url": {"size": 0}, "valid": False},
+              {"image_url": {"pattern": "foo"}, "valid": False})
+    @ddt.unpack
+    def test_validate_image_url(self, image_url, valid=True):
+        config = {"image_url": image_url, "disk_format": "raw",
+                  "container_format": "bare"}
+        results = context.Context.validate("images", None, None, config,
+                                           vtype="syntax")
+        if valid:
+            self.assertEqual([], results)
+        else:
+            self.assertEqual(1, len(results))
+
+    @mock.patch("%s.image.Image" % CTX)
+    @mock.patch("%s.osclients.Clients" % CTX)
+    def test_setup_share_images_glance_v1(self, mock_clients, mock_image):
+        mock_clients.return_value.glance.choose_version.return_value = "1"
+        self.context.update({
+            "config": {"images": {"share_images": True,
+                                  "image_url": "http://example.com/image",
+                                  "disk_format": "qcow2",
+                                  "container_format": "bare"}},
+            "users": [{"tenant_id": "t1", "credential": mock.MagicMock()}],
+            "tenants": {"t1": {}}
+        })
+
+        images_ctx = images.ImageGenerator(self.context)
+        e = self.assertRaises(exceptions.ContextSetupFailure,
+                              images_ctx.setup)
+        self.assertIn("only via Glance V2 API", str(e))
+        self.assertFalse(mock_image.return_value.create_image.called)
+
+    def test_setup_share_images_without_admin(self):
+        self.context.pop("admin")
+        self.context.update({
+            "config": {"images": {"share_images": True}},
+            "users": [{"tenant_id": "t1", "credential": mock.MagicMock()}],
+            "tenants": {"t1": {}}
+        })
+
+        images_ctx = images.ImageGenerator(self.context)
+        self.assertRaises(exceptions.ContextSetupFailure, images_ctx.setup)
+
+    @mock.patch("%s.resource_manager.cleanup" % CTX)
+    @mock.patch("%s.image.Image" % CTX)
+    @mock.patch("%s.osclients.Clients" % CTX)
+    def test_cleanup_shared_images(self, mock_clients, mock_image,
+                                   mock_cleanup):
+        mock_image.return_value.delete_image.side_effect = [
+            Exception("Oops"), None]
+        self.context.update({
+            "config": {"images": {"share_images": True}},
+            "shared_images": ["img-1", "img-2"],
+            "users": mock.Mock()
+        })
+
+        images_ctx = images.ImageGenerator(self.context)
+        images_ctx.cleanup()
+
+        mock_clients.assert_called_once_with(
+            self.context["admin"]["credential"])
+        self.assertEqual(
+            [mock.call("img-1"), mock.call("img-2")],
+            mock_image.return_value.delete_image.call_args_list)
+        self.assertTrue(mock_cleanup.called)
+
     @ddt.data({"admin": True})
     @ddt.unpack
     @mock.patch("%s.resource_manager.cleanup" % CTX)
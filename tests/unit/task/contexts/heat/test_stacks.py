@@ -15,13 +15,13 @@
 
 from unittest import mock
 
+from rally import exceptions
+
 from rally_openstack.task.contexts.heat import stacks
 from rally_openstack.task.scenarios.heat import utils as heat_utils
-from tests.unit import fakes
 from tests.unit import test
 
 CTX = "rally_openstack.task.contexts"
-SCN = "rally_openstack.task.scenarios"
 
 
 class TestStackGenerator(test.ScenarioTestCase):
@@ -45,17 +45,11 @@ class TestStackGenerator(test.ScenarioTestCase):
         inst = stacks.StackGenerator(self.context)
         self.assertEqual(inst.config, self.context["config"]["stacks"])
 
-    @mock.patch("%s.heat.utils.HeatScenario._create_stack" % SCN,
-                return_value=fakes.FakeStack(id="uuid"))
-    def test_setup(self, mock_heat_scenario__create_stack):
-        tenants_count = 2
-        users_per_tenant = 5
-        stacks_per_tenant = 1
-
+    def _prepare_context(self, tenants_count, stacks_per_tenant):
         tenants = self._gen_tenants(tenants_count)
         users = []
         for ten_id in tenants:
-            for i in range(users_per_tenant):
+            for i in range(5):
                 users.append({"id": i, "tenant_id": ten_id,
                               "credential": mock.MagicMock()})
 
@@ -63,7 +57,7 @@ class TestStackGenerator(test.ScenarioTestCase):
             "config": {
                 "users": {
                     "tenants": tenants_count,
-                    "users_per_tenant": users_per_tenant,
+                    "users_per_tenant": 5,
                     "concurrent": 10,
                 },
                 "stacks": {
@@ -75,14 +69,48 @@ class TestStackGenerator(test.ScenarioTestCase):
             "tenants": tenants
         })
 
+    def test_setup(self):
+        tenants_count = 2
+        stacks_per_tenant = 3
+        self._prepare_context(tenants_count, stacks_per_tenant)
+        heat = self.clients("heat")
+        heat.stacks.create.side_effect = [
+            {"stack": {"id": "stack-%d" % i}}
+            for i in range(tenants_count * stacks_per_tenant)]
+        heat.stacks.list.return_value = [
+            mock.Mock(id="stack-%d" % i, stack_status="CREATE_COMPLETE")
+            for i in range(tenants_count * stacks_per_tenant)]
+
         stack_ctx = stacks.StackGenerator(self.context)
         stack_ctx.setup()
         self.assertEqual(tenants_count * stacks_per_tenant,
-                         mock_heat_scenario__create_stack.call_count)
+                         heat.stacks.create.call_count)
+        template = stack_ctx._prepare_stack_template(1)
+        for call in heat.stacks.create.call_args_list:
+            self.assertEqual(template, call[1]["template"])
+        self.assertEqual(tenants_count, heat.stacks.list.call_count)
         # check that stack ids have been saved in context
+        stack_ids = []
         for ten_id in self.context["tenants"].keys():
             self.assertEqual(stacks_per_tenant,
                              len(self.context["tenants"][ten_id]["stacks"]))
+            stack_ids.extend(self.context["tenants"][ten_id]["stacks"])
+        self.assertEqual(
+            sorted("stack-%d" % i
+                   for i in range(tenants_count * stacks_per_tenant)),
+            sorted(stack_ids))
+
+    def test_setup_failed(self):
+        self._prepare_context(2, 1)
+        heat = self.clients("heat")
+        heat.stacks.create.return_value = {"stack": {"id": "uuid"}}
+        heat.stacks.list.return_value = [
+            mock.Mock(id="uuid", stack_status="CREATE_FAILED")]
+
+        stack_ctx = stacks.StackGenerator(self.context)
+        e = self.assertRaises(exceptions.ContextSetupFailure,
+                              stack_ctx.setup)
+        self.assertIn("Failed to create stacks for 2 tenant(s)", str(e))
 
     @mock.patch("%s.heat.stacks.resource_manager.cleanup" % CTX)
     def test_cleanup(self, mock_cleanup):
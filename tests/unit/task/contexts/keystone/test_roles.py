@@ -59,6 +59,8 @@ class RoleGeneratorTestCase(test.TestCase):
 
         expected = {"r1": "test_role1", "r2": "test_role2"}
         self.assertEqual(expected, ctx.context["roles"])
+        for user in ctx.context["users"]:
+            self.assertEqual(["r1", "r2"], user["assigned_roles"])
 
     @mock.patch("%s.osclients" % CTX)
     def test_add_role_which_does_not_exist(self, mock_osclients):
@@ -71,13 +73,47 @@ class RoleGeneratorTestCase(test.TestCase):
                                 {"id": "u2", "tenant_id": "t2"}]
         ctx.config = ["unknown_role"]
         ctx.credential = mock.MagicMock()
-        ex = self.assertRaises(exceptions.NotFoundException,
-                               ctx._get_role_object, "unknown_role")
+        ex = self.assertRaises(exceptions.NotFoundException, ctx.setup)
 
         expected = ("The resource can not be found: There is no role "
                     "with name `unknown_role`")
         self.assertEqual(expected, str(ex))
 
+        # cleanup is called by the task engine even if setup failed
+        ctx.cleanup()
+        self.assertEqual({}, ctx.context["roles"])
+
+    @mock.patch("%s.identity.Identity" % CTX)
+    @mock.patch("%s.osclients" % CTX)
+    def test_setup_lists_roles_once(self, mock_osclients, mock_identity):
+        keystone = mock_identity.return_value
+        role1 = mock.Mock(id="r1")
+        role1.name = "test_role1"
+        role2 = mock.Mock(id="r2")
+        role2.name = "test_role2"
+        keystone.list_roles.side_effect = lambda **kw: (
+            [role1] if kw else [role1, role2])
+
+        ctx = roles.RoleGenerator(self.context)
+        ctx.context["users"] = [{"id": "u%d" % i, "tenant_id": "t%d" % i}
+                                for i in range(5)]
+        ctx.setup()
+
+        self.assertEqual(
+            [mock.call()]
+            + [mock.call(user_id="u%d" % i, project_id="t%d" % i)
+               for i in range(5)],
+            sorted(keystone.list_roles.call_args_list,
+                   key=lambda c: c[1].get("user_id", "")))
+        self.assertEqual(
+            sorted([mock.call(role_id="r2", user_id="u%d" % i,
+                              project_id="t%d" % i) for i in range(5)],
+                   key=str),
+            sorted(keystone.add_role.call_args_list, key=str))
+        for user in ctx.context["users"]:
+            self.assertEqual(["r1"], user["roles"])
+            self.assertEqual(["r2"], user["assigned_roles"])
+
     @mock.patch("%s.osclients" % CTX)
     def test_remove_role(self, mock_osclients):
         fc = fakes.FakeClients()
@@ -109,7 +145,7 @@ class RoleGeneratorTestCase(test.TestCase):
         mock_osclients.Clients.return_value = fc
         self.create_default_roles_and_patch_add_remove_functions(fc)
 
-        def _get_user_role_ids_side_effect(user_id, project_id):
+        def _get_user_role_ids_side_effect(keystone, user_id, project_id):
             return ["r1", "r2"] if user_id == "u3" else []
 
         with roles.RoleGenerator(self.context) as ctx:
@@ -12,9 +12,11 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-import copy
+import itertools
 from unittest import mock
 
+from rally import exceptions
+
 from rally_openstack.task.contexts.magnum import clusters
 from rally_openstack.task.scenarios.magnum import utils as magnum_utils
 from tests.unit import test
@@ -38,16 +40,23 @@ class ClustersGeneratorTestCase(test.ScenarioTestCase):
             tenants[str(id_)]["cluster_template"] = "rally_ct_uuid"
         return tenants
 
-    @mock.patch("%s.magnum.utils.MagnumScenario._create_cluster" % SCN,
-                return_value=mock.Mock())
-    @mock.patch("%s.nova.utils.NovaScenario._create_keypair" % SCN,
-                return_value="key1")
-    def test_setup_using_existing_cluster_template(
-            self, mock__create_keypair, mock__create_cluster):
-        tenants_count = 2
-        users_per_tenant = 5
+    def _mock_magnum(self, statuses=None):
+        statuses = statuses or {}
+        magnum = self.clients("magnum")
 
-        tenants = self._gen_tenants(tenants_count)
+        def create(**kwargs):
+            uuid = "uuid-%s" % magnum.clusters.create.call_count
+            return mock.Mock(uuid=uuid, status="CREATE_IN_PROGRESS")
+
+        def get(uuid):
+            return mock.Mock(uuid=uuid,
+                             status=statuses.get(uuid, "CREATE_COMPLETE"))
+
+        magnum.clusters.create.side_effect = create
+        magnum.clusters.get.side_effect = get
+        return magnum
+
+    def _update_context(self, tenants, clusters_config, users_per_tenant=5):
         users = []
         for ten_id in tenants:
             for i in range(users_per_tenant):
@@ -57,90 +66,153 @@ class ClustersGeneratorTestCase(test.ScenarioTestCase):
         self.context.update({
             "config": {
                 "users": {
-                    "tenants": tenants_count,
+                    "tenants": len(tenants),
                     "users_per_tenant": users_per_tenant,
                     "concurrent": 10,
                 },
-                "clusters": {
-                    "cluster_template_uuid": "123456789",
-                    "node_count": 2
-                }
+                "clusters": clusters_config
             },
             "users": users,
             "tenants": tenants
         })
 
-        mock_cluster = mock__create_cluster.return_value
-        new_context = copy.deepcopy(self.context)
-        for id_ in new_context["tenants"]:
-            new_context["tenants"][id_]["cluster"] = mock_cluster.uuid
+    @mock.patch("rally.common.utils.interruptable_sleep")
+    @mock.patch("%s.nova.utils.NovaScenario._create_keypair" % SCN,
+                return_value="key1")
+    def test_setup_using_existing_cluster_template(
+            self, mock__create_keypair, mock_interruptable_sleep):
+        tenants_count = 2
+        tenants = self._gen_tenants(tenants_count)
+        self._update_context(tenants, {"cluster_template_uuid": "123456789",
+                                       "node_count": 2})
+        magnum = self._mock_magnum()
 
         cluster_ctx = clusters.ClusterGenerator(self.context)
         cluster_ctx.setup()
 
-        self.assertEqual(new_context, self.context)
-        cluster_ctx_config = self.context["config"]["clusters"]
-        node_count = cluster_ctx_config.get("node_count")
-        cluster_template_uuid = cluster_ctx_config.get("cluster_template_uuid")
-        mock_calls = [mock.call(cluster_template=cluster_template_uuid,
-                                keypair="key1", node_count=node_count)
+        self.assertEqual({"uuid-1", "uuid-2"},
+                         set(t["cluster"] for t in tenants.values()))
+        mock_calls = [mock.call(name=mock.ANY,
+                                cluster_template_id="123456789",
+                                keypair="key1", node_count=2)
                       for i in range(tenants_count)]
-        mock__create_cluster.assert_has_calls(mock_calls)
+        magnum.clusters.create.assert_has_calls(mock_calls)
+        self.assertEqual(tenants_count, magnum.clusters.get.call_count)
+        mock_interruptable_sleep.assert_called_once_with(
+            clusters.CONF.openstack.magnum_cluster_create_prepoll_delay)
 
-    @mock.patch("%s.magnum.utils.MagnumScenario._create_cluster" % SCN,
-                return_value=mock.Mock())
+    @mock.patch("rally.common.utils.interruptable_sleep")
     @mock.patch("%s.nova.utils.NovaScenario._create_keypair" % SCN,
                 return_value="key1")
-    def test_setup(self, mock__create_keypair, mock__create_cluster):
+    def test_setup(self, mock__create_keypair, mock_interruptable_sleep):
         tenants_count = 2
-        users_per_tenant = 5
-
         tenants = self._gen_tenants_with_cluster_template(tenants_count)
-        users = []
-        for ten_id in tenants:
-            for i in range(users_per_tenant):
-                users.append({"id": i, "tenant_id": ten_id,
-                              "credential": mock.MagicMock()})
-
-        self.context.update({
-            "config": {
-                "users": {
-                    "tenants": tenants_count,
-                    "users_per_tenant": users_per_tenant,
-                    "concurrent": 10,
-                },
-                "cluster_templates": {
-                    "dns_nameserver": "8.8.8.8",
-                    "external_network_id": "public",
-                    "flavor_id": "m1.small",
-                    "docker_volume_size": 5,
-                    "coe": "kubernetes",
-                    "image_id": "fedora-atomic-latest",
-                    "network_driver": "flannel"
-                },
-                "clusters": {
-                    "node_count": 2
-                }
-            },
-            "users": users,
-            "tenants": tenants
-        })
-
-        mock_cluster = mock__create_cluster.return_value
-        new_context = copy.deepcopy(self.context)
-        for id_ in new_context["tenants"]:
-            new_context["tenants"][id_]["cluster"] = mock_cluster.uuid
+        self._update_context(tenants, {"node_count": 2})
+        magnum = self._mock_magnum()
 
         cluster_ctx = clusters.ClusterGenerator(self.context)
         cluster_ctx.setup()
 
-        self.assertEqual(new_context, self.context)
-        cluster_ctx_config = self.context["config"]["clusters"]
-        node_count = cluster_ctx_config.get("node_count")
-        mock_calls = [mock.call(cluster_template="rally_ct_uuid",
-                                keypair="key1", node_count=node_count)
+        self.assertEqual({"uuid-1", "uuid-2"},
+                         set(t["cluster"] for t in tenants.values()))
+        mock_calls = [mock.call(name=mock.ANY,
+                                cluster_template_id="rally_ct_uuid",
+                                keypair="key1", node_count=2)
                       for i in range(tenants_count)]
-        mock__create_cluster.assert_has_calls(mock_calls)
+        magnum.clusters.create.assert_has_calls(mock_calls)
+
+    @mock.patch("rally.common.utils.interruptable_sleep")
+    @mock.patch("%s.nova.utils.NovaScenario._create_keypair" % SCN,
+                return_value="key1")
+    def test_setup_partially_failed(self, mock__create_keypair,
+                                    mock_interruptable_sleep):
+        tenants = self._gen_tenants_with_cluster_template(3)
+        self._update_context(tenants, {"node_count": 1,
+                                       "allowed_failures": 2},
+                             users_per_tenant=1)
+        magnum = self._mock_magnum()
+        get = magnum.clusters.get.side_effect
+        polls = {}
+
+        def get_in_progress(uuid):
+            # the first cluster is ready at the second check and the second
+            # one fails, while the third one is still being created
+            polls[uuid] = polls.get(uuid, 0) + 1
+            if uuid == "uuid-2":
+                return mock.Mock(uuid=uuid, status="CREATE_FAILED")
+            if uuid == "uuid-1" and polls[uuid] > 1:
+                return get(uuid)
+            return mock.Mock(uuid=uuid, status="CREATE_IN_PROGRESS")
+
+        magnum.clusters.get.side_effect = get_in_progress
+
+        cluster_ctx = clusters.ClusterGenerator(self.context)
+        # the clock stays at the deadline as logging reads it as well
+        with mock.patch("%s.clusters.time.time" % CTX,
+                        side_effect=itertools.chain(
+                            [0, 1], itertools.repeat(1e6))):
+            cluster_ctx.setup()
+
+        self.assertEqual(["uuid-1"],
+                         [t["cluster"] for t in tenants.values()
+                          if "cluster" in t])
+        self.assertEqual({"uuid-1": 2, "uuid-2": 1, "uuid-3": 2}, polls)
+
+    @mock.patch("rally.common.utils.interruptable_sleep")
+    @mock.patch("%s.nova.utils.NovaScenario._create_keypair" % SCN,
+                return_value="key1")
+    def test_setup_failed(self, mock__create_keypair,
+                          mock_interruptable_sleep):
+        tenants = self._gen_tenants_with_cluster_template(2)
+        self._update_context(tenants, {"node_count": 1}, users_per_tenant=1)
+        magnum = self._mock_magnum()
+        get = magnum.clusters.get.side_effect
+
+        def get_failed(uuid):
+            if uuid == "uuid-1":
+                return get(uuid)
+            return mock.Mock(uuid=uuid, status="CREATE_FAILED")
+
+        magnum.clusters.get.side_effect = get_failed
+
+        cluster_ctx = clusters.ClusterGenerator(self.context)
+        e = self.assertRaises(exceptions.ContextSetupFailure,
+                              cluster_ctx.setup)
+
+        self.assertIn("Failed to create clusters for 1 of 2 tenant(s)",
+                      str(e))
+        self.assertEqual(["uuid-1"],
+                         [t["cluster"] for t in tenants.values()
+                          if "cluster" in t])
+
+    @mock.patch("rally.common.utils.interruptable_sleep")
+    @mock.patch("%s.nova.utils.NovaScenario._create_keypair" % SCN,
+                return_value="key1")
+    def test_setup_too_many_failures(self, mock__create_keypair,
+                                     mock_interruptable_sleep):
+        tenants = self._gen_tenants_with_cluster_template(3)
+        self._update_context(tenants, {"node_count": 1,
+                                       "allowed_failures": 1},
+                             users_per_tenant=1)
+        magnum = self._mock_magnum()
+        get = magnum.clusters.get.side_effect
+
+        def get_failed(uuid):
+            if uuid == "uuid-1":
+                return get(uuid)
+            return mock.Mock(uuid=uuid, status="CREATE_FAILED")
+
+        magnum.clusters.get.side_effect = get_failed
+
+        cluster_ctx = clusters.ClusterGenerator(self.context)
+        e = self.assertRaises(exceptions.ContextSetupFailure,
+                              cluster_ctx.setup)
+
+        self.assertIn("Failed to create clusters for 2 of 3 tenant(s)",
+                      str(e))
+        self.assertEqual(["uuid-1"],
+                         [t["cluster"] for t in tenants.values()
+                          if "cluster" in t])
 
     @mock.patch("%s.cluster_templates.resource_manager.cleanup" % CTX)
     def test_cleanup(self, mock_cleanup):
@@ -145,7 +145,8 @@ class ShareNetworksTestCase(test.TestCase):
         inst = manila_share_networks.ShareNetworks(context)
 
         self.assertEqual(
-            {"foo": "bar", "share_networks": {}, "use_share_networks": False},
+            {"foo": "bar", "share_networks": {}, "use_share_networks": False,
+             "resource_management_workers": 20},
             inst.config)
 
     def test_setup_share_networks_disabled(self):
@@ -171,8 +172,8 @@ class ShareNetworksTestCase(test.TestCase):
     def test_setup_use_existing_share_networks(
             self, mock_manila_scenario__list_share_networks, mock_clients):
         existing_sns = self.existing_sns
-        expected_ctxt = copy.deepcopy(self.ctxt_use_existing)
         inst = manila_share_networks.ShareNetworks(self.ctxt_use_existing)
+        expected_ctxt = copy.deepcopy(self.ctxt_use_existing)
         mock_manila_scenario__list_share_networks.return_value = (
             self.existing_sns)
         expected_ctxt.update({
@@ -280,15 +281,10 @@ class ShareNetworksTestCase(test.TestCase):
             }
         else:
             sn_args = {"nova_net_id": mock.ANY}
-        expected_calls = [
-            mock.call(**sn_args),
-            mock.call().to_dict(),
-            mock.ANY,
-            mock.ANY,
-            mock.ANY,
-        ]
-        mock_manila_scenario__create_share_network.assert_has_calls(
-            expected_calls * (self.TENANTS_AMOUNT * networks_per_tenant))
+        self.assertEqual(
+            [mock.call(**sn_args)]
+            * (self.TENANTS_AMOUNT * networks_per_tenant),
+            mock_manila_scenario__create_share_network.call_args_list)
         mock_clients.assert_has_calls([mock.call(MOCK_USER_CREDENTIAL)
                                       for i in range(self.TENANTS_AMOUNT)])
 
@@ -324,9 +320,10 @@ class ShareNetworksTestCase(test.TestCase):
             }
         else:
             sn_args = {"nova_net_id": mock.ANY}
-        expected_calls = [mock.call(**sn_args), mock.call().to_dict()]
-        mock_manila_scenario__create_share_network.assert_has_calls(
-            expected_calls * (self.TENANTS_AMOUNT * networks_per_tenant))
+        self.assertEqual(
+            [mock.call(**sn_args)]
+            * (self.TENANTS_AMOUNT * networks_per_tenant),
+            mock_manila_scenario__create_share_network.call_args_list)
         mock_clients.assert_has_calls([mock.call(MOCK_USER_CREDENTIAL)
                                       for i in range(self.TENANTS_AMOUNT)])
 
@@ -349,12 +346,26 @@ class ShareNetworksTestCase(test.TestCase):
         self.assertEqual(ctxt["tenants"], inst.context.get("tenants"))
         self.assertFalse(
             mock_manila_scenario__add_security_service_to_share_network.called)
-        expected_calls = [mock.call(), mock.call().to_dict()]
-        mock_manila_scenario__create_share_network.assert_has_calls(
-            expected_calls * self.TENANTS_AMOUNT)
+        self.assertEqual(
+            [mock.call()] * self.TENANTS_AMOUNT,
+            mock_manila_scenario__create_share_network.call_args_list)
         mock_clients.assert_has_calls([mock.call(MOCK_USER_CREDENTIAL)
                                       for i in range(self.TENANTS_AMOUNT)])
 
+    @mock.patch("rally_openstack.common.osclients.Clients")
+    @mock.patch(MANILA_UTILS_PATH + "_create_share_network")
+    def test_setup_autocreate_share_networks_failed(
+            self, mock_manila_scenario__create_share_network, mock_clients):
+        ctxt = self._get_context(networks_per_tenant=0)
+        inst = manila_share_networks.ShareNetworks(ctxt)
+        mock_manila_scenario__create_share_network.side_effect = (
+            Exception("Oops"))
+
+        e = self.assertRaises(exceptions.ContextSetupFailure, inst.setup)
+
+        self.assertIn("Failed to create share networks for %d tenant(s)"
+                      % self.TENANTS_AMOUNT, str(e))
+
     @mock.patch("rally_openstack.common.osclients.Clients")
     @mock.patch(MANILA_UTILS_PATH + "_delete_share_network")
     @mock.patch(MANILA_UTILS_PATH + "_list_share_servers")
@@ -17,6 +17,7 @@ import copy
 from unittest import mock
 
 import ddt
+from rally import exceptions
 
 from rally_openstack.common import consts as rally_consts
 from rally_openstack.task.contexts.manila import consts
@@ -105,7 +106,8 @@ class SharesTestCase(test.TestCase):
 
         self.assertEqual(
             {"foo": "bar", "shares_per_tenant": 1, "size": 1,
-             "share_proto": "NFS", "share_type": None},
+             "share_proto": "NFS", "share_type": None,
+             "resource_management_workers": 20},
             inst.config)
         self.assertIn(
             rally_consts.JSON_SCHEMA, inst.CONFIG_SCHEMA.get("$schema"))
@@ -120,80 +122,98 @@ class SharesTestCase(test.TestCase):
         self.assertEqual(455, inst.get_order())
         self.assertEqual(consts.SHARES_CONTEXT_NAME, inst.get_name())
 
-    @mock.patch(MANILA_UTILS_PATH + "_create_share")
+    def _mock_manila(self, mock_manila_scenario_clients, status="available"):
+        manila = mock_manila_scenario_clients.return_value
+        shares = []
+
+        def create(**kwargs):
+            share = Fake(id="fake_share_id_%d" % len(shares),
+                         status="creating")
+            shares.append(share)
+            return share
+
+        manila.shares.create.side_effect = create
+        manila.shares.list.side_effect = lambda **kw: [
+            Fake(id=s.id, status=status) for s in shares]
+        return manila
+
+    @mock.patch("rally.common.utils.interruptable_sleep")
+    @mock.patch(MANILA_UTILS_PATH + "clients")
     @ddt.data(True, False)
     def test_setup(
             self,
             use_share_networks,
-            mock_manila_scenario__create_share):
+            mock_manila_scenario_clients,
+            mock_interruptable_sleep):
         share_type = "fake_share_type"
         ctxt = self._get_context(
             use_share_networks=use_share_networks, share_type=share_type)
         inst = manila_shares.Shares(ctxt)
-        shares = [
-            Fake(id="fake_share_id_%d" % s_id)
-            for s_id in range(self.TENANTS_AMOUNT * self.SHARES_PER_TENANT)
-        ]
-        mock_manila_scenario__create_share.side_effect = shares
+        manila = self._mock_manila(mock_manila_scenario_clients)
         expected_ctxt = copy.deepcopy(ctxt)
 
         inst.setup()
 
         self.assertEqual(
             self.TENANTS_AMOUNT * self.SHARES_PER_TENANT,
-            mock_manila_scenario__create_share.call_count)
+            manila.shares.create.call_count)
+        self.assertEqual(self.TENANTS_AMOUNT, manila.shares.list.call_count)
+        share_ids = set()
         for d in range(self.TENANTS_AMOUNT):
-            self.assertEqual(
-                [
-                    s.to_dict() for s in shares[
-                        (d * self.SHARES_PER_TENANT):(
-                            d * self.SHARES_PER_TENANT + self.SHARES_PER_TENANT
-                        )
-                    ]
-                ],
-                inst.context.get("tenants", {}).get("%s" % d, {}).get("shares")
-            )
+            shares = inst.context["tenants"]["%s" % d]["shares"]
+            self.assertEqual(self.SHARES_PER_TENANT, len(shares))
+            for share in shares:
+                self.assertEqual("available", share["status"])
+                share_ids.add(share["id"])
+            manila.shares.list.assert_any_call(
+                detailed=True, search_opts={"project_id": "%s" % d})
+        self.assertEqual(
+            self.TENANTS_AMOUNT * self.SHARES_PER_TENANT, len(share_ids))
         self.assertEqual(expected_ctxt["task"], inst.context.get("task"))
         self.assertEqual(expected_ctxt["config"], inst.context.get("config"))
         self.assertEqual(expected_ctxt["users"], inst.context.get("users"))
+        expected_kwargs = {
+            "share_proto": ctxt["config"][consts.SHARES_CONTEXT_NAME][
+                "share_proto"],
+            "size": ctxt["config"][consts.SHARES_CONTEXT_NAME]["size"],
+            "share_type": ctxt["config"][consts.SHARES_CONTEXT_NAME][
+                "share_type"],
+            "name": mock.ANY
+        }
         if use_share_networks:
             mock_calls = [
-                mock.call(
-                    share_proto=ctxt["config"][consts.SHARES_CONTEXT_NAME][
-                        "share_proto"],
-                    size=ctxt["config"][consts.SHARES_CONTEXT_NAME]["size"],
-                    share_type=ctxt["config"][consts.SHARES_CONTEXT_NAME][
-                        "share_type"],
-                    share_network=self.SHARE_NETWORKS[
-                        int(t_id) % len(self.SHARE_NETWORKS)]["id"]
-                ) for t_id in expected_ctxt["tenants"].keys()
+                mock.call(share_network=self.SHARE_NETWORKS[
+                    i % len(self.SHARE_NETWORKS)]["id"], **expected_kwargs)
+                for i in range(self.SHARES_PER_TENANT)
             ]
         else:
-            mock_calls = [
-                mock.call(
-                    share_proto=ctxt["config"][consts.SHARES_CONTEXT_NAME][
-                        "share_proto"],
-                    size=ctxt["config"][consts.SHARES_CONTEXT_NAME]["size"],
-                    share_type=ctxt["config"][consts.SHARES_CONTEXT_NAME][
-                        "share_type"],
-                ) for t_id in expected_ctxt["tenants"].keys()
-            ]
-        mock_manila_scenario__create_share.assert_has_calls(
-            mock_calls, any_order=True)
+            mock_calls = [mock.call(**expected_kwargs)]
+        manila.shares.create.assert_has_calls(mock_calls, any_order=True)
+
+    @mock.patch("rally.common.utils.interruptable_sleep")
+    @mock.patch(MANILA_UTILS_PATH + "clients")
+    def test_setup_failed(self, mock_manila_scenario_clients,
+                          mock_interruptable_sleep):
+        ctxt = self._get_context()
+        inst = manila_shares.Shares(ctxt)
+        self._mock_manila(mock_manila_scenario_clients, status="error")
+
+        e = self.assertRaises(exceptions.ContextSetupFailure, inst.setup)
+
+        self.assertIn("Failed to create shares for %d tenant(s)"
+                      % self.TENANTS_AMOUNT, str(e))
 
-    @mock.patch(MANILA_UTILS_PATH + "_create_share")
+    @mock.patch("rally.common.utils.interruptable_sleep")
+    @mock.patch(MANILA_UTILS_PATH + "clients")
     @mock.patch("rally_openstack.task.cleanup.manager.cleanup")
     def test_cleanup(
             self,
             mock_cleanup_manager_cleanup,
-            mock_manila_scenario__create_share):
+            mock_manila_scenario_clients,
+            mock_interruptable_sleep):
         ctxt = self._get_context()
         inst = manila_shares.Shares(ctxt)
-        shares = [
-            Fake(id="fake_share_id_%d" % s_id)
-            for s_id in range(self.TENANTS_AMOUNT * self.SHARES_PER_TENANT)
-        ]
-        mock_manila_scenario__create_share.side_effect = shares
+        self._mock_manila(mock_manila_scenario_clients)
         inst.setup()
 
         inst.cleanup()
@@ -16,6 +16,9 @@
 import copy
 from unittest import mock
 
+from neutronclient.common import exceptions as neutron_exceptions
+from rally import exceptions
+
 from rally_openstack.task.contexts.network import allow_ssh
 from tests.unit import test
 
@@ -62,7 +65,17 @@ class AllowSSHContextTestCase(test.TestCase):
                 }
             }
 
-        allow_ssh.AllowSSH(self.ctx).setup()
+        ctx = allow_ssh.AllowSSH(self.ctx)
+        ctx.setup()
+
+        # actions of concurrent workers are not nested into each other
+        self.assertEqual(
+            ["neutron.list_extension"]
+            + ["neutron.create_security_group",
+               "neutron.create_security_group_rules"] * 2,
+            [a["name"] for a in ctx.atomic_actions()])
+        self.assertEqual([], [a for a in ctx.atomic_actions()
+                              if a["children"]])
 
         # admin user should not be used
         self.assertFalse(self.ctx["admin"]["credential"].clients.called)
@@ -92,17 +105,57 @@ class AllowSSHContextTestCase(test.TestCase):
                 rules = copy.deepcopy(allow_ssh._RULES_TO_ADD)
                 for rule in rules:
                     rule["security_group_id"] = secgroup["id"]
-                self.assertEqual(
-                    [mock.call({"security_group_rule": rule})
-                     for rule in rules],
-                    nc.create_security_group_rule.call_args_list
-                )
+                nc.create_security_group_rule.assert_called_once_with(
+                    {"security_group_rules": rules})
 
                 processed_tenants[user["tenant_id"]] = secgroup
 
             self.assertEqual(processed_tenants[user["tenant_id"]]["id"],
                              user["secgroup"]["id"])
 
+    def test_setup_bulk_rules_not_supported(self):
+        user = self.ctx["users"][0]
+        self.ctx["users"] = [user]
+        nc = user["credential"].clients.return_value.neutron.return_value
+        nc.list_extensions.return_value = {
+            "extensions": [{"alias": "security-group"}]
+        }
+        nc.create_security_group.return_value = {
+            "security_group": {
+                "name": "xxx",
+                "id": "security-group-1",
+                "security_group_rules": [allow_ssh._RULES_TO_ADD[0]]
+            }
+        }
+        nc.create_security_group_rule.side_effect = [
+            neutron_exceptions.BadRequest("Bulk is not supported")] + [
+            {"security_group_rule": {"id": i}}
+            for i in range(len(allow_ssh._RULES_TO_ADD) - 1)]
+
+        allow_ssh.AllowSSH(self.ctx).setup()
+
+        rules = copy.deepcopy(allow_ssh._RULES_TO_ADD[1:])
+        for rule in rules:
+            rule["security_group_id"] = "security-group-1"
+        self.assertEqual(
+            [mock.call({"security_group_rules": rules})]
+            + [mock.call({"security_group_rule": rule}) for rule in rules],
+            nc.create_security_group_rule.call_args_list
+        )
+        self.assertEqual(len(allow_ssh._RULES_TO_ADD),
+                         len(user["secgroup"]["security_group_rules"]))
+
+    def test_setup_failed(self):
+        for user in self.ctx["users"]:
+            nc = user["credential"].clients.return_value.neutron.return_value
+            nc.list_extensions.return_value = {
+                "extensions": [{"alias": "security-group"}]
+            }
+            nc.create_security_group.side_effect = Exception("Oops")
+
+        self.assertRaises(exceptions.ContextSetupFailure,
+                          allow_ssh.AllowSSH(self.ctx).setup)
+
     def test_setup_no_security_group_extension(self):
         clients = self.ctx["users"][0]["credential"].clients.return_value
         nc = clients.neutron.return_value
@@ -12,6 +12,9 @@
 
 from unittest import mock
 
+from rally.common import logging
+from rally import exceptions
+
 from rally_openstack.task.contexts.neutron import lbaas as lbaas_context
 from tests.unit import test
 
@@ -97,6 +100,29 @@ class LbaasTestCase(test.TestCase):
                 actual_net.append(network)
         self.assertEqual(expected_net, actual_net)
 
+    @mock.patch(NET + "wrap")
+    @mock.patch("rally_openstack.common.osclients.Clients")
+    def test_setup_partially_failed(self, mock_clients, mock_wrap):
+        def create_v1_pool(tenant_id, subnet, **kwargs):
+            if tenant_id == "bar_tenant":
+                raise Exception("Oops")
+            return {"pool": {"id": "foo_pool"}}
+
+        net_wrapper = mock_wrap.return_value
+        net_wrapper.supports_extension.return_value = (True, None)
+        net_wrapper.create_v1_pool.side_effect = create_v1_pool
+        lb_context = lbaas_context.Lbaas(self.get_context())
+
+        e = self.assertRaises(exceptions.ContextSetupFailure,
+                              lb_context.setup)
+
+        self.assertIn("Failed to create 1 pool(s): subnet bar_subnet of "
+                      "tenant bar_tenant: Oops", str(e))
+        tenants = lb_context.context["tenants"]
+        self.assertEqual([{"pool": {"id": "foo_pool"}}],
+                         tenants["foo_tenant"]["networks"][0]["lb_pools"])
+        self.assertNotIn("lb_pools", tenants["bar_tenant"]["networks"][0])
+
     @mock.patch(NET + "wrap")
     @mock.patch("rally_openstack.common.osclients.Clients")
     def test_setup_with_no_lbaas(self, mock_clients, mock_wrap):
@@ -146,7 +172,24 @@ class LbaasTestCase(test.TestCase):
                 network.setdefault("lb_pools", []).append(resultant_pool)
         lb_context.cleanup()
         net_wrapper.delete_v1_pool.assert_has_calls(
-            [mock.call(pool["pool"]["id"]) for pool in expected_pools])
+            [mock.call(pool["pool"]["id"]) for pool in expected_pools],
+            any_order=True)
+
+    @mock.patch("rally_openstack.common.osclients.Clients")
+    @mock.patch(NET + "wrap")
+    def test_cleanup_failed(self, mock_wrap, mock_clients):
+        net_wrapper = mock_wrap(mock_clients.return_value)
+        net_wrapper.delete_v1_pool.side_effect = Exception("Oops")
+        lb_context = lbaas_context.Lbaas(self.get_context())
+        for tenant_ctx in lb_context.context["tenants"].values():
+            for network in tenant_ctx["networks"]:
+                network["lb_pools"] = [{"pool": {"id": "pool"}}]
+
+        with logging.LogCatcher(lbaas_context.LOG) as log:
+            lb_context.cleanup()
+
+            log.assertInLogs("Failed to delete 2 pool(s)")
+        self.assertEqual(2, net_wrapper.delete_v1_pool.call_count)
 
     @mock.patch("rally_openstack.common.osclients.Clients")
     @mock.patch(NET + "wrap")
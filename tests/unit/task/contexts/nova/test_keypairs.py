@@ -15,6 +15,9 @@
 
 from unittest import mock
 
+from novaclient import exceptions as nova_exc
+from rally import exceptions
+
 from rally_openstack.task.contexts.nova import keypairs
 from tests.unit import test
 
@@ -56,6 +59,9 @@ class KeyPairContextTestCase(test.TestCase):
         }
 
     def test_keypair_setup(self):
+        self.ctx_without_keys["config"] = {
+            "keypair": {"resource_management_workers": 1}}
+        self.ctx_with_keys["config"] = self.ctx_without_keys["config"]
         keypair_ctx = keypairs.Keypair(self.ctx_without_keys)
         keypair_ctx._generate_keypair = mock.Mock(side_effect=[
             {"id": "key_id_1", "key": "key_1", "name": "key_name_1"},
@@ -68,6 +74,20 @@ class KeyPairContextTestCase(test.TestCase):
         keypair_ctx._generate_keypair.assert_has_calls(
             [mock.call("credential_1"), mock.call("credential_2")])
 
+    def test_keypair_setup_failed(self):
+        self.ctx_without_keys["config"] = {
+            "keypair": {"resource_management_workers": 1}}
+        keypair_ctx = keypairs.Keypair(self.ctx_without_keys)
+        keypair_ctx._generate_keypair = mock.Mock(side_effect=[
+            {"id": "key_id_1", "key": "key_1", "name": "key_name_1"},
+            Exception("Oops")])
+
+        e = self.assertRaises(exceptions.ContextSetupFailure,
+                              keypair_ctx.setup)
+        self.assertIn("Failed to create key pairs for 1 user(s)", str(e))
+        self.assertEqual(self.ctx_with_keys["users"][0],
+                         keypair_ctx.context["users"][0])
+
     @mock.patch("%s.keypairs.resource_manager.cleanup" % CTX)
     def test_keypair_cleanup(self, mock_cleanup):
         keypair_ctx = keypairs.Keypair(self.ctx_with_keys)
@@ -78,9 +98,10 @@ class KeyPairContextTestCase(test.TestCase):
             superclass=keypairs.Keypair,
             task_id=self.ctx_with_keys["task"]["uuid"])
 
-    @mock.patch("rally_openstack.common.osclients.Clients")
-    def test_keypair_generate(self, mock_clients):
-        mock_keypairs = mock_clients.return_value.nova.return_value.keypairs
+    def test_keypair_generate(self):
+        credential = mock.Mock()
+        mock_keypairs = credential.clients.return_value.nova.return_value.\
+            keypairs
         mock_keypair = mock_keypairs.create.return_value
         mock_keypair.public_key = "public_key"
         mock_keypair.private_key = "private_key"
@@ -88,7 +109,7 @@ class KeyPairContextTestCase(test.TestCase):
         keypair_ctx = keypairs.Keypair(self.ctx_without_keys)
         keypair_ctx.generate_random_name = mock.Mock()
 
-        key = keypair_ctx._generate_keypair("credential")
+        key = keypair_ctx._generate_keypair(credential)
 
         self.assertEqual({
             "id": "key_id",
@@ -97,7 +118,65 @@ class KeyPairContextTestCase(test.TestCase):
             "public": "public_key"
         }, key)
 
-        mock_clients.assert_has_calls([
-            mock.call().nova().keypairs.create(
-                keypair_ctx.generate_random_name.return_value),
-        ])
+        mock_keypairs.create.assert_called_once_with(
+            keypair_ctx.generate_random_name.return_value)
+        self.assertFalse(mock_keypairs.list.called)
+
+    def test_keypair_generate_with_conflict(self):
+        credential = mock.Mock()
+        mock_keypairs = credential.clients.return_value.nova.return_value.\
+            keypairs
+        mock_keypair = mock.Mock(id="key_id", public_key="public_key",
+                                 private_key="private_key")
+        mock_keypairs.create.side_effect = [
+            nova_exc.Conflict(409), mock_keypair]
+        keypair_ctx = keypairs.Keypair(self.ctx_without_keys)
+        keypair_ctx.generate_random_name = mock.Mock(
+            side_effect=["name1", "name2"])
+
+        key = keypair_ctx._generate_keypair(credential)
+
+        self.assertEqual("name2", key["name"])
+        self.assertEqual([mock.call("name1"), mock.call("name2")],
+                         mock_keypairs.create.call_args_list)
+
+    def test_keypair_generate_with_too_many_conflicts(self):
+        credential = mock.Mock()
+        mock_keypairs = credential.clients.return_value.nova.return_value.\
+            keypairs
+        mock_keypairs.create.side_effect = nova_exc.Conflict(409)
+        keypair_ctx = keypairs.Keypair(self.ctx_without_keys)
+
+        self.assertRaises(nova_exc.Conflict,
+                          keypair_ctx._generate_keypair, credential)
+        self.assertEqual(keypair_ctx.MAX_NAME_ATTEMPTS,
+                         mock_keypairs.create.call_count)
+
+    def test_keypair_generate_failed(self):
+        credential = mock.Mock()
+        mock_keypairs = credential.clients.return_value.nova.return_value.\
+            keypairs
+        mock_keypairs.create.side_effect = nova_exc.Forbidden(403)
+        keypair_ctx = keypairs.Keypair(self.ctx_without_keys)
+
+        self.assertRaises(nova_exc.Forbidden,
+                          keypair_ctx._generate_keypair, credential)
+        self.assertEqual(1, mock_keypairs.create.call_count)
+
+    def test_keypair_import(self):
+        credential = mock.Mock()
+        mock_keypairs = credential.clients.return_value.nova.return_value.\
+            keypairs
+        mock_keypairs.create.return_value = mock.Mock(
+            id="key_id", public_key="public_key", private_key=None)
+        self.ctx_without_keys["config"] = {
+            "keypair": {"public_key": "public_key",
+                        "private_key": "private_key"}}
+        keypair_ctx = keypairs.Keypair(self.ctx_without_keys)
+        keypair_ctx.generate_random_name = mock.Mock(return_value="name")
+
+        self.assertEqual({"id": "key_id", "name": "name",
+                          "private": "private_key", "public": "public_key"},
+                         keypair_ctx._generate_keypair(credential))
+        mock_keypairs.create.assert_called_once_with(
+            "name", public_key="public_key")
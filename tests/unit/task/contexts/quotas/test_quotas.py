@@ -18,6 +18,7 @@ from unittest import mock
 
 import ddt
 from rally.common import logging
+from rally import exceptions
 from rally.task import context
 
 from rally_openstack.task.contexts.quotas import quotas
@@ -116,20 +117,22 @@ class QuotasTestCase(test.TestCase):
         with quotas.Quotas(ctx) as quotas_ctx:
             quotas_ctx.setup()
             if ex_users:
-                self.assertEqual([mock.call(tenant) for tenant in tenants],
-                                 cinder_quo.get.call_args_list)
-            self.assertEqual([mock.call(tenant, **cinder_quotas)
-                              for tenant in tenants],
-                             cinder_quo.update.call_args_list)
+                self.assertCountEqual(
+                    [mock.call(tenant) for tenant in tenants],
+                    cinder_quo.get.call_args_list)
+            self.assertCountEqual(
+                [mock.call(tenant, **cinder_quotas) for tenant in tenants],
+                cinder_quo.update.call_args_list)
             mock_cinder_quotas.reset_mock()
 
         if ex_users:
-            self.assertEqual([mock.call(tenant, **cinder_quotas)
-                              for tenant in tenants],
-                             cinder_quo.update.call_args_list)
+            self.assertCountEqual(
+                [mock.call(tenant, **cinder_quotas) for tenant in tenants],
+                cinder_quo.update.call_args_list)
         else:
-            self.assertEqual([mock.call(tenant) for tenant in tenants],
-                             cinder_quo.delete.call_args_list)
+            self.assertCountEqual(
+                [mock.call(tenant) for tenant in tenants],
+                cinder_quo.delete.call_args_list)
 
     @mock.patch("%s.quotas.osclients.Clients" % QUOTAS_PATH)
     @mock.patch("%s.nova_quotas.NovaQuotas" % QUOTAS_PATH)
@@ -163,20 +166,22 @@ class QuotasTestCase(test.TestCase):
         with quotas.Quotas(ctx) as quotas_ctx:
             quotas_ctx.setup()
             if ex_users:
-                self.assertEqual([mock.call(tenant) for tenant in tenants],
-                                 nova_quo.get.call_args_list)
-            self.assertEqual([mock.call(tenant, **nova_quotas)
-                              for tenant in tenants],
-                             nova_quo.update.call_args_list)
+                self.assertCountEqual(
+                    [mock.call(tenant) for tenant in tenants],
+                    nova_quo.get.call_args_list)
+            self.assertCountEqual(
+                [mock.call(tenant, **nova_quotas) for tenant in tenants],
+                nova_quo.update.call_args_list)
             mock_nova_quotas.reset_mock()
 
         if ex_users:
-            self.assertEqual([mock.call(tenant, **nova_quotas)
-                              for tenant in tenants],
-                             nova_quo.update.call_args_list)
+            self.assertCountEqual(
+                [mock.call(tenant, **nova_quotas) for tenant in tenants],
+                nova_quo.update.call_args_list)
         else:
-            self.assertEqual([mock.call(tenant) for tenant in tenants],
-                             nova_quo.delete.call_args_list)
+            self.assertCountEqual(
+                [mock.call(tenant) for tenant in tenants],
+                nova_quo.delete.call_args_list)
 
     @mock.patch("%s.quotas.osclients.Clients" % QUOTAS_PATH)
     @mock.patch("%s.neutron_quotas.NeutronQuotas" % QUOTAS_PATH)
@@ -205,20 +210,22 @@ class QuotasTestCase(test.TestCase):
         with quotas.Quotas(ctx) as quotas_ctx:
             quotas_ctx.setup()
             if ex_users:
-                self.assertEqual([mock.call(tenant) for tenant in tenants],
-                                 neutron_quo.get.call_args_list)
-            self.assertEqual([mock.call(tenant, **neutron_quotas)
-                              for tenant in tenants],
-                             neutron_quo.update.call_args_list)
+                self.assertCountEqual(
+                    [mock.call(tenant) for tenant in tenants],
+                    neutron_quo.get.call_args_list)
+            self.assertCountEqual(
+                [mock.call(tenant, **neutron_quotas) for tenant in tenants],
+                neutron_quo.update.call_args_list)
             neutron_quo.reset_mock()
 
         if ex_users:
-            self.assertEqual([mock.call(tenant, **neutron_quotas)
-                              for tenant in tenants],
-                             neutron_quo.update.call_args_list)
+            self.assertCountEqual(
+                [mock.call(tenant, **neutron_quotas) for tenant in tenants],
+                neutron_quo.update.call_args_list)
         else:
-            self.assertEqual([mock.call(tenant) for tenant in tenants],
-                             neutron_quo.delete.call_args_list)
+            self.assertCountEqual(
+                [mock.call(tenant) for tenant in tenants],
+                neutron_quo.delete.call_args_list)
 
     @mock.patch("rally_openstack.task.contexts."
                 "quotas.quotas.osclients.Clients")
@@ -279,3 +286,38 @@ class QuotasTestCase(test.TestCase):
 
             self.assertEqual(mock_quotas.return_value.update.call_count,
                              len(self.context["tenants"]))
+
+    @mock.patch("%s.quotas.osclients.Clients" % QUOTAS_PATH)
+    @mock.patch("%s.nova_quotas.NovaQuotas" % QUOTAS_PATH)
+    @mock.patch("%s.cinder_quotas.CinderQuotas" % QUOTAS_PATH)
+    def test_setup_failed(self, mock_cinder_quotas, mock_nova_quotas,
+                          mock_clients):
+        mock_nova_quotas.return_value.update.side_effect = (
+            lambda tenant_id, **kw: 1 / 0 if tenant_id == "t2" else None)
+        ctx = copy.deepcopy(self.context)
+        ctx["config"]["quotas"] = {"nova": {"instances": 1},
+                                   "cinder": {"volumes": 1},
+                                   "resource_management_workers": 3}
+
+        quotas_ctx = quotas.Quotas(ctx)
+        e = self.assertRaises(exceptions.ContextSetupFailure,
+                              quotas_ctx.setup)
+
+        self.assertIn("t2 (nova): division by zero", str(e))
+        self.assertNotIn("t1", str(e))
+        self.assertEqual(2, mock_nova_quotas.return_value.update.call_count)
+        self.assertEqual(2, mock_cinder_quotas.return_value.update.call_count)
+
+    @mock.patch("%s.quotas.osclients.Clients" % QUOTAS_PATH)
+    @mock.patch("%s.nova_quotas.NovaQuotas" % QUOTAS_PATH)
+    def test_exception_during_delete(self, mock_nova_quotas, mock_clients):
+        mock_nova_quotas.return_value.delete.side_effect = Exception("Oops")
+        ctx = copy.deepcopy(self.context)
+        ctx["config"]["quotas"] = {"nova": {"instances": 1}}
+
+        quotas_instance = quotas.Quotas(ctx)
+        with logging.LogCatcher(quotas.LOG) as log:
+            quotas_instance.cleanup()
+
+            log.assertInLogs("Failed to remove quotas for tenant(s)")
+        self.assertEqual(2, mock_nova_quotas.return_value.delete.call_count)
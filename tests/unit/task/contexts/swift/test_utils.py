@@ -13,6 +13,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import json
 from unittest import mock
 
 from rally_openstack.task import context
@@ -82,7 +83,7 @@ class SwiftObjectMixinTestCase(test.TestCase):
                             "id": "u1", "tenant_id": "1001",
                             "credential": mock.MagicMock()},
                          "container": "c1",
-                         "objects": []}
+                         "objects": set()}
                     ]
                 },
                 "1002": {
@@ -92,7 +93,7 @@ class SwiftObjectMixinTestCase(test.TestCase):
                             "id": "u2", "tenant_id": "1002",
                             "credential": mock.MagicMock()},
                          "container": "c2",
-                         "objects": []}
+                         "objects": set()}
                     ]
                 }
             }
@@ -127,7 +128,7 @@ class SwiftObjectMixinTestCase(test.TestCase):
                             "id": "u1", "tenant_id": "1001",
                             "credential": mock.MagicMock()},
                          "container": "c1",
-                         "objects": []}
+                         "objects": set()}
                     ]
                 },
                 "1002": {
@@ -137,7 +138,7 @@ class SwiftObjectMixinTestCase(test.TestCase):
                             "id": "u2", "tenant_id": "1002",
                             "credential": mock.MagicMock()},
                          "container": "c2",
-                         "objects": []}
+                         "objects": set()}
                     ]
                 }
             }
@@ -154,8 +155,7 @@ class SwiftObjectMixinTestCase(test.TestCase):
             self.assertEqual(0,
                              len(context["tenants"][tenant_id]["containers"]))
 
-    @mock.patch("rally_openstack.common.osclients.Clients")
-    def test__delete_objects(self, mock_clients):
+    def _get_context_with_objects(self):
         context = test.get_test_context()
         context.update({
             "tenants": {
@@ -166,7 +166,7 @@ class SwiftObjectMixinTestCase(test.TestCase):
                             "id": "u1", "tenant_id": "1001",
                             "credential": mock.MagicMock()},
                          "container": "c1",
-                         "objects": ["o1", "o2", "o3"]}
+                         "objects": {"o1", "o2", "o3"}}
                     ]
                 },
                 "1002": {
@@ -176,21 +176,71 @@ class SwiftObjectMixinTestCase(test.TestCase):
                             "id": "u2", "tenant_id": "1002",
                             "credential": mock.MagicMock()},
                          "container": "c2",
-                         "objects": ["o4", "o5", "o6"]}
+                         "objects": {"o4", "o5", "o6"}}
                     ]
                 }
             }
         })
+        return context
+
+    @mock.patch("rally_openstack.common.osclients.Clients")
+    def test__delete_objects(self, mock_clients):
+        context = self._get_context_with_objects()
+        mock_swift = mock_clients.return_value.swift.return_value
+        mock_swift.get_capabilities.side_effect = Exception("Oops")
 
         SwiftContext(context)._delete_objects(1)
 
-        mock_swift = mock_clients.return_value.swift.return_value
         expected_objects = [("c1", "o1"), ("c1", "o2"), ("c1", "o3"),
                             ("c2", "o4"), ("c2", "o5"), ("c2", "o6")]
         mock_swift.delete_object.assert_has_calls(
             [mock.call(con, obj) for con, obj in expected_objects],
             any_order=True)
+        self.assertFalse(mock_swift.post_account.called)
 
         for tenant_id in context["tenants"]:
             for container in context["tenants"][tenant_id]["containers"]:
                 self.assertEqual(0, len(container["objects"]))
+
+    @mock.patch("rally_openstack.common.osclients.Clients")
+    def test__delete_objects_in_bulk(self, mock_clients):
+        context = self._get_context_with_objects()
+        mock_swift = mock_clients.return_value.swift.return_value
+        mock_swift.get_capabilities.return_value = {
+            "bulk_delete": {"max_deletes_per_request": 2}}
+        mock_swift.post_account.side_effect = [
+            ({}, json.dumps({"Errors": [["/c1/o2", "409 Conflict"]]})),
+            ({}, json.dumps({"Errors": []})),
+            ({}, json.dumps({"Errors": []})),
+            ({}, json.dumps({"Errors": []}))]
+
+        SwiftContext(context)._delete_objects(1)
+
+        mock_swift.delete_object.assert_called_once_with("c1", "o2")
+        self.assertEqual(
+            [b"/c1/o1\n/c1/o2", b"/c1/o3", b"/c2/o4\n/c2/o5", b"/c2/o6"],
+            sorted(c[1]["data"]
+                   for c in mock_swift.post_account.call_args_list))
+        containers = [c for t in context["tenants"].values()
+                      for c in t["containers"]]
+        self.assertEqual([set(), set()],
+                         [c["objects"] for c in containers])
+
+    @mock.patch("rally_openstack.common.osclients.Clients")
+    def test__delete_objects_bulk_rejected(self, mock_clients):
+        context = self._get_context_with_objects()
+        mock_swift = mock_clients.return_value.swift.return_value
+        mock_swift.get_capabilities.return_value = {
+            "bulk_delete": {"max_deletes_per_request": 3}}
+        mock_swift.post_account.side_effect = [
+            Exception("413 Request Entity Too Large"),
+            ({}, json.dumps({"Errors": []}))]
+
+        SwiftContext(context)._delete_objects(1)
+
+        self.assertEqual(2, mock_swift.post_account.call_count)
+        self.assertEqual(3, mock_swift.delete_object.call_count)
+        containers = [c for t in context["tenants"].values()
+                      for c in t["containers"]]
+        self.assertEqual([set(), set()],
+                         [c["objects"] for c in containers])
@@ -118,6 +118,133 @@ class BaseCustomImageContextVMTestCase(test.TestCase):
         scenario._delete_server_with_fip.assert_called_once_with(
             fake_server, ip)
 
+    @mock.patch("%s.osclients.Clients" % BASE)
+    @mock.patch("%s.image.Image" % BASE)
+    @mock.patch("%s.types.GlanceImage" % BASE)
+    @mock.patch("%s.types.Flavor" % BASE)
+    @mock.patch("%s.vmtasks.BootRuncommandDelete" % BASE)
+    def test_create_one_image_cached(
+            self, mock_boot_runcommand_delete, mock_flavor,
+            mock_glance_image, mock_image, mock_clients):
+        self.context["config"]["test_custom_image"]["cache"] = True
+        mock_flavor.return_value.pre_process.return_value = "flavor"
+        mock_glance_image.return_value.pre_process.return_value = "image"
+        admin_clients = self.context["admin"]["credential"].clients
+        glance = admin_clients.return_value.glance.return_value
+        generator_ctx = FakeImageGenerator(self.context)
+        cache_tag = generator_ctx._get_cache_tag("image", "flavor")
+        glance.images.list.return_value = [
+            {"id": "other", "tags": []},
+            {"id": "cached", "tags": ["foo", cache_tag]}]
+
+        custom_image = generator_ctx.create_one_image({"credential": "c"})
+
+        self.assertEqual(mock_image.return_value.get_image.return_value,
+                         custom_image)
+        mock_image.assert_called_once_with(admin_clients.return_value)
+        mock_image.return_value.get_image.assert_called_once_with("cached")
+        glance.images.list.assert_called_once_with(
+            filters={"tag": [cache_tag], "status": "active"})
+        self.assertFalse(mock_boot_runcommand_delete.called)
+
+    @mock.patch("%s.osclients.Clients" % BASE)
+    @mock.patch("%s.image.Image" % BASE)
+    @mock.patch("%s.types.GlanceImage" % BASE)
+    @mock.patch("%s.types.Flavor" % BASE)
+    @mock.patch("%s.vmtasks.BootRuncommandDelete" % BASE)
+    def test_create_one_image_cached_without_admin(
+            self, mock_boot_runcommand_delete, mock_flavor,
+            mock_glance_image, mock_image, mock_clients):
+        self.context.pop("admin")
+        self.context["config"]["test_custom_image"]["cache"] = True
+        mock_flavor.return_value.pre_process.return_value = "flavor"
+        mock_glance_image.return_value.pre_process.return_value = "image"
+        glance = mock_clients.return_value.glance.return_value
+        generator_ctx = FakeImageGenerator(self.context)
+        cache_tag = generator_ctx._get_cache_tag("image", "flavor")
+        glance.images.list.return_value = [
+            {"id": "cached", "tags": [cache_tag]}]
+
+        custom_image = generator_ctx.create_one_image({"credential": "c"})
+
+        self.assertEqual(mock_image.return_value.get_image.return_value,
+                         custom_image)
+        mock_clients.assert_called_with("c")
+        mock_image.assert_called_once_with(mock_clients.return_value)
+        self.assertFalse(mock_boot_runcommand_delete.called)
+
+    @mock.patch("%s.osclients.Clients" % BASE)
+    @mock.patch("%s.types.GlanceImage" % BASE)
+    @mock.patch("%s.types.Flavor" % BASE)
+    @mock.patch("%s.vmtasks.BootRuncommandDelete" % BASE)
+    def test_create_one_image_not_cached(
+            self, mock_boot_runcommand_delete, mock_flavor,
+            mock_glance_image, mock_clients):
+        self.context["config"]["test_custom_image"]["cache"] = True
+        mock_flavor.return_value.pre_process.return_value = "flavor"
+        mock_glance_image.return_value.pre_process.return_value = "image"
+        admin_clients = self.context["admin"]["credential"].clients()
+        admin_clients.keystone.auth_ref.project_id = "admin_project"
+        glance = admin_clients.glance.return_value
+        glance.images.list.return_value = []
+        scenario = mock_boot_runcommand_delete.return_value
+        scenario._boot_server_with_fip.return_value = (
+            mock.Mock(), {"ip": "foo_ip"})
+        scenario._create_image.return_value = mock.Mock(id="new_image")
+        generator_ctx = FakeImageGenerator(self.context)
+        cache_tag = generator_ctx._get_cache_tag("image", "flavor")
+
+        custom_image = generator_ctx.create_one_image(
+            {"credential": "c", "keypair": {"name": "keypair_name"},
+             "secgroup": {"name": "secgroup_name"}})
+
+        self.assertEqual(scenario._create_image.return_value, custom_image)
+        glance.images.update.assert_called_once_with(
+            "new_image", name=cache_tag[:32], owner="admin_project")
+        self.assertEqual(
+            [mock.call("new_image", generator_ctx.CACHE_TAG),
+             mock.call("new_image", cache_tag)],
+            glance.image_tags.update.call_args_list)
+
+    @mock.patch("%s.dt.datetime" % BASE, wraps=custom_image.dt.datetime)
+    def test__evict_cached_images(self, mock_datetime):
+        mock_datetime.now.return_value = custom_image.dt.datetime(
+            2020, 1, 2, 0, 0, 0, tzinfo=custom_image.dt.timezone.utc)
+        self.context["config"]["test_custom_image"]["cache_max_age"] = 3600
+        clients = mock.Mock()
+        glance = clients.glance.return_value
+        glance.images.list.return_value = [
+            {"id": "old", "created_at": "2020-01-01T22:59:59Z"},
+            {"id": "new", "created_at": "2020-01-01T23:30:00Z"}]
+        glance.images.delete.side_effect = Exception("Gone")
+
+        FakeImageGenerator(self.context)._evict_cached_images(clients)
+
+        clients.glance.assert_called_once_with("2")
+        glance.images.list.assert_called_once_with(
+            filters={"tag": [FakeImageGenerator.CACHE_TAG]})
+        glance.images.delete.assert_called_once_with("old")
+
+    def test__get_cache_tag(self):
+        generator_ctx = FakeImageGenerator(self.context)
+        tag = generator_ctx._get_cache_tag("image", "flavor")
+
+        self.assertTrue(tag.startswith(generator_ctx.CACHE_TAG_PREFIX))
+        self.assertEqual(
+            tag, generator_ctx._get_cache_tag("image", "flavor"))
+        self.assertNotEqual(
+            tag, generator_ctx._get_cache_tag("image2", "flavor"))
+        self.assertNotEqual(
+            tag, generator_ctx._get_cache_tag("image", "flavor2"))
+
+        self.context["config"]["test_custom_image"]["workers"] = 10
+        self.context["config"]["test_custom_image"]["cache_max_age"] = 10
+        self.assertEqual(tag, FakeImageGenerator(
+            self.context)._get_cache_tag("image", "flavor"))
+        self.context["config"]["test_custom_image"]["username"] = "foo"
+        self.assertNotEqual(tag, FakeImageGenerator(
+            self.context)._get_cache_tag("image", "flavor"))
+
     @mock.patch("%s.image.Image" % BASE)
     def test_delete_one_image(self, mock_image):
         generator_ctx = FakeImageGenerator(self.context)
@@ -163,6 +290,21 @@ class BaseCustomImageContextVMTestCase(test.TestCase):
         generator_ctx.delete_one_image.assert_called_once_with(
             self.context["users"][0], custom_image)
 
+    def test_cleanup_cached(self):
+        self.context["config"]["test_custom_image"]["cache"] = True
+        for i in range(3):
+            self.context["tenants"]["tenant_id%d" % i]["custom_image"] = {
+                "id": "custom_image"}
+
+        generator_ctx = FakeImageGenerator(self.context)
+        generator_ctx.delete_one_image = mock.Mock()
+
+        generator_ctx.cleanup()
+
+        self.assertFalse(generator_ctx.delete_one_image.called)
+        for tenant in self.context["tenants"].values():
+            self.assertNotIn("custom_image", tenant)
+
     def test_setup(self):
         self.context.pop("admin")
 
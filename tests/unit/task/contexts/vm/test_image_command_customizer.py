@@ -54,6 +54,18 @@ class ImageCommandCustomizerContextVMTestCase(test.TestCase):
         self.user = {"keypair": {"private": "foo_private"}}
         self.fip = {"ip": "foo_ip"}
 
+    def test__get_customization(self):
+        customizer = image_command_customizer.ImageCommandCustomizerContext(
+            self.context)
+        self.assertIsNone(customizer._get_customization())
+
+        with mock.patch("%s.os.path.isfile" % BASE, return_value=True):
+            with mock.patch("%s.open" % BASE,
+                            mock.mock_open(read_data=b"foo"), create=True):
+                self.assertEqual(
+                    "2c26b46b68ffc68ff99b453c1d30413413422d706483bfa0f98a5e8"
+                    "86266e7ae", customizer._get_customization())
+
     @mock.patch("%s.vm_utils.VMScenario" % BASE)
     def test_customize_image(self, mock_vm_scenario):
         mock_vm_scenario.return_value._run_command.return_value = (
@@ -50,6 +50,50 @@ class GlanceBasicTestCase(test.ScenarioTestCase):
         self.addCleanup(patch.stop)
         self.mock_image = patch.start()
 
+    @mock.patch("%s.os.path.getsize" % BASE, return_value=6 * 10 ** 6)
+    @mock.patch("%s.os.path.isfile" % BASE)
+    def test__add_upload_throughput_output(self, mock_isfile, mock_getsize):
+        scenario = images.GlanceBasic(self.context)
+        scenario.add_output = mock.Mock()
+        scenario._atomic_actions = [
+            {"name": "glance_v2.create_image", "started_at": 0,
+             "finished_at": 5,
+             "children": [{"name": "glance_v2.upload_data",
+                           "started_at": 1, "finished_at": 4,
+                           "children": []}]}]
+
+        mock_isfile.return_value = False
+        scenario._add_upload_throughput_output("http://example.com/image")
+        scenario._add_upload_throughput_output({"size": 2 * 10 ** 6})
+        mock_isfile.return_value = True
+        scenario._add_upload_throughput_output("/tmp/image")
+
+        mock_getsize.assert_called_once_with("/tmp/image")
+        self.assertEqual(
+            [mock.call(additive={
+                "title": "Image upload throughput",
+                "description": mock.ANY,
+                "chart_plugin": "Lines",
+                "data": [["MB/s", round(2 / 3, 3)]],
+                "label": "MB/s",
+                "axis_label": "Iteration"}),
+             mock.call(additive={
+                 "title": "Image upload throughput",
+                 "description": mock.ANY,
+                 "chart_plugin": "Lines",
+                 "data": [["MB/s", 2.0]],
+                 "label": "MB/s",
+                 "axis_label": "Iteration"})],
+            scenario.add_output.call_args_list)
+
+    def test__add_upload_throughput_output_without_upload(self):
+        scenario = images.GlanceBasic(self.context)
+        scenario.add_output = mock.Mock()
+
+        scenario._add_upload_throughput_output({"size": 10})
+
+        self.assertFalse(scenario.add_output.called)
+
     def test_create_and_list_image(self):
         image_service = self.mock_image.return_value
         fake_image = mock.Mock(id=1, name="img_2")
@@ -170,11 +214,51 @@ class GlanceBasicTestCase(test.ScenarioTestCase):
                      "min_ram": 0,
                      "properties": properties}
 
-        images.CreateAndDownloadImage(self.context).run(
-            "cf", "url", "df", "vs", 0, 0, properties=properties)
+        image_service.stream_image.return_value = {
+            "bytes": 4 * 10 ** 6, "duration": 2.0, "hash": "fake_hash"}
+        scenario = images.CreateAndDownloadImage(self.context)
+        scenario.add_output = mock.Mock()
+
+        scenario.run("cf", "url", "df", "vs", 0, 0, properties=properties,
+                     hash_algorithm="sha256")
 
         image_service.create_image.assert_called_once_with(**call_args)
-        image_service.download_image.assert_called_once_with(fake_image.id)
+        image_service.stream_image.assert_called_once_with(
+            fake_image.id, sink=None, chunk_size=65536,
+            hash_algorithm="sha256")
+        self.assertEqual(
+            [mock.call(additive={
+                "title": "Image download throughput",
+                "description": mock.ANY,
+                "chart_plugin": "Lines",
+                "data": [["MB/s", 2.0]],
+                "label": "MB/s",
+                "axis_label": "Iteration"}),
+             mock.call(complete={
+                 "title": "Image download",
+                 "description": mock.ANY,
+                 "chart_plugin": "Table",
+                 "data": {"cols": ["key", "value"],
+                          "rows": [["bytes", 4 * 10 ** 6],
+                                   ["seconds", 2.0],
+                                   ["MB/s", 2.0],
+                                   ["sha256", "fake_hash"]]}})],
+            scenario.add_output.call_args_list)
+
+    def test_create_and_download_image_to_sink(self):
+        image_service = self.mock_image.return_value
+        fake_image = fakes.FakeImage(id="image_id")
+        image_service.create_image.return_value = fake_image
+        image_service.stream_image.return_value = {
+            "bytes": 0, "duration": 0, "hash": None}
+        scenario = images.CreateAndDownloadImage(self.context)
+        scenario.add_output = mock.Mock()
+
+        scenario.run("cf", "url", "df", sink="/tmp")
+
+        image_service.stream_image.assert_called_once_with(
+            "image_id", sink="/tmp/image_id", chunk_size=65536,
+            hash_algorithm=None)
 
     @mock.patch("%s.CreateImageAndBootInstances._boot_servers" % BASE)
     def test_create_image_and_boot_instances(self, mock_boot_servers):
@@ -64,3 +64,27 @@ class GnocchiMetricTestCase(test.ScenarioTestCase):
         metric_service.create_metric.assert_called_once_with(
             "name", archive_policy_name="bar", resource_id="123", unit="v")
         self.assertEqual(1, metric_service.delete_metric.call_count)
+
+    def test_batch_push_measures(self):
+        metric_service = self.mock_metric.return_value
+        metric_service.create_metric.side_effect = [{"id": "m1"},
+                                                    {"id": "m2"}]
+        scenario = metric.BatchPushMeasures(self.context)
+        scenario.generate_random_name = mock.MagicMock(return_value="name")
+
+        scenario.run(metrics_count=2, points_per_metric=5, batch_size=2,
+                     interval=10, archive_policy_name="foo",
+                     aggregation="max")
+
+        metric_service.create_metric.assert_has_calls(
+            [mock.call("name", archive_policy_name="foo")] * 2)
+        batches = [c[0][0] for c in
+                   metric_service.batch_metrics_measures.call_args_list]
+        self.assertEqual([2, 2, 1], [len(b["m1"]) for b in batches])
+        self.assertEqual(
+            [b["m1"][i]["timestamp"] for b in batches
+             for i in range(len(b["m1"]))],
+            [b["m2"][i]["timestamp"] for b in batches
+             for i in range(len(b["m2"]))])
+        metric_service.get_measures_aggregation.assert_called_once_with(
+            ["m1", "m2"], aggregation="max", refresh=True)
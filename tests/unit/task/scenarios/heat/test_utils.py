@@ -340,3 +340,119 @@ class HeatScenarioNegativeTestCase(test.ScenarioTestCase):
                                scenario._update_stack, stack,
                                "heat_template_version: 2013-05-23")
         self.assertIn("has UPDATE_FAILED status", str(ex))
+
+
+class HeatScenarioStackEventsTestCase(test.ScenarioTestCase):
+
+    def setUp(self):
+        super(HeatScenarioStackEventsTestCase, self).setUp()
+        CONF.set_override("heat_stack_wait_for_events", True, "openstack")
+        self.addCleanup(CONF.clear_override, "heat_stack_wait_for_events",
+                        "openstack")
+        self.stack = mock.Mock(id="stack_id", stack_name="foo")
+        self.heat = self.clients("heat")
+        self.heat.stacks.get.return_value = self.stack
+        self.heat.stacks.create.return_value = {"stack": {"id": "stack_id"}}
+        self.scenario = utils.HeatScenario(self.context)
+        self.scenario.sleep_between = mock.Mock()
+
+    def _event(self, id, name, status, time, physical_id="res_id"):
+        event = mock.Mock(id=id, resource_name=name, resource_status=status,
+                          event_time=time, resource_status_reason="reason",
+                          physical_resource_id=physical_id)
+        return event
+
+    @mock.patch("%s.time.sleep" % HEAT_UTILS)
+    def test_create_stack(self, mock_sleep):
+        self.heat.events.list.side_effect = [
+            [self._event("e1", "foo", "CREATE_IN_PROGRESS",
+                         "2020-01-01T00:00:00Z", "stack_id"),
+             self._event("e2", "server", "CREATE_IN_PROGRESS",
+                         "2020-01-01T00:00:01Z")],
+            [],
+            [self._event("e3", "server", "CREATE_COMPLETE",
+                         "2020-01-01T00:00:11Z"),
+             self._event("e4", "volume", "CREATE_IN_PROGRESS",
+                         "2020-01-01T00:00:11Z"),
+             self._event("e5", "volume", "CREATE_COMPLETE",
+                         "2020-01-01T00:00:12.5Z"),
+             self._event("e6", "foo", "CREATE_COMPLETE",
+                         "2020-01-01T00:00:13Z", "stack_id")],
+            []]
+
+        self.assertEqual(self.stack,
+                         self.scenario._create_stack("template"))
+
+        self.assertFalse(self.mock_wait_for_status.mock.called)
+        self.heat.events.list.assert_has_calls([
+            mock.call("stack_id", marker=None, sort_dir="asc"),
+            mock.call("stack_id", marker="e2", sort_dir="asc"),
+            mock.call("stack_id", marker="e2", sort_dir="asc"),
+            mock.call("stack_id", marker="e6", sort_dir="asc")])
+        mock_sleep.assert_called_once_with(
+            CONF.openstack.heat_stack_create_poll_interval)
+        self._test_atomic_action_timer(self.scenario.atomic_actions(),
+                                       "heat.create_stack")
+        self.assertEqual([], self.scenario.atomic_actions()[0]["children"])
+        self.assertEqual(
+            {"additive": [],
+             "complete": [{
+                 "title": "Stack create resource timings",
+                 "description": mock.ANY,
+                 "chart_plugin": "Table",
+                 "data": {"cols": ["resource", "started at (s)",
+                                   "duration (s)"],
+                          "rows": [["server", 0, 10],
+                                   ["volume", 10, 1.5]]}}]},
+            self.scenario._output)
+
+    @mock.patch("%s.time.sleep" % HEAT_UTILS)
+    def test_update_stack(self, mock_sleep):
+        self.heat.events.list.side_effect = [
+            [self._event("e0", "foo", "CREATE_COMPLETE",
+                         "2020-01-01T00:00:00Z", "stack_id")],
+            [self._event("e1", "server", "UPDATE_IN_PROGRESS",
+                         "2020-01-01T00:00:01Z"),
+             self._event("e2", "server", "UPDATE_COMPLETE",
+                         "2020-01-01T00:00:03Z"),
+             self._event("e3", "foo", "UPDATE_COMPLETE",
+                         "2020-01-01T00:00:04Z", "stack_id")],
+            []]
+
+        self.assertEqual(self.stack,
+                         self.scenario._update_stack(self.stack, "template"))
+
+        self.heat.events.list.assert_has_calls([
+            mock.call("stack_id", sort_dir="desc", limit=1),
+            mock.call("stack_id", marker="e0", sort_dir="asc"),
+            mock.call("stack_id", marker="e3", sort_dir="asc")])
+        self.assertFalse(mock_sleep.called)
+        self._test_atomic_action_timer(self.scenario.atomic_actions(),
+                                       "heat.update_stack")
+        self.assertEqual([], self.scenario.atomic_actions()[0]["children"])
+        self.assertEqual("Stack update resource timings",
+                         self.scenario._output["complete"][0]["title"])
+        self.assertEqual([["server", 0, 2]],
+                         self.scenario._output["complete"][0]["data"]["rows"])
+
+    @mock.patch("%s.time.sleep" % HEAT_UTILS)
+    def test_create_stack_failed(self, mock_sleep):
+        self.heat.events.list.side_effect = [
+            [self._event("e1", "foo", "CREATE_FAILED",
+                         "2020-01-01T00:00:00Z", "stack_id")],
+            []]
+
+        ex = self.assertRaises(exceptions.GetResourceErrorStatus,
+                               self.scenario._create_stack, "template")
+        self.assertIn("has CREATE_FAILED status", str(ex))
+
+    @mock.patch("%s.time.time" % HEAT_UTILS)
+    @mock.patch("%s.time.sleep" % HEAT_UTILS)
+    def test_create_stack_timeout(self, mock_sleep, mock_time):
+        mock_time.side_effect = range(0, 100000, 1000)
+        self.heat.events.list.return_value = []
+
+        self.assertRaises(exceptions.TimeoutException,
+                          self.scenario._create_stack, "template")
+        mock_sleep.assert_called_with(
+            CONF.openstack.heat_stack_create_poll_interval)
@@ -15,6 +15,8 @@
 
 from unittest import mock
 
+from rally import exceptions
+
 from rally_openstack.task.scenarios.octavia import loadbalancers
 from tests.unit import test
 
@@ -122,3 +124,57 @@ class LoadBalancersTestCase(test.ScenarioTestCase):
             subnet_id="fake_subnet", vip_qos_policy_id=None)
         self.assertEqual(1,
                          loadbalancer_service.load_balancer_show.call_count)
+
+    def test_create_loadbalancer_with_members(self):
+        loadbalancer_service = self.mock_loadbalancers.return_value
+        lb = {"id": "loadbalancer-id"}
+        loadbalancer_service.load_balancer_create.return_value = lb
+        loadbalancer_service.listener_create.return_value = {
+            "listener": {"id": "listener-id"}}
+        loadbalancer_service.pool_create.return_value = {"id": "pool-id"}
+        context = self._get_context()
+        context["tenant"]["subnets"] = [
+            {"id": "fake_subnet6", "cidr": "fd00::/64", "ip_version": 6},
+            {"id": "fake_subnet", "cidr": "10.2.0.0/24", "ip_version": 4}]
+        scenario = loadbalancers.CreateLoadBalancerWithMembers(context)
+        scenario.generate_random_name = mock.Mock(return_value="name")
+
+        scenario.run(members_count=3, member_port=8080)
+
+        loadbalancer_service.load_balancer_create.assert_called_once_with(
+            subnet_id="fake_subnet", project_id="fake_tenant",
+            flavor_id=None, provider=None)
+        loadbalancer_service.listener_create.assert_called_once_with(
+            json={"listener": {"name": "name",
+                               "loadbalancer_id": "loadbalancer-id",
+                               "protocol": "HTTP", "protocol_port": 80}})
+        loadbalancer_service.pool_create.assert_called_once_with(
+            lb_id="loadbalancer-id", protocol="HTTP",
+            lb_algorithm="ROUND_ROBIN", listener_id="listener-id")
+        loadbalancer_service.health_monitor_create.assert_called_once_with(
+            json={"healthmonitor": {"name": "name", "pool_id": "pool-id",
+                                    "type": "HTTP", "delay": 5,
+                                    "timeout": 3, "max_retries": 3}})
+        loadbalancer_service.member_batch_update.assert_called_once_with(
+            "pool-id", members=[
+                {"address": "10.2.0.%s" % i, "protocol_port": 8080,
+                 "subnet_id": "fake_subnet"} for i in (11, 12, 13)])
+        self.assertEqual(
+            5, loadbalancer_service.wait_for_loadbalancer_prov_status
+            .call_count)
+        self.assertEqual(
+            ["octavia.provision_loadbalancer", "octavia.provision_listener",
+             "octavia.provision_pool", "octavia.provision_health_monitor",
+             "octavia.provision_members"],
+            [a["name"] for a in scenario.atomic_actions()])
+
+    def test_create_loadbalancer_with_members_small_subnet(self):
+        context = self._get_context()
+        context["tenant"]["subnets"] = [
+            {"id": "fake_subnet", "cidr": "10.2.0.0/28", "ip_version": 4}]
+        scenario = loadbalancers.CreateLoadBalancerWithMembers(context)
+
+        self.assertRaises(exceptions.RallyException, scenario.run,
+                          members_count=10)
+        self.assertFalse(
+            self.mock_loadbalancers.return_value.load_balancer_create.called)
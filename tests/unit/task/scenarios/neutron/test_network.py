@@ -578,6 +578,50 @@ class NeutronNetworksTestCase(test.TestCase):
 
         self.nc.list_ports.assert_called_once_with()
 
+    def test_bulk_create_networks(self):
+        self.nc.create_network.return_value = {"networks": []}
+        scenario = network.BulkCreateNetworks(self.context)
+
+        scenario.run(batch_size=3, network_create_args={"shared": True})
+
+        self.nc.create_network.assert_called_once_with({
+            "networks": [{"name": mock.ANY, "shared": True}] * 3})
+
+    @mock.patch("rally_openstack.common.services.network.net_utils."
+                "generate_cidr")
+    def test_bulk_create_subnets(self, mock_generate_cidr):
+        mock_generate_cidr.return_value = (4, "10.0.0.0/24")
+        self.nc.create_subnet.return_value = {"subnets": []}
+        net = {"id": "net-id"}
+        scenario = network.BulkCreateSubnets(self.context)
+        scenario._get_or_create_network = mock.Mock(return_value=net)
+
+        scenario.run(batch_size=2, network_create_args={"shared": True},
+                     subnet_create_args={"enable_dhcp": False},
+                     subnet_cidr_start="10.0.0.0/24")
+
+        scenario._get_or_create_network.assert_called_once_with(shared=True)
+        self.nc.create_subnet.assert_called_once_with({
+            "subnets": [{"name": mock.ANY, "network_id": "net-id",
+                         "ip_version": 4, "cidr": "10.0.0.0/24",
+                         "dns_nameservers": mock.ANY,
+                         "enable_dhcp": False}] * 2})
+        mock_generate_cidr.assert_called_with(ip_version=mock.ANY,
+                                              start_cidr="10.0.0.0/24")
+
+    def test_bulk_create_ports(self):
+        self.nc.create_port.return_value = {"ports": []}
+        net = {"id": "net-id"}
+        scenario = network.BulkCreatePorts(self.context)
+        scenario._get_or_create_network = mock.Mock(return_value=net)
+
+        scenario.run(batch_size=4, port_create_args={"device_owner": "x"})
+
+        scenario._get_or_create_network.assert_called_once_with()
+        self.nc.create_port.assert_called_once_with({
+            "ports": [{"name": mock.ANY, "network_id": "net-id",
+                       "device_owner": "x"}] * 4})
+
     def test_create_and_update_ports(self):
         port_update_args = {"admin_state_up": False}
         port_create_args = {"allocation_pools": []}
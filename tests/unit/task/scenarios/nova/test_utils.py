@@ -16,6 +16,7 @@
 from unittest import mock
 
 import ddt
+import fixtures
 from novaclient import exceptions as nova_exc
 
 from rally.common import cfg
@@ -476,10 +477,16 @@ class NovaScenarioTestCase(test.ScenarioTestCase):
     def test__boot_servers(self, image_id="image", flavor_id="flavor",
                            requests=1, instances_amount=1,
                            auto_assign_nic=False, **kwargs):
-        servers = [mock.Mock() for i in range(instances_amount)]
-        self.clients("nova").servers.list.return_value = servers
+        servers = dict(
+            ("r-%d" % r, [mock.Mock(id="id-%d-%d" % (r, i), status="ACTIVE")
+                          for i in range(instances_amount)])
+            for r in range(requests))
+        self.clients("nova").servers.create.side_effect = [
+            "r-%d" % r for r in range(requests)]
+        self.clients("nova").servers.list.side_effect = (
+            lambda search_opts: servers[search_opts["reservation_id"]])
         scenario = utils.NovaScenario(context=self.context)
-        scenario.generate_random_name = mock.Mock()
+        scenario.generate_random_name = mock.Mock(return_value="rally")
         scenario._pick_random_nic = mock.Mock(
             return_value=[{"net-id": "foo"}])
         scenario._get_network_id = mock.Mock(return_value="foo")
@@ -498,25 +505,46 @@ class NovaScenarioTestCase(test.ScenarioTestCase):
                 "%s_%d" % (scenario.generate_random_name.return_value, i),
                 image_id, flavor_id,
                 min_count=instances_amount, max_count=instances_amount,
-                **expected_kwargs)
+                reservation_id=True, **expected_kwargs)
             for i in range(requests)]
         self.clients("nova").servers.create.assert_has_calls(create_calls)
 
-        wait_for_status_calls = [
-            mock.call(
-                servers[i],
-                ready_statuses=["ACTIVE"],
-                update_resource=self.mock_get_from_manager.mock.return_value,
-                check_interval=CONF.openstack.nova_server_boot_poll_interval,
-                timeout=CONF.openstack.nova_server_boot_timeout)
-            for i in range(instances_amount)]
-        self.mock_wait_for_status.mock.assert_has_calls(wait_for_status_calls)
-
-        self.mock_get_from_manager.mock.assert_has_calls(
-            [mock.call() for i in range(instances_amount)])
+        self.clients("nova").servers.list.assert_has_calls([
+            mock.call(search_opts={
+                "reservation_id": "r-%d" % r,
+                "name": "^%s" % scenario.generate_random_name.return_value})
+            for r in range(requests)])
+        self.assertEqual(requests,
+                         self.clients("nova").servers.list.call_count)
+        self.assertFalse(self.mock_wait_for_status.mock.called)
         self._test_atomic_action_timer(scenario.atomic_actions(),
                                        "nova.boot_servers")
 
+    def test__boot_servers_with_reservation_id(self):
+        self.clients("nova").servers.list.return_value = [
+            mock.Mock(id="id", status="ACTIVE")]
+        scenario = utils.NovaScenario(context=self.context)
+        scenario.generate_random_name = mock.Mock(return_value="foo")
+
+        scenario._boot_servers("image", "flavor", 1, reservation_id=False,
+                               key_name="key")
+
+        self.clients("nova").servers.create.assert_called_once_with(
+            "foo_0", "image", "flavor", min_count=1, max_count=1,
+            reservation_id=True, key_name="key")
+
+    def test__boot_servers_returns_servers(self):
+        servers = [mock.Mock(id="id-%d" % i, status="ACTIVE")
+                   for i in range(3)]
+        self.clients("nova").servers.list.return_value = servers
+        scenario = utils.NovaScenario(context=self.context)
+        scenario.generate_random_name = mock.Mock(return_value="foo")
+
+        self.assertEqual(
+            servers + servers,
+            scenario._boot_servers("image", "flavor", 2, instances_amount=3))
+        self.assertEqual(2, self.clients("nova").servers.list.call_count)
+
     def test__show_server(self):
         nova_scenario = utils.NovaScenario(context=self.context)
         nova_scenario._show_server(self.server)
@@ -1380,3 +1408,78 @@ class NovaScenarioTestCase(test.ScenarioTestCase):
             ],
             nc.servers._list.call_args_list
         )
+
+
+@ddt.ddt
+class ServersPollerTestCase(test.TestCase):
+
+    def setUp(self):
+        super(ServersPollerTestCase, self).setUp()
+        self.mock_sleep = self.useFixture(
+            fixtures.MockPatch("time.sleep")).mock
+
+    def test_poll(self):
+        client = mock.Mock()
+        s1 = mock.Mock(id="s1", updated="2020-01-01T00:00:02Z")
+        s2 = mock.Mock(id="s2", updated="2020-01-01T00:00:05Z")
+        s1_new = mock.Mock(id="s1", updated="2020-01-01T00:00:07Z")
+        client.servers.list.side_effect = ([s1, s2], [s1_new], [])
+        poller = utils.ServersPoller(client, "foo.bar",
+                                     search_opts={"all_tenants": True})
+
+        self.assertEqual([s1, s2], poller.poll())
+        self.assertEqual("2020-01-01T00:00:05Z", poller.changes_since)
+        self.assertEqual([s1_new], poller.poll())
+        self.assertEqual([], poller.poll())
+        self.assertEqual({"s1": s1_new, "s2": s2}, poller.servers)
+        self.assertEqual("2020-01-01T00:00:07Z", poller.changes_since)
+
+        self.assertEqual(
+            [mock.call(search_opts={"name": "^foo\\.bar",
+                                    "all_tenants": True}),
+             mock.call(search_opts={"name": "^foo\\.bar",
+                                    "all_tenants": True,
+                                    "changes-since": "2020-01-01T00:00:05Z"}),
+             mock.call(search_opts={"name": "^foo\\.bar",
+                                    "all_tenants": True,
+                                    "changes-since": "2020-01-01T00:00:07Z"})],
+            client.servers.list.call_args_list)
+
+    def test_wait_for_status(self):
+        client = mock.Mock()
+        s1 = mock.Mock(id="s1", status="BUILD", updated="1")
+        s1_ready = mock.Mock(id="s1", status="ACTIVE", updated="2")
+        s2 = mock.Mock(id="s2", status="ACTIVE", updated="1")
+        client.servers.list.side_effect = ([s1], [s2], [s1_ready])
+        poller = utils.ServersPoller(client, "foo")
+
+        self.assertEqual(
+            [s1_ready, s2],
+            poller.wait_for_status(2, ready_statuses=["active"],
+                                   check_interval=3))
+        self.assertEqual(3, client.servers.list.call_count)
+        self.mock_sleep.assert_has_calls([mock.call(3), mock.call(3)])
+
+    def test_wait_for_status_failed(self):
+        client = mock.Mock()
+        client.servers.list.return_value = [
+            mock.Mock(id="s1", status="ACTIVE"),
+            mock.Mock(id="s2", status="ERROR")]
+        poller = utils.ServersPoller(client, "foo")
+
+        self.assertRaises(rally_exceptions.GetResourceErrorStatus,
+                          poller.wait_for_status, 2,
+                          ready_statuses=["ACTIVE"])
+
+    @ddt.data([mock.Mock(id="s1", status="BUILD")],
+              [mock.Mock(id="s1", status="ACTIVE")])
+    @mock.patch("%s.time.time" % NOVA_UTILS)
+    def test_wait_for_status_timeout(self, servers, mock_time):
+        mock_time.side_effect = [1, 2, 100]
+        client = mock.Mock()
+        client.servers.list.return_value = servers
+        poller = utils.ServersPoller(client, "foo")
+
+        self.assertRaises(rally_exceptions.TimeoutException,
+                          poller.wait_for_status, 2,
+                          ready_statuses=["ACTIVE"], timeout=10)
@@ -60,7 +60,7 @@ class SwiftObjectsTestCase(test.ScenarioTestCase):
         scenario._create_container = mock.MagicMock(return_value="CC")
         scenario._upload_object = mock.MagicMock(
             side_effect=[("etaaaag", "obbbj_%i" % i) for i in range(2)])
-        scenario._download_object = mock.MagicMock()
+        scenario._download_object = mock.MagicMock(return_value=({}, 50))
 
         scenario.run(objects_per_container=2, object_size=50)
 
@@ -68,6 +68,8 @@ class SwiftObjectsTestCase(test.ScenarioTestCase):
         self.assertEqual(2, scenario._upload_object.call_count)
         scenario._download_object.assert_has_calls(
             [mock.call("CC", "obbbj_%i" % i) for i in range(2)])
+        self.assertEqual(["Download throughput"],
+                         [o["title"] for o in scenario._output["additive"]])
 
     @ddt.data(1, 5)
     def test_list_objects_in_containers(self, num_cons):
@@ -93,7 +95,7 @@ class SwiftObjectsTestCase(test.ScenarioTestCase):
                                                                  con_list))
         scenario._list_objects = mock.MagicMock(return_value=("header",
                                                               obj_list))
-        scenario._download_object = mock.MagicMock()
+        scenario._download_object = mock.MagicMock(return_value=({}, 10))
 
         scenario.run()
         scenario._list_containers.assert_called_once_with()
@@ -138,9 +140,48 @@ class SwiftObjectsTestCase(test.ScenarioTestCase):
         scenario = objects.CreateContainerAndObjectThenDownloadObject(
             self.context)
         scenario.generate_random_name = mock.MagicMock(side_effect=names_list)
-        scenario._download_object = mock.MagicMock()
+        scenario._download_object = mock.MagicMock(return_value=({}, 750))
 
         scenario.run(objects_per_container=5, object_size=750)
 
         scenario._download_object.assert_has_calls(
             [mock.call("aaa", name) for name in names_list[1:]])
+
+    def test_create_container_and_large_object(self):
+        scenario = objects.CreateContainerAndLargeObject(self.context)
+        scenario._create_container = mock.MagicMock(return_value="DD")
+        scenario._upload_large_object = mock.MagicMock(
+            return_value=("obj", [0.1, 0.2]))
+
+        scenario.run(object_size=20, segment_size=10, workers=2, fakearg="a")
+
+        scenario._create_container.assert_called_once_with(fakearg="a")
+        scenario._upload_large_object.assert_called_once_with(
+            "DD", 20, 10, workers=2)
+        outputs = scenario._output["additive"]
+        self.assertEqual(["Upload throughput", "Upload latency of segments"],
+                         [o["title"] for o in outputs])
+        self.assertEqual([["segment", 0.1], ["segment", 0.2]],
+                         outputs[1]["data"])
+
+    def test_create_container_and_large_object_then_download_object(self):
+        scenario = objects.CreateContainerAndLargeObjectThenDownloadObject(
+            self.context)
+        scenario._create_container = mock.MagicMock(return_value="EE")
+        scenario._upload_large_object = mock.MagicMock(
+            return_value=("obj", [0.1, 0.2]))
+        scenario._download_object_ranges = mock.MagicMock(
+            return_value=[0.3])
+
+        scenario.run(object_size=20, segment_size=10, workers=2,
+                     sink="/tmp")
+
+        scenario._upload_large_object.assert_called_once_with(
+            "EE", 20, 10, workers=2)
+        scenario._download_object_ranges.assert_called_once_with(
+            "EE", "obj", 20, 10, workers=2, sink="/tmp/obj",
+            chunk_size=65536)
+        self.assertEqual(
+            ["Upload throughput", "Upload latency of segments",
+             "Download throughput", "Download latency of segments"],
+            [o["title"] for o in scenario._output["additive"]])
@@ -13,9 +13,11 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import json
 from unittest import mock
 
 import ddt
+from rally import exceptions
 
 from rally_openstack.task.scenarios.swift import utils
 from tests.unit import test
@@ -126,20 +128,29 @@ class SwiftScenarioTestCase(test.ScenarioTestCase):
         container_name = mock.MagicMock()
         object_name = mock.MagicMock()
         headers_dict = mock.MagicMock()
-        content = mock.MagicMock()
-        self.clients("swift").get_object.return_value = (headers_dict, content)
+        self.clients("swift").get_object.return_value = (
+            headers_dict, iter([b"foo", b"bar", b"b"]))
         scenario = utils.SwiftScenario(context=self.context)
 
-        self.assertEqual((headers_dict, content),
+        self.assertEqual((headers_dict, 7),
                          scenario._download_object(container_name, object_name,
-                                                   fargs="f"))
+                                                   chunk_size=3, fargs="f"))
         kw = {"fargs": "f"}
         self.clients("swift").get_object.assert_called_once_with(
-            container_name, object_name,
+            container_name, object_name, resp_chunk_size=3,
             **kw)
 
         self._test_atomic_action_timer(scenario.atomic_actions(),
                                        "swift.download_object")
+        self._test_atomic_action_timer(scenario.atomic_actions(),
+                                       "swift.download_object_first_byte",
+                                       parent=["swift.download_object"])
+
+    def test__download_empty_object(self):
+        self.clients("swift").get_object.return_value = ({}, iter([]))
+        scenario = utils.SwiftScenario(context=self.context)
+
+        self.assertEqual(({}, 0), scenario._download_object("c", "o"))
 
     def test__delete_object(self):
         container_name = mock.MagicMock()
@@ -153,3 +164,102 @@ class SwiftScenarioTestCase(test.ScenarioTestCase):
             **kw)
         self._test_atomic_action_timer(scenario.atomic_actions(),
                                        "swift.delete_object")
+
+    def test__bulk_delete_objects(self):
+        self.clients("swift").post_account.return_value = (
+            {}, json.dumps({"Number Deleted": 1, "Number Not Found": 1,
+                            "Errors": [["/c/o%202", "409 Conflict"]]}))
+        scenario = utils.SwiftScenario(context=self.context)
+
+        self.assertEqual(
+            ["o1", "o3"],
+            scenario._bulk_delete_objects("c", ["o1", "o 2", "o3"]))
+        self.clients("swift").post_account.assert_called_once_with(
+            headers={"Content-Type": "text/plain",
+                     "Accept": "application/json"},
+            query_string="bulk-delete", data=b"/c/o1\n/c/o%202\n/c/o3")
+        self._test_atomic_action_timer(scenario.atomic_actions(),
+                                       "swift.bulk_delete_objects")
+
+    def test__upload_large_object(self):
+        clients = mock.MagicMock()
+        swift = clients.swift.create_client.return_value
+        swift.put_object.side_effect = lambda c, name, *a, **kw: "etag-" + name
+        scenario = utils.SwiftScenario(context=self.context, clients=clients)
+        scenario.generate_random_name = mock.MagicMock(return_value="obj")
+
+        object_name, durations = scenario._upload_large_object(
+            "c", object_size=25, segment_size=10, workers=2)
+
+        self.assertEqual("obj", object_name)
+        self.assertEqual(3, len(durations))
+        self.assertEqual(
+            [mock.call("c", "obj/00000000", b"\0" * 10, content_length=10),
+             mock.call("c", "obj/00000001", b"\0" * 10, content_length=10),
+             mock.call("c", "obj/00000002", b"\0" * 5, content_length=5)],
+            sorted(swift.put_object.call_args_list, key=lambda c: c[0][1]))
+        self.assertTrue(swift.close.called)
+        self.clients("swift").put_object.assert_called_once_with(
+            "c", "obj", mock.ANY, query_string="multipart-manifest=put",
+            headers={"Content-Type": "application/json"})
+        manifest = self.clients("swift").put_object.call_args[0][2]
+        self.assertEqual(
+            [{"path": "/c/obj/00000000", "etag": "etag-obj/00000000",
+              "size_bytes": 10},
+             {"path": "/c/obj/00000001", "etag": "etag-obj/00000001",
+              "size_bytes": 10},
+             {"path": "/c/obj/00000002", "etag": "etag-obj/00000002",
+              "size_bytes": 5}],
+            json.loads(manifest))
+        self._test_atomic_action_timer(scenario.atomic_actions(),
+                                       "swift.upload_segments")
+        self._test_atomic_action_timer(scenario.atomic_actions(),
+                                       "swift.put_slo_manifest")
+
+    def test__upload_large_object_failed(self):
+        clients = mock.MagicMock()
+        swift = clients.swift.create_client.return_value
+        swift.put_object.side_effect = Exception("foo")
+        scenario = utils.SwiftScenario(context=self.context, clients=clients)
+
+        self.assertRaises(exceptions.RallyException,
+                          scenario._upload_large_object, "c",
+                          object_size=20, segment_size=10)
+        self.assertFalse(self.clients("swift").put_object.called)
+
+    @mock.patch("%s.os" % SWIFT_UTILS)
+    def test__download_object_ranges(self, mock_os):
+        clients = mock.MagicMock()
+        swift = clients.swift.create_client.return_value
+
+        def get_object(container, name, headers, resp_chunk_size):
+            start, end = map(int, headers["Range"][6:].split("-"))
+            return {}, iter([b"x"] * (end - start + 1))
+
+        swift.get_object.side_effect = get_object
+        scenario = utils.SwiftScenario(context=self.context, clients=clients)
+
+        durations = scenario._download_object_ranges(
+            "c", "obj", object_size=25, range_size=10, workers=2,
+            sink="/tmp/obj", chunk_size=1)
+
+        self.assertEqual(3, len(durations))
+        self.assertCountEqual(
+            [mock.call("c", "obj", headers={"Range": "bytes=%s" % r},
+                       resp_chunk_size=1)
+             for r in ("0-9", "10-19", "20-24")],
+            swift.get_object.call_args_list)
+        self.assertEqual(25, mock_os.pwrite.call_count)
+        mock_os.close.assert_called_once_with(mock_os.open.return_value)
+        self._test_atomic_action_timer(scenario.atomic_actions(),
+                                       "swift.download_object_ranges")
+
+    def test__download_object_ranges_short_read(self):
+        clients = mock.MagicMock()
+        swift = clients.swift.create_client.return_value
+        swift.get_object.return_value = ({}, iter([b"xx"]))
+        scenario = utils.SwiftScenario(context=self.context, clients=clients)
+
+        self.assertRaises(exceptions.RallyException,
+                          scenario._download_object_ranges, "c", "obj",
+                          object_size=10, range_size=10)
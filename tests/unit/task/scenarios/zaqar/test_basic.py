@@ -12,8 +12,11 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import threading
 from unittest import mock
 
+from rally import exceptions
+
 from rally_openstack.task.scenarios.zaqar import basic
 from tests.unit import test
 
@@ -50,3 +53,85 @@ class ZaqarBasicTestCase(test.ScenarioTestCase):
                                                         20, 20)
         scenario._messages_list.assert_called_once_with(queue)
         scenario._queue_delete.assert_called_once_with(queue)
+
+    def _get_fake_queue(self):
+        posted = []
+        lock = threading.Lock()
+        queue = mock.MagicMock()
+
+        def post(messages):
+            with lock:
+                posted.extend(messages)
+
+        def claim(ttl, grace, limit):
+            with lock:
+                claimed = posted[:limit]
+                del posted[:limit]
+            return [mock.Mock(body=m["body"]) for m in claimed]
+
+        queue.post.side_effect = post
+        queue.claim.side_effect = claim
+        return queue
+
+    @mock.patch("%s.time.sleep" % BASE)
+    def test_producer_consumer_throughput(self, mock_sleep):
+        scenario = basic.ProducerConsumerThroughput(self.context)
+        queue = self._get_fake_queue()
+        scenario._queue_create = mock.MagicMock(return_value=queue)
+        scenario._queue_delete = mock.MagicMock()
+
+        scenario.run(messages_count=25, batch_size=10, message_size=3,
+                     producers=2, consumers=3, fakearg="fake")
+
+        scenario._queue_create.assert_called_once_with(fakearg="fake")
+        self.assertEqual(3, queue.post.call_count)
+        self.assertEqual(
+            [10, 10, 5],
+            sorted([len(c[0][0]) for c in queue.post.call_args_list],
+                   reverse=True))
+        self.assertEqual({"sent_at": mock.ANY, "payload": "xxx"},
+                         queue.post.call_args[0][0][0]["body"])
+        scenario._queue_delete.assert_called_once_with(queue)
+        rates, latency = scenario._output["additive"]
+        self.assertEqual(
+            ["posted messages/s", "consumed messages/s", "claims/s",
+             "deleted messages/s"],
+            [name for name, value in rates["data"]])
+        self.assertEqual(25, len(latency["data"]))
+        actions = scenario.atomic_actions()
+        self.assertEqual(["zaqar.produce_and_consume_messages"],
+                         [a["name"] for a in actions])
+        children = [a["name"] for a in actions[0]["children"]]
+        self.assertEqual(3, children.count("zaqar.post_messages"))
+        self.assertEqual(3, children.count("zaqar.delete_messages"))
+        self.assertEqual(
+            {"zaqar.post_messages", "zaqar.claim_messages",
+             "zaqar.delete_messages"}, set(children))
+        for action in actions[0]["children"]:
+            self.assertEqual([], action["children"])
+
+    @mock.patch("%s.time.sleep" % BASE)
+    def test_producer_consumer_throughput_timeout(self, mock_sleep):
+        scenario = basic.ProducerConsumerThroughput(self.context)
+        queue = mock.MagicMock()
+        queue.claim.return_value = []
+        scenario._queue_create = mock.MagicMock(return_value=queue)
+        scenario._queue_delete = mock.MagicMock()
+
+        self.assertRaises(exceptions.RallyException, scenario.run,
+                          messages_count=5, timeout=0)
+        scenario._queue_delete.assert_called_once_with(queue)
+
+    @mock.patch("%s.time.sleep" % BASE, side_effect=RuntimeError)
+    def test_producer_consumer_throughput_poll_interval(self, mock_sleep):
+        scenario = basic.ProducerConsumerThroughput(self.context)
+        queue = mock.MagicMock()
+        queue.claim.return_value = []
+        scenario._queue_create = mock.MagicMock(return_value=queue)
+        scenario._queue_delete = mock.MagicMock()
+
+        self.assertRaises(exceptions.RallyException, scenario.run,
+                          messages_count=5, producers=1, consumers=1,
+                          poll_interval=2)
+        mock_sleep.assert_called_once_with(2)
+        scenario._queue_delete.assert_called_once_with(queue)
@@ -67,3 +67,36 @@ class ZaqarScenarioTestCase(test.ScenarioTestCase):
         queue.messages.assert_called_once_with()
         self._test_atomic_action_timer(scenario.atomic_actions(),
                                        "zaqar.list_messages")
+
+    def test_messages_post_batch(self):
+        queue = mock.MagicMock()
+        messages = [{"body": {"id": "one"}, "ttl": 100}]
+
+        scenario = utils.ZaqarScenario(context=self.context)
+        scenario._messages_post_batch(queue, messages)
+        queue.post.assert_called_once_with(messages)
+        self._test_atomic_action_timer(scenario.atomic_actions(),
+                                       "zaqar.post_messages")
+
+    def test_messages_claim(self):
+        queue = mock.MagicMock()
+        queue.claim.return_value = iter(["msg1", "msg2"])
+
+        scenario = utils.ZaqarScenario(context=self.context)
+        result = scenario._messages_claim(queue, ttl=60, grace=30, limit=10)
+
+        self.assertEqual(["msg1", "msg2"], result)
+        queue.claim.assert_called_once_with(ttl=60, grace=30, limit=10)
+        self._test_atomic_action_timer(scenario.atomic_actions(),
+                                       "zaqar.claim_messages")
+
+    def test_messages_delete(self):
+        messages = [mock.Mock(), mock.Mock()]
+
+        scenario = utils.ZaqarScenario(context=self.context)
+        scenario._messages_delete(messages)
+
+        for message in messages:
+            message.delete.assert_called_once_with()
+        self._test_atomic_action_timer(scenario.atomic_actions(),
+                                       "zaqar.delete_messages")
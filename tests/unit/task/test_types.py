@@ -258,6 +258,44 @@ class GlanceImageArgsTestCase(test.TestCase):
                 config={}, resource_spec={"is_public": False}))
 
 
+class GlanceImageLocationTestCase(test.TestCase):
+
+    def test_preprocess_generated_data(self):
+        spec = {"size": 1024, "randomize": True, "seed": 42}
+        self.assertEqual(
+            spec,
+            types.GlanceImageLocation({}).pre_process(
+                resource_spec=spec, config={}))
+
+    def test_preprocess_invalid_generated_data(self):
+        self.assertRaises(
+            exceptions.InvalidScenarioArgument,
+            types.GlanceImageLocation({}).pre_process,
+            resource_spec={"size": 0}, config={})
+        self.assertRaises(
+            exceptions.InvalidScenarioArgument,
+            types.GlanceImageLocation({}).pre_process,
+            resource_spec={"size": 1, "foo": "bar"}, config={})
+
+    @mock.patch("rally.plugins.task.types.os.path.isfile",
+                return_value=True)
+    def test_preprocess_path(self, mock_isfile):
+        self.assertEqual(
+            "/tmp/image.img",
+            types.GlanceImageLocation({}).pre_process(
+                resource_spec="/tmp/image.img", config={}))
+        mock_isfile.assert_called_once_with("/tmp/image.img")
+
+    @mock.patch("rally.plugins.task.types.PathOrUrl.pre_process")
+    def test_preprocess_path_or_url(self, mock_path_or_url_pre_process):
+        self.assertEqual(
+            mock_path_or_url_pre_process.return_value,
+            types.GlanceImageLocation({}).pre_process(
+                resource_spec="http://example.com/image.img", config={}))
+        mock_path_or_url_pre_process.assert_called_once_with(
+            resource_spec="http://example.com/image.img", config={})
+
+
 class EC2ImageTestCase(test.TestCase):
 
     def setUp(self):
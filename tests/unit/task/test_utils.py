@@ -0,0 +1,129 @@
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from unittest import mock
+
+from rally import exceptions
+
+from rally_openstack.task import utils
+from tests.unit import test
+
+
+class WaitForStatusesTestCase(test.TestCase):
+
+    def setUp(self):
+        super(WaitForStatusesTestCase, self).setUp()
+        p = mock.patch("rally_openstack.task.utils.time.sleep")
+        self.mock_sleep = p.start()
+        self.addCleanup(p.stop)
+
+    def test_wait_for_statuses(self):
+        r1 = mock.Mock(id="r1", status="creating")
+        r2 = {"id": "r2", "status": "creating"}
+        r1_ready = mock.Mock(id="r1", status="available")
+        r2_ready = {"id": "r2", "status": "AVAILABLE"}
+        list_resources = mock.Mock(side_effect=[
+            [r1, r2, mock.Mock(id="foo", status="error")],
+            [r1_ready, r2],
+            [r2_ready]])
+
+        self.assertEqual(
+            [r1_ready, r2_ready],
+            utils.wait_for_statuses([r1, r2], list_resources,
+                                    ready_statuses=["available"],
+                                    check_interval=2))
+        self.assertEqual(3, list_resources.call_count)
+        self.mock_sleep.assert_has_calls([mock.call(2), mock.call(2)])
+
+    def test_wait_for_statuses_failed(self):
+        r1 = mock.Mock(id="r1", status="creating")
+        list_resources = mock.Mock(
+            return_value=[mock.Mock(id="r1", status="error")])
+
+        self.assertRaises(exceptions.GetResourceErrorStatus,
+                          utils.wait_for_statuses, [r1], list_resources,
+                          ready_statuses=["available"])
+
+    @mock.patch("rally_openstack.task.utils.time.time")
+    def test_wait_for_statuses_timeout(self, mock_time):
+        mock_time.side_effect = [1, 2, 100]
+        r1 = {"id": "r1", "name": "foo", "status": "creating"}
+        list_resources = mock.Mock(return_value=[r1])
+
+        self.assertRaises(exceptions.TimeoutException,
+                          utils.wait_for_statuses, [r1], list_resources,
+                          ready_statuses=["available"], timeout=10)
+        self.assertEqual(2, list_resources.call_count)
+
+
+class RunConcurrentlyTestCase(test.TestCase):
+
+    def test_run_concurrently(self):
+        def func(item):
+            if item == 3:
+                raise ValueError("bad item")
+            return item * 2
+
+        results, failures = utils.run_concurrently(func, range(5), workers=3)
+
+        self.assertEqual([0, 2, 4, None, 8], results)
+        self.assertEqual(1, len(failures))
+        self.assertEqual(3, failures[0][0])
+        self.assertIsInstance(failures[0][1], ValueError)
+        self.assertEqual("3: bad item", utils.format_failures(failures))
+
+    def test_run_concurrently_without_items(self):
+        func = mock.Mock()
+
+        self.assertEqual(([], []), utils.run_concurrently(func, [], 10))
+        self.assertFalse(func.called)
+
+    def test_run_concurrently_with_atomic_actions(self):
+        def func(item, atomic_actions):
+            atomic_actions.append({"name": "action_%s" % item})
+            return item
+
+        atomic_inst = [{"name": "foo"}]
+        results, failures = utils.run_concurrently(
+            func, range(3), workers=3, atomic_inst=atomic_inst)
+
+        self.assertEqual([0, 1, 2], results)
+        self.assertEqual(
+            [{"name": "foo"}, {"name": "action_0"}, {"name": "action_1"},
+             {"name": "action_2"}],
+            atomic_inst)
+
+
+class RaiseSetupFailuresTestCase(test.TestCase):
+
+    def test_raise_setup_failures(self):
+        failures = [(("user", "t1"), ValueError("foo")),
+                    (("user", "t2"), ValueError("bar"))]
+
+        e = self.assertRaises(
+            exceptions.ContextSetupFailure, utils.raise_setup_failures,
+            "ctx", failures, "Failed to create things for %d tenant(s)")
+        self.assertIn(
+            "Failed to create things for 2 tenant(s): t1: foo; t2: bar",
+            str(e))
+
+    def test_raise_setup_failures_with_describe(self):
+        e = self.assertRaises(
+            exceptions.ContextSetupFailure, utils.raise_setup_failures,
+            "ctx", [("item", ValueError("foo"))], "Failed %d",
+            describe=str.upper)
+        self.assertIn("Failed 1: ITEM: foo", str(e))
+
+    def test_raise_setup_failures_without_failures(self):
+        utils.raise_setup_failures("ctx", [], "Failed %d")